@@ -1,50 +1,208 @@
 import requests
+from requests.adapters import BaseAdapter
 import logging
-from typing import Optional, Dict, Any
+import time
+from typing import Optional, Dict, Any, Callable, Iterable, Iterator, Sequence, Union
 import json
 
+from utils.instrumentation import (
+    RequestRecord, TimedHTTPAdapter, template_endpoint,
+    reset_connection_timings, connection_timings,
+)
+from utils.json_stream import CHUNK_SIZE, JsonArrayStream, iter_json_items
+from utils.http_cache import ResponseCache
+from utils.resilience import (
+    NO_RETRY, CircuitBreaker, ExpectedStatus, PolicySet, expected_set,
+)
+
 logger = logging.getLogger(__name__)
 
 
 class PetStoreAPIClient:
     """Клиент для работы с API PetStore"""
 
-    def __init__(self, base_url: str = "https://petstore.swagger.io/v2"):
+    def __init__(self, base_url: str = "https://petstore.swagger.io/v2",
+                 hooks: Optional[Iterable[Callable[[RequestRecord], Any]]] = None,
+                 cache: Optional[ResponseCache] = None,
+                 policies: Optional[PolicySet] = None,
+                 breaker: Optional[CircuitBreaker] = None,
+                 transport: Optional[BaseAdapter] = None):
         self.base_url = base_url
+        self.hooks = list(hooks or [])
+        self.cache = cache
+        self.policies = policies or PolicySet()
+        self.breaker = breaker
+        self.retries = 0
         self.session = requests.Session()
+        # transport - подменяемый адаптер, например запись/воспроизведение кассет
+        self.session.mount("http://", transport or TimedHTTPAdapter())
+        self.session.mount("https://", transport or TimedHTTPAdapter())
         self.session.headers.update({
             "Content-Type": "application/json",
             "Accept": "application/json"
         })
 
-    def make_request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
-        """Выполнить HTTP запрос"""
+    def make_request(self, method: str, endpoint: str, expected_status: ExpectedStatus = None,
+                     **kwargs) -> requests.Response:
+        """Выполнить HTTP запрос.
+
+        Временные ошибки идемпотентных запросов повторяются по политике эндпоинта.
+        Статусы из expected_status возвращаются без исключения и без повторов.
+        """
         url = f"{self.base_url}{endpoint}"
+        expected = expected_set(expected_status)
+        policy = self.policies.for_endpoint(method, template_endpoint(endpoint))
+        if isinstance(kwargs.get("data"), JsonArrayStream):
+            # Потоковое тело нельзя отправить второй раз
+            policy = NO_RETRY
 
         logger.debug(f"Making {method} request to {url}")
 
+        reset_connection_timings()
+        started = time.perf_counter()
+        response = None
+        error = None
+        attempt = 0
         try:
-            response = self.session.request(method=method, url=url, **kwargs)
-            response.raise_for_status()
-            return response
+            while True:
+                if self.breaker is not None:
+                    self.breaker.before_request()
+                response = None
+                try:
+                    response = self.session.request(method=method, url=url, **kwargs)
+                except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                    self._record_outcome(failed=True)
+                    if not policy.should_retry(method, attempt, None):
+                        raise
+                except requests.exceptions.RequestException:
+                    # Оборванное тело и прочие ошибки не повторяются, но считаются отказом:
+                    # иначе неудачный пробный запрос оставит размыкатель в HALF_OPEN
+                    self._record_outcome(failed=True)
+                    raise
+                else:
+                    status = response.status_code
+                    if status in expected:
+                        self._record_outcome(failed=False)
+                        return response
+                    self._record_outcome(failed=status >= 500)
+                    if not policy.should_retry(method, attempt, status):
+                        response.raise_for_status()
+                        return response
+
+                delay = policy.delay(attempt, response)
+                attempt += 1
+                self.retries += 1
+                reason = response.status_code if response is not None else "connection error"
+                logger.warning(f"Retrying {method} {endpoint} after {reason} "
+                               f"in {delay:.2f}s (attempt {attempt}/{policy.retries})")
+                time.sleep(delay)
         except requests.exceptions.RequestException as e:
             logger.error(f"Request failed: {e}")
+            error = e
             raise
+        finally:
+            if self.cache is not None and method != "GET":
+                self.cache.invalidate(endpoint)
+            if self.hooks:
+                self._emit(method, endpoint, kwargs.get("data"), response, error,
+                           time.perf_counter() - started, streamed=kwargs.get("stream", False))
+
+    def _record_outcome(self, failed: bool):
+        if self.breaker is None:
+            return
+        if failed:
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+
+    def add_hook(self, hook: Callable[[RequestRecord], Any]):
+        """Подключить обработчик замеров запросов"""
+        self.hooks.append(hook)
+
+    def _emit(self, method: str, endpoint: str, body, response, error, total: float,
+              streamed: bool = False):
+        timings = connection_timings()
+        record = RequestRecord(
+            method=method,
+            endpoint=template_endpoint(endpoint),
+            status=response.status_code if response is not None else None,
+            bytes_sent=self._body_size(body),
+            bytes_received=self._response_size(response, streamed),
+            dns=timings["dns"],
+            connect=timings["connect"],
+            ttfb=response.elapsed.total_seconds() if response is not None else None,
+            total=total,
+            error=str(error) if error is not None else None,
+        )
+        for hook in self.hooks:
+            try:
+                hook(record)
+            except Exception as e:
+                logger.warning(f"Instrumentation hook failed: {e}")
 
-    def get(self, endpoint: str, params: Optional[Dict] = None) -> requests.Response:
-        """GET запрос"""
-        return self.make_request("GET", endpoint, params=params)
+    @staticmethod
+    def _body_size(body) -> int:
+        if isinstance(body, JsonArrayStream):
+            return body.bytes_sent
+        return len(body.encode("utf-8") if isinstance(body, str) else body or b"")
+
+    @staticmethod
+    def _response_size(response, streamed: bool) -> int:
+        if response is None:
+            return 0
+        # Потоковое тело еще не прочитано - берем размер из заголовка
+        if streamed:
+            return int(response.headers.get("Content-Length") or 0)
+        return len(response.content)
+
+    @staticmethod
+    def _encode(data, chunked: bool):
+        # Генераторы и другие итераторы не сериализуются json.dumps - только потоком
+        if chunked or isinstance(data, Iterator):
+            return JsonArrayStream(data)
+        return json.dumps(data) if data else None
+
+    def get(self, endpoint: str, params: Optional[Dict] = None, stream: bool = False,
+            expected_status: ExpectedStatus = None) -> requests.Response:
+        """GET запрос. stream=True - тело читается по мере разбора (см. iter_json_items)"""
+        if self.cache is None or stream:
+            return self.make_request("GET", endpoint, params=params, stream=stream,
+                                     expected_status=expected_status)
+
+        key = self.cache.key(f"{self.base_url}{endpoint}", params)
+        entry, fresh = self.cache.lookup(key)
+        if fresh:
+            return entry.to_response()
+        validators = entry.validators() if entry is not None else {}
+        response = self.make_request("GET", endpoint, params=params, headers=validators,
+                                     expected_status=expected_status)
+        if entry is not None and response.status_code == 304:
+            self.cache.refresh(entry)
+            return entry.to_response(response.request)
+        self.cache.store(key, endpoint, response)
+        return response
+
+    @staticmethod
+    def iter_json_items(response: requests.Response,
+                        fields: Optional[Sequence[str]] = None) -> Iterator[Any]:
+        """Элементы ответа-массива по одному, с проекцией на fields"""
+        try:
+            yield from iter_json_items(response.iter_content(CHUNK_SIZE), fields)
+        finally:
+            response.close()
 
-    def post(self, endpoint: str, data: Optional[Dict] = None) -> requests.Response:
-        """POST запрос"""
-        json_data = json.dumps(data) if data else None
-        return self.make_request("POST", endpoint, data=json_data)
+    def post(self, endpoint: str, data: Optional[Union[Dict, Iterable]] = None,
+             chunked: bool = False, expected_status: ExpectedStatus = None) -> requests.Response:
+        """POST запрос. chunked=True или итератор в data - тело-массив потоком"""
+        return self.make_request("POST", endpoint, data=self._encode(data, chunked),
+                                 expected_status=expected_status)
 
-    def put(self, endpoint: str, data: Optional[Dict] = None) -> requests.Response:
-        """PUT запрос"""
-        json_data = json.dumps(data) if data else None
-        return self.make_request("PUT", endpoint, data=json_data)
+    def put(self, endpoint: str, data: Optional[Union[Dict, Iterable]] = None,
+            chunked: bool = False, expected_status: ExpectedStatus = None) -> requests.Response:
+        """PUT запрос. chunked=True или итератор в data - тело-массив потоком"""
+        return self.make_request("PUT", endpoint, data=self._encode(data, chunked),
+                                 expected_status=expected_status)
 
-    def delete(self, endpoint: str) -> requests.Response:
+    def delete(self, endpoint: str, expected_status: ExpectedStatus = None) -> requests.Response:
         """DELETE запрос"""
-        return self.make_request("DELETE", endpoint)
\ No newline at end of file
+        return self.make_request("DELETE", endpoint, expected_status=expected_status)
\ No newline at end of file
@@ -0,0 +1,117 @@
+import asyncio
+import json
+import logging
+from typing import Optional, Dict, Any, Iterable, List, Tuple
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncResponse:
+    """Ответ асинхронного клиента (тело уже прочитано)"""
+
+    def __init__(self, status_code: int, headers: Dict[str, str], content: bytes, url: str):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.url = url
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+
+class AsyncPetStoreAPIClient:
+    """Асинхронный клиент для работы с API PetStore с общим пулом соединений"""
+
+    def __init__(self, base_url: str = "https://petstore.swagger.io/v2",
+                 pool_size: int = 100, per_host_limit: int = 20,
+                 timeout: float = 30):
+        self.base_url = base_url
+        self.pool_size = pool_size
+        self.per_host_limit = per_host_limit
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> "AsyncPetStoreAPIClient":
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def open(self):
+        """Открыть сессию и пул соединений"""
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(limit=self.pool_size,
+                                             limit_per_host=self.per_host_limit)
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=self.timeout,
+                headers={
+                    "Content-Type": "application/json",
+                    "Accept": "application/json"
+                }
+            )
+
+    async def close(self):
+        """Закрыть сессию и освободить соединения"""
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+
+    async def make_request(self, method: str, endpoint: str, **kwargs) -> AsyncResponse:
+        """Выполнить HTTP запрос"""
+        await self.open()
+        url = f"{self.base_url}{endpoint}"
+
+        logger.debug(f"Making async {method} request to {url}")
+
+        try:
+            # Лимиты пула и конкурентности на хост задаются в TCPConnector
+            async with self.session.request(method=method, url=url, **kwargs) as resp:
+                content = await resp.read()
+                resp.raise_for_status()
+                return AsyncResponse(resp.status, dict(resp.headers), content, str(resp.url))
+        except aiohttp.ClientError as e:
+            logger.error(f"Request failed: {e}")
+            raise
+
+    async def get(self, endpoint: str, params: Optional[Dict] = None) -> AsyncResponse:
+        """GET запрос"""
+        return await self.make_request("GET", endpoint, params=params)
+
+    async def post(self, endpoint: str, data: Optional[Dict] = None) -> AsyncResponse:
+        """POST запрос"""
+        json_data = json.dumps(data) if data else None
+        return await self.make_request("POST", endpoint, data=json_data)
+
+    async def put(self, endpoint: str, data: Optional[Dict] = None) -> AsyncResponse:
+        """PUT запрос"""
+        json_data = json.dumps(data) if data else None
+        return await self.make_request("PUT", endpoint, data=json_data)
+
+    async def delete(self, endpoint: str) -> AsyncResponse:
+        """DELETE запрос"""
+        return await self.make_request("DELETE", endpoint)
+
+    async def batch(self, calls: Iterable[Tuple], return_exceptions: bool = False) -> List[Any]:
+        """Выполнить пачку запросов конкурентно.
+
+        calls: кортежи вида (method, endpoint) или (method, endpoint, kwargs) -
+        порядок результатов совпадает с порядком запросов.
+        """
+        coros = []
+        for call in calls:
+            method, endpoint, *rest = call
+            kwargs = rest[0] if rest else {}
+            handler = getattr(self, method.lower(), None)
+            if handler is not None and method.upper() in ("GET", "POST", "PUT", "DELETE"):
+                coros.append(handler(endpoint, **kwargs))
+            else:
+                coros.append(self.make_request(method.upper(), endpoint, **kwargs))
+        return await asyncio.gather(*coros, return_exceptions=return_exceptions)
@@ -0,0 +1,67 @@
+import argparse
+import multiprocessing
+import resource
+import sys
+import time
+
+from utils.api_client import PetStoreAPIClient
+from utils.json_stream import backend_name
+from utils.petstore_stub import PetStoreStub
+from data.test_data import TestData
+
+MODES = ("dumps", "chunked")
+
+
+def _max_rss_mb() -> float:
+    # ru_maxrss: килобайты в Linux, байты в macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def _run(mode: str, base_url: str, n: int, result):
+    """Отправить n пользователей в /user/createWithArray в отдельном процессе"""
+    client = PetStoreAPIClient(base_url=base_url)
+    baseline = _max_rss_mb()
+    users = TestData.generate_users(n, seed=1, columnar=True)
+    started = time.perf_counter()
+    if mode == "dumps":
+        response = client.post("/user/createWithArray", data=users.to_list())
+        sent = len(response.request.body)
+    else:
+        response = client.post("/user/createWithArray", data=users, chunked=True)
+        sent = response.request.body.bytes_sent
+    elapsed = time.perf_counter() - started
+    result.put((mode, elapsed, sent, _max_rss_mb() - baseline))
+
+
+def bench(base_url: str, n: int):
+    """Сравнить json.dumps-тело и потоковое тело по скорости и пиковой памяти"""
+    # spawn: у дочернего процесса своя пиковая память, без страниц родителя
+    context = multiprocessing.get_context("spawn")
+    result = context.Queue()
+    print(f"{n} users, backend={backend_name()}")
+    print(f"{'mode':<8} {'time, s':>8} {'MB sent':>8} {'MB/s':>8} {'peak rss +MB':>13}")
+    for mode in MODES:
+        process = context.Process(target=_run, args=(mode, base_url, n, result))
+        process.start()
+        _, elapsed, sent, rss = result.get()
+        process.join()
+        mb = sent / (1024 * 1024)
+        print(f"{mode:<8} {elapsed:>8.2f} {mb:>8.1f} {mb / elapsed:>8.1f} {rss:>13.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк потокового JSON-тела запросов")
+    parser.add_argument("-n", type=int, default=50_000, help="Пользователей в одном запросе")
+    parser.add_argument("--base-url", help="PetStore; по умолчанию локальная заглушка")
+    args = parser.parse_args()
+
+    if args.base_url:
+        bench(args.base_url, args.n)
+        return
+    with PetStoreStub() as stub:
+        bench(stub.base_url, args.n)
+
+
+if __name__ == "__main__":
+    main()
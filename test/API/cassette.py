@@ -0,0 +1,249 @@
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from collections import defaultdict
+from datetime import timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from utils.instrumentation import TimedHTTPAdapter, template_endpoint
+
+logger = logging.getLogger(__name__)
+
+RECORD, REPLAY, PASSTHROUGH = "record", "replay", "passthrough"
+MODES = (RECORD, REPLAY, PASSTHROUGH)
+
+MAGIC = b"PSCASS1\n"
+# Хвост файла: смещение индекса и длина сжатого индекса
+FOOTER = struct.Struct("<QQ8s")
+
+# Поля тела, зависящие от времени запуска: в хэш тела не входят
+VOLATILE_FIELDS = frozenset({"shipDate"})
+
+
+class CassetteMiss(requests.exceptions.RequestException):
+    """В кассете нет ответа на запрос - в режиме replay сеть не используется.
+
+    Не ConnectionError: повтор запроса ответа не найдет, политика его не повторяет.
+    """
+
+
+def _strip_volatile(value):
+    if isinstance(value, dict):
+        return {key: _strip_volatile(item) for key, item in value.items()
+                if key not in VOLATILE_FIELDS}
+    if isinstance(value, list):
+        return [_strip_volatile(item) for item in value]
+    return value
+
+
+def body_hash(body) -> str:
+    """Хэш тела запроса; в JSON не учитываются VOLATILE_FIELDS"""
+    if body is None:
+        return ""
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    try:
+        body = json.dumps(_strip_volatile(json.loads(body)), sort_keys=True).encode("utf-8")
+    except ValueError:
+        pass
+    return hashlib.sha1(body).hexdigest()[:16]
+
+
+class Cassette:
+    """Файл записанных ответов: сжатые zlib записи и индекс в конце файла.
+
+    Индекс - метод, шаблон пути с запросом, хэш тела и точный URL каждой записи.
+    При чтении файл отображается через mmap, тела распаковываются по требованию.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._new: List[Tuple[dict, bytes]] = []
+        self._mmap: Optional[mmap.mmap] = None
+        self._file = None
+        self._by_key: Dict[Tuple, List[dict]] = defaultdict(list)
+        self._by_route: Dict[Tuple, List[dict]] = defaultdict(list)
+        self.hits = 0
+        self.fallbacks = 0
+        self.misses = 0
+
+    # --- чтение ---
+
+    def load(self) -> "Cassette":
+        self._file = open(self.path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        index_offset, index_length, magic = FOOTER.unpack(self._mmap[-FOOTER.size:])
+        if magic != MAGIC or self._mmap[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{self.path} is not a cassette file")
+        index = json.loads(zlib.decompress(self._mmap[index_offset:index_offset + index_length]))
+        for entry in index:
+            entry["used"] = False
+            self._by_key[(entry["method"], entry["route"], entry["body"])].append(entry)
+            self._by_route[(entry["method"], entry["route"])].append(entry)
+        logger.info(f"Cassette {self.path}: {len(index)} recorded responses")
+        return self
+
+    def _take(self, entries: List[dict], url: str) -> Optional[dict]:
+        """Неиспользованная запись с тем же URL, иначе первая неиспользованная по порядку"""
+        unused = [entry for entry in entries if not entry["used"]]
+        if not unused:
+            return None
+        entry = next((entry for entry in unused if entry["url"] == url), unused[0])
+        entry["used"] = True
+        return entry
+
+    def find(self, method: str, route: str, digest: str, url: str,
+             strict: bool = True) -> Optional[dict]:
+        """Ответ на запрос с тем же телом. strict=False - если тело не совпало,
+        следующий ответ того же метода и пути"""
+        with self._lock:
+            entry = self._take(self._by_key.get((method, route, digest), []), url)
+            if entry is not None:
+                self.hits += 1
+                return self._read(entry)
+            entry = None if strict else self._take(self._by_route.get((method, route), []), url)
+            if entry is not None:
+                self.fallbacks += 1
+                return self._read(entry)
+            self.misses += 1
+            return None
+
+    def _read(self, entry: dict) -> dict:
+        raw = zlib.decompress(self._mmap[entry["offset"]:entry["offset"] + entry["length"]])
+        meta, _, content = raw.partition(b"\n")
+        response = json.loads(meta)
+        response["content"] = content
+        return response
+
+    # --- запись ---
+
+    def add(self, method: str, route: str, digest: str, url: str, response: requests.Response,
+            elapsed: float):
+        meta = {
+            "status": response.status_code,
+            "reason": response.reason,
+            "headers": dict(response.headers),
+            "elapsed": round(elapsed, 6),
+        }
+        entry = {"method": method, "route": route, "body": digest, "url": url}
+        blob = json.dumps(meta, ensure_ascii=False).encode("utf-8") + b"\n" + response.content
+        with self._lock:
+            self._new.append((entry, blob))
+
+    def save(self):
+        """Записать кассету атомарно: записи, индекс, хвост"""
+        tmp_path = self.path.with_suffix(".tmp")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        index = []
+        with open(tmp_path, "wb") as out:
+            out.write(MAGIC)
+            for entry, blob in self._new:
+                compressed = zlib.compress(blob, 6)
+                index.append(dict(entry, offset=out.tell(), length=len(compressed)))
+                out.write(compressed)
+            index_blob = zlib.compress(json.dumps(index, ensure_ascii=False).encode("utf-8"), 9)
+            index_offset = out.tell()
+            out.write(index_blob)
+            out.write(FOOTER.pack(index_offset, len(index_blob), MAGIC))
+        os.replace(tmp_path, self.path)
+        logger.info(f"Cassette {self.path}: recorded {len(index)} responses")
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._file.close()
+            self._mmap = self._file = None
+
+    def stats(self) -> str:
+        if self._new:
+            return f"cassette {self.path}: recorded={len(self._new)}"
+        return (f"cassette {self.path}: hits={self.hits} "
+                f"body_mismatch={self.fallbacks} misses={self.misses}")
+
+
+class CassetteAdapter(BaseAdapter):
+    """Транспорт requests: запись, воспроизведение или прямой проход в сеть.
+
+    latency_scale - доля записанного времени ответа, которую ждать при
+    воспроизведении: 0 - мгновенно, 1 - как в записи. strict=False - при
+    несовпадении тела отдавать следующий ответ того же пути вместо ошибки.
+    """
+
+    def __init__(self, cassette: Cassette, mode: str = REPLAY, base_url: str = "",
+                 latency_scale: float = 0.0, strict: bool = True):
+        super().__init__()
+        if mode not in MODES:
+            raise ValueError(f"Unknown cassette mode: {mode}")
+        self.cassette = cassette
+        self.mode = mode
+        self.base_path = urlsplit(base_url).path.rstrip("/")
+        self.latency_scale = latency_scale
+        self.strict = strict
+        self.network = TimedHTTPAdapter()
+
+    def _route(self, url: str) -> str:
+        parts = urlsplit(url)
+        path = parts.path
+        if self.base_path and path.startswith(self.base_path):
+            path = path[len(self.base_path):]
+        query = "&".join(sorted(parts.query.split("&"))) if parts.query else ""
+        return template_endpoint(path) + (f"?{query}" if query else "")
+
+    def send(self, request, **kwargs):
+        if self.mode == PASSTHROUGH:
+            return self.network.send(request, **kwargs)
+
+        if request.body is not None and not isinstance(request.body, (bytes, str)):
+            # Потоковое тело нужно целиком для хэша и для повторной отправки
+            request.body = b"".join(request.body)
+            request.headers.pop("Transfer-Encoding", None)
+            request.headers["Content-Length"] = str(len(request.body))
+        route = self._route(request.url)
+        digest = body_hash(request.body)
+
+        if self.mode == RECORD:
+            started = time.perf_counter()
+            response = self.network.send(request, **kwargs)
+            response.content  # дочитать тело, даже для stream=True
+            self.cassette.add(request.method, route, digest, request.url, response,
+                              time.perf_counter() - started)
+            return response
+
+        recorded = self.cassette.find(request.method, route, digest, request.url, self.strict)
+        if recorded is None:
+            raise CassetteMiss(f"No recorded response for {request.method} {route} "
+                               f"with body {digest or '-'}", request=request)
+        if self.latency_scale:
+            time.sleep(recorded["elapsed"] * self.latency_scale)
+        return self._build_response(request, recorded)
+
+    @staticmethod
+    def _build_response(request, recorded: dict) -> requests.Response:
+        response = requests.Response()
+        response.status_code = recorded["status"]
+        response.reason = recorded["reason"]
+        response.headers = CaseInsensitiveDict(recorded["headers"])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = recorded["content"]
+        response._content_consumed = True
+        response.url = request.url
+        response.request = request
+        response.elapsed = timedelta(seconds=recorded["elapsed"])
+        return response
+
+    def close(self):
+        self.network.close()
@@ -1,7 +1,20 @@
+import asyncio
+import os
+import random
 import pytest
+import pytest_asyncio
 import logging
 from utils.api_client import PetStoreAPIClient
+from utils.http_cache import ResponseCache
+from utils.resilience import CircuitBreaker, PolicySet, RetryPolicy
+from utils.cassette import MODES, PASSTHROUGH, RECORD, REPLAY, Cassette, CassetteAdapter
+from utils.async_api_client import AsyncPetStoreAPIClient
+from utils.petstore_stub import PetStoreStub
+from utils.resource_registry import ResourceRegistry
+from utils.instrumentation import LatencyCollector, export_json, attach_to_allure
 from data.test_data import TestData
+from data.namespace import ResourceNamespace
+from data.id_allocator import IDS
 
 # Настройка логирования
 logging.basicConfig(
@@ -9,11 +22,191 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 
+# Отчеты о пакетной очистке ресурсов, замеры задержек и кэши для итоговой сводки
+TEARDOWN_REPORTS = []
+LATENCY_COLLECTORS = []
+RESPONSE_CACHES = []
+CIRCUIT_BREAKERS = []
+CASSETTES = []
+
+# Адрес по умолчанию для воспроизведения кассеты: сеть не используется
+DEFAULT_PETSTORE_URL = "https://petstore.swagger.io/v2"
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--petstore-url",
+        default=os.getenv("PETSTORE_URL"),
+        help="URL реального PetStore API. По умолчанию тесты идут в локальную заглушку"
+    )
+    parser.addoption(
+        "--latency-json",
+        default=None,
+        help="Сохранить сводку задержек запросов в JSON файл"
+    )
+    parser.addoption(
+        "--http-cache",
+        action="store_true",
+        default=os.getenv("API_HTTP_CACHE") == "1",
+        help="Кэшировать ответы GET в клиенте (TTL, LRU, перепроверка по ETag)"
+    )
+    parser.addoption(
+        "--cassette",
+        default=os.getenv("API_CASSETTE"),
+        help="Файл кассеты для записи или воспроизведения ответов API"
+    )
+    parser.addoption(
+        "--cassette-mode",
+        choices=MODES,
+        default=os.getenv("API_CASSETTE_MODE", REPLAY),
+        help="record - записать ответы сервера, replay - отвечать из кассеты без сети, "
+             "passthrough - ходить в сеть без записи"
+    )
+    parser.addoption(
+        "--cassette-latency",
+        type=float,
+        default=float(os.getenv("API_CASSETTE_LATENCY", "0")),
+        help="Доля записанной задержки при воспроизведении: 0 - мгновенно, 1 - как в записи"
+    )
+    parser.addoption(
+        "--cassette-loose",
+        action="store_true",
+        default=os.getenv("API_CASSETTE_LOOSE") == "1",
+        help="При воспроизведении отдавать ответ того же пути, если тело запроса не совпало "
+             "с записанным. По умолчанию такой запрос падает с CassetteMiss"
+    )
+
+
+def _cassette_mode(config):
+    return config.getoption("--cassette-mode") if config.getoption("--cassette") else None
+
+
+def pytest_configure(config):
+    # Воркеры xdist перезаписали бы кассету друг друга
+    parallel = getattr(config.option, "numprocesses", None) or hasattr(config, "workerinput")
+    if _cassette_mode(config) == RECORD and parallel:
+        raise pytest.UsageError("--cassette-mode=record cannot run under xdist (-n): "
+                                "workers would overwrite each other's cassette")
+
+
+@pytest.fixture(scope="session")
+def petstore_stub():
+    """Локальная заглушка на свободном порту; тесты инфраструктуры клиента ходят только в нее"""
+    with PetStoreStub() as stub:
+        yield stub
+
+
+@pytest.fixture(scope="session")
+def petstore_base_url(request):
+    """Базовый URL API: внешний сервер или локальная заглушка на свободном порту"""
+    url = request.config.getoption("--petstore-url")
+    if url:
+        return url
+    if _cassette_mode(request.config) == REPLAY:
+        return DEFAULT_PETSTORE_URL
+    return request.getfixturevalue("petstore_stub").base_url
+
+
+@pytest.fixture(scope="session")
+def latency_collector(request):
+    """Сбор задержек запросов по эндпоинтам за всю сессию"""
+    collector = LatencyCollector()
+    yield collector
+
+    LATENCY_COLLECTORS.append(collector)
+    path = request.config.getoption("--latency-json")
+    if path:
+        export_json(collector, path)
+    attach_to_allure(collector)
+
+
+@pytest.fixture(scope="session")
+def response_cache(request):
+    """Кэш ответов GET, если включен --http-cache или API_HTTP_CACHE=1"""
+    if not request.config.getoption("--http-cache"):
+        yield None
+        return
+
+    cache = ResponseCache(
+        max_entries=int(os.getenv("API_CACHE_SIZE", "256")),
+        ttl=float(os.getenv("API_CACHE_TTL", "30")),
+    )
+    yield cache
+    RESPONSE_CACHES.append(cache)
+
+
+@pytest.fixture(scope="session")
+def circuit_breaker():
+    """Размыкатель на сессию: лежащий бэкенд валит тесты сразу, а не по таймаутам"""
+    breaker = CircuitBreaker(
+        failure_threshold=int(os.getenv("API_BREAKER_THRESHOLD", "5")),
+        reset_timeout=float(os.getenv("API_BREAKER_RESET", "30")),
+    )
+    yield breaker
+    CIRCUIT_BREAKERS.append(breaker)
+
+
+@pytest.fixture(scope="session")
+def cassette_transport(request, petstore_base_url):
+    """Транспорт записи/воспроизведения, если задан --cassette"""
+    mode = _cassette_mode(request.config)
+    if mode is None:
+        yield None
+        return
+
+    # Запись и воспроизведение должны генерировать одинаковые ID и тела запросов
+    seed = int(os.getenv("TEST_DATA_SEED", "0"))
+    IDS.reseed(seed)
+    random.seed(seed)
+
+    cassette = Cassette(request.config.getoption("--cassette"))
+    if mode == REPLAY:
+        cassette.load()
+    transport = CassetteAdapter(cassette, mode=mode, base_url=petstore_base_url,
+                                latency_scale=request.config.getoption("--cassette-latency"),
+                                strict=not request.config.getoption("--cassette-loose"))
+    yield transport
+
+    if mode == RECORD:
+        cassette.save()
+    cassette.close()
+    if mode != PASSTHROUGH:
+        CASSETTES.append(cassette)
+
 
 @pytest.fixture(scope="session")
-def api_client():
+def api_client(petstore_base_url, latency_collector, response_cache, circuit_breaker,
+               cassette_transport):
     """Фикстура API клиента"""
-    return PetStoreAPIClient()
+    return PetStoreAPIClient(
+        base_url=petstore_base_url,
+        hooks=[latency_collector],
+        cache=response_cache,
+        policies=PolicySet(default=RetryPolicy(retries=int(os.getenv("API_RETRIES", "2")))),
+        breaker=circuit_breaker,
+        transport=cassette_transport,
+    )
+
+
+@pytest_asyncio.fixture
+async def async_api_client(petstore_base_url):
+    """Фикстура асинхронного API клиента"""
+    async with AsyncPetStoreAPIClient(base_url=petstore_base_url) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def run_batch(petstore_base_url):
+    """Фикстура для пакетных запросов из синхронных тестов"""
+
+    def _run(calls, return_exceptions: bool = False):
+        async def _batch():
+            async with AsyncPetStoreAPIClient(base_url=petstore_base_url) as client:
+                return await client.batch(calls, return_exceptions=return_exceptions)
+
+        return asyncio.run(_batch())
+
+    return _run
 
 
 @pytest.fixture(scope="session")
@@ -22,19 +215,56 @@ def test_data():
     return TestData()
 
 
+def _registry(client, scope: str):
+    registry = ResourceRegistry(client, scope=scope)
+    yield registry
+    TEARDOWN_REPORTS.append(registry.flush())
+
+
+@pytest.fixture(scope="session")
+def resource_registry(api_client):
+    """Реестр ресурсов, удаляемых пачкой в конце сессии"""
+    yield from _registry(api_client, "session")
+
+
+@pytest.fixture(scope="module")
+def module_resource_registry(api_client, request):
+    """Реестр ресурсов, удаляемых пачкой после модуля"""
+    yield from _registry(api_client, request.module.__name__)
+
+
 @pytest.fixture
-def cleanup_pet(api_client):
-    """Фикстура для очистки созданных питомцев"""
-    created_pets = []
+def namespace(request, resource_registry):
+    """Уникальные ключи ресурсов теста: параллельные воркеры не делят данные"""
+    return ResourceNamespace(request.node.nodeid, registry=resource_registry)
+
 
-    def _add_pet(pet_id: int):
-        created_pets.append(pet_id)
+@pytest.fixture
+def cleanup_pet(api_client, request):
+    """Фикстура для очистки созданных питомцев: удаляются сразу после теста, даже упавшего"""
+    registry = ResourceRegistry(api_client, scope=request.node.name)
+    yield registry.track_pet
+    TEARDOWN_REPORTS.append(registry.flush())
 
-    yield _add_pet
 
-    # После теста удаляем созданных питомцев
-    for pet_id in created_pets:
-        try:
-            api_client.delete(f"/pet/{pet_id}")
-        except:
-            pass  # Игнорируем ошибки при удалении
\ No newline at end of file
+def pytest_terminal_summary(terminalreporter):
+    for collector in LATENCY_COLLECTORS:
+        terminalreporter.section("API latency by endpoint")
+        for line in collector.format_table().splitlines():
+            terminalreporter.write_line(line)
+    for cache in RESPONSE_CACHES:
+        terminalreporter.section("API response cache")
+        terminalreporter.write_line(cache.stats())
+    for breaker in CIRCUIT_BREAKERS:
+        if breaker.trips or breaker.rejected:
+            terminalreporter.section("API circuit breaker")
+            terminalreporter.write_line(breaker.stats())
+    for cassette in CASSETTES:
+        terminalreporter.section("API cassette")
+        terminalreporter.write_line(cassette.stats())
+    if TEARDOWN_REPORTS:
+        terminalreporter.section("resource teardown")
+        for report in TEARDOWN_REPORTS:
+            terminalreporter.write_line(str(report))
+            for kind, key, error in report.leaked:
+                terminalreporter.write_line(f"  leaked {kind} {key}: {error}")
\ No newline at end of file
@@ -0,0 +1,41 @@
+import argparse
+import time
+
+from data.test_data import TestData
+
+GENERATORS = {
+    "pets": (TestData.generate_pet_data, TestData.generate_pets),
+    "orders": (TestData.generate_order_data, TestData.generate_orders),
+    "users": (TestData.generate_user_data, TestData.generate_users),
+}
+
+
+def _best(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def bench(n: int, repeat: int):
+    """Сравнить поштучную и пакетную генерацию n сущностей"""
+    print(f"{'kind':<8} {'per call, s':>12} {'batch, s':>9} {'columnar, s':>12} {'speedup':>8}")
+    for kind, (single, batch) in GENERATORS.items():
+        per_call = _best(lambda: [single() for _ in range(n)], repeat)
+        rows = _best(lambda: batch(n, seed=1), repeat)
+        columnar = _best(lambda: batch(n, seed=1, columnar=True), repeat)
+        print(f"{kind:<8} {per_call:>12.3f} {rows:>9.3f} {columnar:>12.3f} {per_call / rows:>7.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк генераторов TestData")
+    parser.add_argument("-n", type=int, default=100_000, help="Сущностей на прогон")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    bench(args.n, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Dict, Optional, Tuple
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from utils.instrumentation import template_endpoint
+
+logger = logging.getLogger(__name__)
+
+# Запись в группу ресурсов сбрасывает кэш этих групп: статус питомца меняет /store/inventory
+INVALIDATES = {
+    "pet": ("pet", "store"),
+    "store": ("store",),
+    "user": ("user",),
+}
+
+
+def resource_group(endpoint: str) -> str:
+    """Группа ресурса по первому сегменту пути: /pet/{id} -> pet"""
+    return template_endpoint(endpoint).lstrip("/").split("/", 1)[0]
+
+
+@dataclass
+class CacheEntry:
+    """Закэшированный ответ GET"""
+    url: str
+    group: str
+    status_code: int
+    headers: Dict[str, str]
+    content: bytes
+    stored_at: float
+    # Запрос, которым получен ответ: у ответа из кэша response.request как у сетевого
+    request: Optional[requests.PreparedRequest] = None
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self.headers.get("ETag")
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return self.headers.get("Last-Modified")
+
+    def validators(self) -> Dict[str, str]:
+        """Заголовки условного GET для перепроверки устаревшей записи"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self, request: Optional[requests.PreparedRequest] = None) -> requests.Response:
+        """Ответ из записи; request - запрос перепроверки (304), иначе исходный"""
+        response = requests.Response()
+        response.status_code = self.status_code
+        response.headers = CaseInsensitiveDict(self.headers)
+        response._content = self.content
+        response.url = self.url
+        response.request = request or self.request
+        response.encoding = "utf-8"
+        response.elapsed = timedelta(0)
+        response.from_cache = True
+        return response
+
+
+class ResponseCache:
+    """LRU-кэш ответов GET с TTL и перепроверкой по ETag/Last-Modified"""
+
+    def __init__(self, max_entries: int = 256, ttl: float = 30.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple, CacheEntry]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.revalidated = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def key(url: str, params: Optional[Dict]) -> Tuple:
+        return url, tuple(sorted((params or {}).items()))
+
+    def lookup(self, key: Tuple) -> Tuple[Optional[CacheEntry], bool]:
+        """Запись и признак свежести. Устаревшую запись без валидаторов сразу удаляем"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None, False
+            self._entries.move_to_end(key)
+            if time.monotonic() - entry.stored_at < self.ttl:
+                self.hits += 1
+                return entry, True
+            self.stale += 1
+            if not entry.validators():
+                del self._entries[key]
+                return None, False
+            return entry, False
+
+    def store(self, key: Tuple, endpoint: str, response: requests.Response):
+        """Сохранить успешный ответ, если сервер не запретил кэширование"""
+        if response.status_code != 200 or "no-store" in response.headers.get("Cache-Control", ""):
+            return
+        entry = CacheEntry(
+            url=response.url,
+            group=resource_group(endpoint),
+            status_code=response.status_code,
+            headers=dict(response.headers),
+            content=response.content,
+            stored_at=time.monotonic(),
+            request=response.request,
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def refresh(self, entry: CacheEntry):
+        """Сервер ответил 304 - запись снова свежая"""
+        with self._lock:
+            entry.stored_at = time.monotonic()
+            self.revalidated += 1
+
+    def invalidate(self, endpoint: str):
+        """Сбросить записи, которые могла изменить запись в endpoint"""
+        groups = INVALIDATES.get(resource_group(endpoint), (resource_group(endpoint),))
+        with self._lock:
+            stale_keys = [key for key, entry in self._entries.items() if entry.group in groups]
+            for key in stale_keys:
+                del self._entries[key]
+            self.invalidations += len(stale_keys)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses + self.stale
+        return (self.hits + self.revalidated) / lookups if lookups else 0.0
+
+    def stats(self) -> str:
+        return (f"API cache: hits={self.hits} misses={self.misses} stale={self.stale} "
+                f"revalidated={self.revalidated} evictions={self.evictions} "
+                f"invalidated={self.invalidations} hit_rate={self.hit_rate:.0%}")
@@ -0,0 +1,81 @@
+import itertools
+import os
+import re
+import secrets
+from typing import Dict, Iterator, List, Optional
+
+# Начало диапазона: выше ID, которые раздает сам petstore и старые randint-генераторы
+ID_BASE = 10 ** 10
+
+# Шаг последовательности: у воркера N все ID дают остаток N, диапазоны не пересекаются
+MAX_WORKERS = 1024
+
+# Блок прогона: до RUN_CAPACITY ID каждого вида на воркер. Блоки не пересекаются,
+# а номер блока без seed случайный, поэтому одновременные прогоны (два CI с gw0)
+# на общем сервере не делят ID
+RUN_CAPACITY = 2 ** 20
+BLOCK_SIZE = RUN_CAPACITY * MAX_WORKERS
+# Все ID остаются в int64, как у petstore
+BLOCKS = (2 ** 63 - 1 - ID_BASE) // BLOCK_SIZE
+
+KINDS = ("pet", "order", "user")
+
+
+def worker_index() -> int:
+    """Номер воркера pytest-xdist (gw3 -> 3), без xdist - 0"""
+    match = re.search(r"(\d+)$", os.getenv("PYTEST_XDIST_WORKER", ""))
+    return int(match.group(1)) % MAX_WORKERS if match else 0
+
+
+class IdAllocator:
+    """Уникальные ID и имена пользователей для тестовых данных.
+
+    Каждый вид сущности - своя монотонная последовательность itertools.count
+    с шагом MAX_WORKERS и остатком, равным номеру воркера, поэтому воркеры
+    не пересекаются, а next() атомарен без блокировок. Последовательности
+    лежат в блоке прогона: без seed блок случайный (пересечение двух прогонов -
+    шанс 1 к BLOCKS), с seed - номер блока равен seed и ID воспроизводимы.
+    """
+
+    def __init__(self, worker: Optional[int] = None, seed: Optional[int] = None):
+        self.worker = worker_index() if worker is None else worker
+        self.reseed(seed)
+
+    def reseed(self, seed: Optional[int] = None):
+        """Начать последовательности заново: с seed - воспроизводимо, без - в случайном блоке"""
+        if seed is None:
+            seed = secrets.randbelow(BLOCKS)
+        self.seed = seed
+        start = ID_BASE + (seed % BLOCKS) * BLOCK_SIZE + self.worker
+        self._counters: Dict[str, Iterator[int]] = {
+            kind: itertools.count(start, MAX_WORKERS) for kind in KINDS
+        }
+
+    @classmethod
+    def from_env(cls) -> "IdAllocator":
+        """Аллокатор с seed из TEST_DATA_SEED, если он задан"""
+        seed = os.getenv("TEST_DATA_SEED")
+        return cls(seed=int(seed) if seed else None)
+
+    def next_id(self, kind: str) -> int:
+        return next(self._counters[kind])
+
+    def take(self, kind: str, n: int) -> List[int]:
+        """n следующих ID одного вида"""
+        return list(itertools.islice(self._counters[kind], n))
+
+    def pet_id(self) -> int:
+        return self.next_id("pet")
+
+    def order_id(self) -> int:
+        return self.next_id("order")
+
+    def user_id(self) -> int:
+        return self.next_id("user")
+
+    def username(self, prefix: str = "testuser") -> str:
+        return f"{prefix}_{self.next_id('user')}"
+
+
+# Общий аллокатор процесса (в xdist - свой в каждом воркере)
+IDS = IdAllocator.from_env()
@@ -0,0 +1,271 @@
+import json
+import re
+import socket
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, asdict
+from typing import Optional, Dict, Any, List
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+# Тайминги установки соединения текущего потока (None для keep-alive соединений)
+_connection_timings = threading.local()
+
+# Служебные пути /user/*, которые не являются именами пользователей
+USER_RESERVED_SEGMENTS = {"login", "logout", "createWithArray", "createWithList"}
+_NUMERIC_SEGMENT = re.compile(r"^-?\d+$")
+
+
+def template_endpoint(endpoint: str) -> str:
+    """Заменить идентификаторы в пути на плейсхолдеры: /pet/123 -> /pet/{id}"""
+    path = endpoint.split("?", 1)[0]
+    parts = path.strip("/").split("/")
+    templated = []
+    for index, part in enumerate(parts):
+        if index and _NUMERIC_SEGMENT.match(part):
+            templated.append("{id}")
+        elif parts[0] == "user" and index == 1 and part not in USER_RESERVED_SEGMENTS:
+            templated.append("{username}")
+        else:
+            templated.append(part)
+    return "/" + "/".join(templated)
+
+
+def reset_connection_timings():
+    _connection_timings.dns = None
+    _connection_timings.connect = None
+
+
+def connection_timings() -> Dict[str, Optional[float]]:
+    return {
+        "dns": getattr(_connection_timings, "dns", None),
+        "connect": getattr(_connection_timings, "connect", None),
+    }
+
+
+class _TimedConnectionMixin:
+    """Замер DNS и TCP connect при открытии нового соединения"""
+
+    def _new_conn(self):
+        started = time.perf_counter()
+        try:
+            address = socket.getaddrinfo(self._dns_host, self.port, 0, socket.SOCK_STREAM)[0][4][0]
+        except socket.gaierror:
+            address = None
+        resolved = time.perf_counter()
+
+        original_host = self._dns_host
+        try:
+            if address is not None:
+                self._dns_host = address
+            sock = super()._new_conn()
+        except Exception:
+            if address is None:
+                raise
+            # Первый адрес недоступен - даем urllib3 перебрать все адреса сам
+            self._dns_host = original_host
+            sock = super()._new_conn()
+        finally:
+            self._dns_host = original_host
+
+        _connection_timings.dns = resolved - started
+        _connection_timings.connect = time.perf_counter() - resolved
+        return sock
+
+
+class TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter, соединения которого сообщают тайминги DNS и connect"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": TimedHTTPConnectionPool,
+            "https": TimedHTTPSConnectionPool,
+        }
+
+
+@dataclass
+class RequestRecord:
+    """Замер одного HTTP запроса. Времена в секундах"""
+
+    method: str
+    endpoint: str
+    status: Optional[int]
+    bytes_sent: int
+    bytes_received: int
+    dns: Optional[float]
+    connect: Optional[float]
+    ttfb: Optional[float]
+    total: float
+    error: Optional[str] = None
+
+
+class LatencyHistogram:
+    """Гистограмма в стиле HDR: логарифмические корзины с линейным делением внутри.
+
+    Значения хранятся в микросекундах. Мантисса корзины - sub_bucket_bits + 1
+    бит, то есть 2**sub_bucket_bits корзин на октаву, и относительная ошибка
+    не больше 1 / 2**sub_bucket_bits.
+    """
+
+    def __init__(self, sub_bucket_bits: int = 5):
+        self.sub_bucket_bits = sub_bucket_bits
+        self.counts: Dict[tuple, int] = defaultdict(int)
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def _bucket(self, value: int) -> tuple:
+        shift = max(0, value.bit_length() - self.sub_bucket_bits - 1)
+        return shift, value >> shift
+
+    @staticmethod
+    def _bucket_upper(bucket: tuple) -> int:
+        shift, mantissa = bucket
+        return ((mantissa + 1) << shift) - 1
+
+    def record(self, seconds: float):
+        value = max(0, int(seconds * 1_000_000))
+        self.counts[self._bucket(value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other: "LatencyHistogram"):
+        for bucket, count in other.counts.items():
+            self.counts[bucket] += count
+        self.count += other.count
+        self.total += other.total
+        for value in (other.min, other.max):
+            if value is not None:
+                self.min = value if self.min is None else min(self.min, value)
+                self.max = value if self.max is None else max(self.max, value)
+
+    def percentile(self, pct: float) -> float:
+        """Значение перцентиля в секундах"""
+        if not self.count:
+            return 0.0
+        threshold = pct / 100 * self.count
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen >= threshold:
+                return min(self._bucket_upper(bucket), self.max) / 1_000_000
+        return self.max / 1_000_000
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count / 1_000_000 if self.count else 0.0
+
+
+class LatencyCollector:
+    """Хук клиента: агрегирует замеры по методу и шаблону эндпоинта"""
+
+    PHASES = ("dns", "connect", "ttfb", "total")
+
+    def __init__(self, keep_records: bool = False):
+        self._lock = threading.Lock()
+        self.keep_records = keep_records
+        self.records: List[RequestRecord] = []
+        self.histograms: Dict[str, Dict[str, LatencyHistogram]] = {}
+        self.statuses: Dict[str, Dict[int, int]] = defaultdict(lambda: defaultdict(int))
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.bytes: Dict[str, List[int]] = defaultdict(lambda: [0, 0])
+
+    def __call__(self, record: RequestRecord):
+        key = f"{record.method} {record.endpoint}"
+        with self._lock:
+            if self.keep_records:
+                self.records.append(record)
+            phases = self.histograms.setdefault(
+                key, {phase: LatencyHistogram() for phase in self.PHASES})
+            for phase in self.PHASES:
+                value = getattr(record, phase)
+                if value is not None:
+                    phases[phase].record(value)
+            if record.status is not None:
+                self.statuses[key][record.status] += 1
+            if record.error is not None:
+                self.errors[key] += 1
+            self.bytes[key][0] += record.bytes_sent
+            self.bytes[key][1] += record.bytes_received
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        result = {}
+        with self._lock:
+            for key, phases in self.histograms.items():
+                total = phases["total"]
+                result[key] = {
+                    "count": total.count,
+                    "errors": self.errors.get(key, 0),
+                    "statuses": dict(self.statuses.get(key, {})),
+                    "bytes_sent": self.bytes[key][0],
+                    "bytes_received": self.bytes[key][1],
+                    "sum_ms": total.total / 1000,
+                    "mean_ms": total.mean * 1000,
+                    "p50_ms": total.percentile(50) * 1000,
+                    "p95_ms": total.percentile(95) * 1000,
+                    "p99_ms": total.percentile(99) * 1000,
+                    "max_ms": (total.max or 0) / 1000,
+                    "ttfb_p50_ms": phases["ttfb"].percentile(50) * 1000,
+                    "connect_mean_ms": phases["connect"].mean * 1000,
+                    "dns_mean_ms": phases["dns"].mean * 1000,
+                    "new_connections": phases["connect"].count,
+                }
+        return result
+
+    def format_table(self) -> str:
+        """Таблица задержек по эндпоинтам, отсортированная по суммарному времени"""
+        rows = sorted(self.summary().items(), key=lambda item: item[1]["sum_ms"], reverse=True)
+        lines = [f"{'endpoint':<34}{'count':>7}{'err':>5}{'sum s':>9}{'p50':>8}"
+                 f"{'p95':>8}{'p99':>8}{'max':>8}{'ttfb50':>8}{'conn':>6}"]
+        for key, row in rows:
+            lines.append(
+                f"{key:<34}{row['count']:>7}{row['errors']:>5}{row['sum_ms'] / 1000:>9.2f}"
+                f"{row['p50_ms']:>8.1f}{row['p95_ms']:>8.1f}{row['p99_ms']:>8.1f}"
+                f"{row['max_ms']:>8.1f}{row['ttfb_p50_ms']:>8.1f}{row['new_connections']:>6}"
+            )
+        return "\n".join(lines)
+
+    def to_json(self) -> str:
+        payload = {"endpoints": self.summary()}
+        if self.keep_records:
+            payload["records"] = [asdict(record) for record in self.records]
+        return json.dumps(payload, indent=2, ensure_ascii=False)
+
+
+def export_json(collector: LatencyCollector, path: str):
+    """Сохранить сводку задержек в JSON файл"""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(collector.to_json())
+
+
+def attach_to_allure(collector: LatencyCollector, name: str = "API latency"):
+    """Приложить сводку задержек к отчету Allure"""
+    import allure
+
+    allure.attach(collector.format_table(), name=f"{name} (table)",
+                  attachment_type=allure.attachment_type.TEXT)
+    allure.attach(collector.to_json(), name=f"{name} (json)",
+                  attachment_type=allure.attachment_type.JSON)
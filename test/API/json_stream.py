@@ -0,0 +1,140 @@
+import codecs
+import json
+from typing import Any, Iterable, Iterator, Optional, Sequence
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Размер куска тела: меньше - лишние chunk-заголовки и системные вызовы, больше - память
+CHUNK_SIZE = 64 * 1024
+
+_encoder = json.JSONEncoder()
+_decoder = json.JSONDecoder()
+
+_WHITESPACE = " \t\n\r"
+# После элемента массива: иначе число могло оборваться на границе куска ("1" из "1.5e3")
+_ITEM_END = _WHITESPACE + ",]"
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """JSON в байтах: orjson, если установлен, иначе стандартный json"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return _encoder.encode(obj).encode("utf-8")
+
+
+def backend_name() -> str:
+    return "orjson" if orjson is not None else "json"
+
+
+class JsonArrayStream:
+    """Тело запроса - JSON-массив, который кодируется по мере отправки.
+
+    requests отправляет такой объект с Transfer-Encoding: chunked, не собирая
+    весь массив в памяти. Записи можно отдавать генератором. bytes_sent
+    считается по мере отправки и попадает в замеры клиента.
+    """
+
+    def __init__(self, records: Iterable[Any], chunk_size: int = CHUNK_SIZE):
+        self.records = records
+        self.chunk_size = chunk_size
+        self.bytes_sent = 0
+
+    def __iter__(self) -> Iterator[bytes]:
+        buffer = bytearray(b"[")
+        separator = b""
+        for record in self.records:
+            buffer += separator
+            buffer += dumps_bytes(record)
+            separator = b","
+            if len(buffer) >= self.chunk_size:
+                yield self._flush(buffer)
+                buffer = bytearray()
+        buffer += b"]"
+        yield self._flush(buffer)
+
+    def _flush(self, buffer: bytearray) -> bytes:
+        chunk = bytes(buffer)
+        self.bytes_sent += len(chunk)
+        return chunk
+
+
+def _project(item: Any, fields: Optional[Sequence[str]]) -> Any:
+    if fields is None or not isinstance(item, dict):
+        return item
+    return {name: item[name] for name in fields if name in item}
+
+
+def iter_json_items(chunks: Iterable[bytes], fields: Optional[Sequence[str]] = None) -> Iterator[Any]:
+    """Элементы JSON-массива по мере чтения тела, без разбора всего ответа целиком.
+
+    В памяти держится только недочитанный хвост буфера и текущий элемент.
+    fields - оставить в элементах-объектах только эти ключи, чтобы большие
+    ответы не удерживали ненужные поля.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    chunks = iter(chunks)
+    buffer = ""
+    pos = 0
+    exhausted = False
+    started = False
+
+    def _more() -> bool:
+        nonlocal buffer, pos, exhausted
+        if exhausted:
+            return False
+        chunk = next(chunks, None)
+        if chunk is None:
+            exhausted = True
+            text = decoder.decode(b"", final=True)
+        else:
+            text = decoder.decode(chunk)
+        buffer = buffer[pos:] + text
+        pos = 0
+        return True
+
+    def _skip_whitespace() -> bool:
+        """Сдвинуть pos на следующий значимый символ; False - данных больше нет"""
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            if pos < len(buffer):
+                return True
+            if not _more():
+                return False
+
+    if not _skip_whitespace() or buffer[pos] != "[":
+        raise ValueError("Expected a JSON array")
+    pos += 1
+
+    while True:
+        if not _skip_whitespace():
+            raise ValueError("Unterminated JSON array")
+        if buffer[pos] == "]":
+            pos += 1
+            if _skip_whitespace():
+                raise ValueError(f"Extra data after JSON array: {buffer[pos]!r}")
+            return
+        if started:
+            if buffer[pos] != ",":
+                raise ValueError(f"Expected ',' or ']' in JSON array, got {buffer[pos]!r}")
+            pos += 1
+            if not _skip_whitespace():
+                raise ValueError("Unterminated JSON array")
+        while True:
+            try:
+                item, end = _decoder.raw_decode(buffer, pos)
+            except ValueError:
+                if _more():
+                    continue
+                raise
+            # Число на границе куска может быть обрезано - дочитываем до разделителя
+            if (end == len(buffer) or buffer[end] not in _ITEM_END) and _more():
+                continue
+            break
+        pos = end
+        started = True
+        yield _project(item, fields)
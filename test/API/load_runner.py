@@ -0,0 +1,303 @@
+import argparse
+import logging
+import math
+import random
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Any
+
+import requests
+
+from utils.api_client import PetStoreAPIClient
+from utils.resilience import NO_RETRY, PolicySet
+from data.test_data import TestData
+from data.id_allocator import IDS
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Step:
+    """Шаг сценария: метка эндпоинта и функция (client, context) -> Response"""
+
+    endpoint: str
+    action: Callable[[PetStoreAPIClient, Dict[str, Any]], Any]
+
+
+@dataclass
+class Scenario:
+    """Сценарий нагрузки - последовательность шагов с общим контекстом"""
+
+    name: str
+    steps: List[Step]
+    setup: Callable[[], Dict[str, Any]] = dict
+    weight: float = 1.0
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Перцентиль методом ближайшего ранга по отсортированному списку"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+@dataclass
+class LoadReport:
+    """Результаты прогона: задержки по эндпоинтам, ошибки и пропускная способность"""
+
+    duration: float = 0.0
+    iterations: int = 0
+    failed_iterations: int = 0
+    latencies: Dict[str, List[float]] = field(default_factory=lambda: defaultdict(list))
+    errors: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+
+    @property
+    def total_requests(self) -> int:
+        return sum(len(values) for values in self.latencies.values()) + sum(self.errors.values())
+
+    @property
+    def throughput(self) -> float:
+        return self.total_requests / self.duration if self.duration else 0.0
+
+    def endpoint_stats(self) -> Dict[str, Dict[str, float]]:
+        stats = {}
+        for endpoint in sorted(set(self.latencies) | set(self.errors)):
+            values = sorted(self.latencies.get(endpoint, []))
+            stats[endpoint] = {
+                "count": len(values),
+                "errors": self.errors.get(endpoint, 0),
+                "rps": len(values) / self.duration if self.duration else 0.0,
+                "p50": percentile(values, 50) * 1000,
+                "p95": percentile(values, 95) * 1000,
+                "p99": percentile(values, 99) * 1000,
+            }
+        return stats
+
+    def format_table(self) -> str:
+        lines = [
+            f"duration={self.duration:.2f}s iterations={self.iterations} "
+            f"failed={self.failed_iterations} requests={self.total_requests} "
+            f"throughput={self.throughput:.1f} req/s",
+            f"{'endpoint':<32}{'count':>8}{'errors':>8}{'rps':>9}"
+            f"{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}",
+        ]
+        for endpoint, row in self.endpoint_stats().items():
+            lines.append(
+                f"{endpoint:<32}{row['count']:>8}{row['errors']:>8}{row['rps']:>9.1f}"
+                f"{row['p50']:>10.1f}{row['p95']:>10.1f}{row['p99']:>10.1f}"
+            )
+        return "\n".join(lines)
+
+
+class LoadRunner:
+    """Генератор нагрузки на PetStoreAPIClient по сценариям"""
+
+    def __init__(self, base_url: str, scenarios: List[Scenario], seed: Optional[int] = None):
+        self.base_url = base_url
+        self.scenarios = scenarios
+        self._random = random.Random(seed)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.report = LoadReport()
+        # Исключения итераций вне RequestException - ошибки сценария, а не нагрузки
+        self._crashes: List[BaseException] = []
+
+    def _client(self) -> PetStoreAPIClient:
+        # У каждого потока своя сессия requests
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = self._local.client = PetStoreAPIClient(
+                base_url=self.base_url, policies=PolicySet(default=NO_RETRY))
+        return client
+
+    def _pick_scenario(self) -> Scenario:
+        with self._lock:
+            return self._random.choices(self.scenarios,
+                                        weights=[s.weight for s in self.scenarios])[0]
+
+    def run_iteration(self, scenario: Scenario, scheduled: Optional[float] = None):
+        """Выполнить один проход сценария и записать задержки шагов.
+
+        scheduled - плановое время старта в открытой модели: задержка первого
+        шага считается от него и включает ожидание свободного потока
+        (иначе очередь не видна в перцентилях - coordinated omission).
+        """
+        client = self._client()
+        context = scenario.setup()
+        failed = False
+        for index, step in enumerate(scenario.steps):
+            started = scheduled if index == 0 and scheduled is not None else time.perf_counter()
+            try:
+                step.action(client, context)
+            except requests.exceptions.RequestException as e:
+                logger.debug(f"{scenario.name}: {step.endpoint} failed: {e}")
+                with self._lock:
+                    self.report.errors[step.endpoint] += 1
+                failed = True
+                break
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self.report.latencies[step.endpoint].append(elapsed)
+        with self._lock:
+            self.report.iterations += 1
+            if failed:
+                self.report.failed_iterations += 1
+
+    def _collect(self, future):
+        error = future.exception()
+        if error is not None:
+            with self._lock:
+                self._crashes.append(error)
+
+    def _raise_crashes(self):
+        crashes, self._crashes = self._crashes, []
+        if crashes:
+            logger.error(f"{len(crashes)} load iterations crashed, first: {crashes[0]!r}")
+            raise crashes[0]
+
+    def run_open(self, rate: float, duration: float, max_workers: int = 64) -> LoadReport:
+        """Открытая модель: новые итерации стартуют с частотой rate в секунду"""
+        self.report = LoadReport()
+        self._crashes = []
+        interval = 1.0 / rate
+        started = time.perf_counter()
+        deadline = started + duration
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            next_arrival = started
+            while next_arrival < deadline:
+                delay = next_arrival - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                future = pool.submit(self.run_iteration, self._pick_scenario(), next_arrival)
+                future.add_done_callback(self._collect)
+                next_arrival += interval
+        self.report.duration = time.perf_counter() - started
+        self._raise_crashes()
+        return self.report
+
+    def run_closed(self, users: int, duration: Optional[float] = None,
+                   iterations: Optional[int] = None) -> LoadReport:
+        """Закрытая модель: users виртуальных пользователей выполняют сценарии подряд"""
+        if duration is None and iterations is None:
+            raise ValueError("Either duration or iterations must be set")
+        self.report = LoadReport()
+        self._crashes = []
+        started = time.perf_counter()
+        deadline = started + duration if duration is not None else None
+
+        def _user():
+            done = 0
+            while ((deadline is None or time.perf_counter() < deadline)
+                   and (iterations is None or done < iterations)):
+                self.run_iteration(self._pick_scenario())
+                done += 1
+
+        with ThreadPoolExecutor(max_workers=users, thread_name_prefix="vu") as pool:
+            for _ in range(users):
+                pool.submit(_user).add_done_callback(self._collect)
+        self.report.duration = time.perf_counter() - started
+        self._raise_crashes()
+        return self.report
+
+
+def pet_lifecycle() -> Scenario:
+    """Создать питомца -> получить -> обновить -> удалить"""
+
+    def _update(client, ctx):
+        ctx["pet"]["status"] = "sold"
+        return client.put("/pet", data=ctx["pet"])
+
+    return Scenario(
+        name="pet_lifecycle",
+        setup=lambda: {"pet": TestData.generate_pet_data()},
+        steps=[
+            Step("POST /pet", lambda client, ctx: client.post("/pet", data=ctx["pet"])),
+            Step("GET /pet/{id}", lambda client, ctx: client.get(f"/pet/{ctx['pet']['id']}")),
+            Step("PUT /pet", _update),
+            Step("DELETE /pet/{id}", lambda client, ctx: client.delete(f"/pet/{ctx['pet']['id']}")),
+        ],
+    )
+
+
+def order_lifecycle() -> Scenario:
+    """Создать заказ -> получить -> проверить инвентарь -> удалить"""
+    return Scenario(
+        name="order_lifecycle",
+        setup=lambda: {"order": TestData.generate_order_data()},
+        steps=[
+            Step("POST /store/order",
+                 lambda client, ctx: client.post("/store/order", data=ctx["order"])),
+            Step("GET /store/order/{id}",
+                 lambda client, ctx: client.get(f"/store/order/{ctx['order']['id']}")),
+            Step("GET /store/inventory", lambda client, ctx: client.get("/store/inventory")),
+            Step("DELETE /store/order/{id}",
+                 lambda client, ctx: client.delete(f"/store/order/{ctx['order']['id']}")),
+        ],
+    )
+
+
+def user_login() -> Scenario:
+    """Создать пользователя -> войти -> выйти -> удалить"""
+
+    def _login(client, ctx):
+        user = ctx["user"]
+        return client.get("/user/login",
+                          params={"username": user["username"], "password": user["password"]})
+
+    return Scenario(
+        name="user_login",
+        setup=lambda: {"user": TestData.generate_user_data(username=IDS.username("loaduser"))},
+        steps=[
+            Step("POST /user", lambda client, ctx: client.post("/user", data=ctx["user"])),
+            Step("GET /user/login", _login),
+            Step("GET /user/logout", lambda client, ctx: client.get("/user/logout")),
+            Step("DELETE /user/{username}",
+                 lambda client, ctx: client.delete(f"/user/{ctx['user']['username']}")),
+        ],
+    )
+
+
+SCENARIOS = {
+    "pet_lifecycle": pet_lifecycle,
+    "order_lifecycle": order_lifecycle,
+    "user_login": user_login,
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Нагрузочный прогон PetStore API")
+    parser.add_argument("--base-url", help="URL API; без него поднимается локальная заглушка")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="Сценарий (можно несколько), по умолчанию все")
+    parser.add_argument("--rate", type=float, help="Частота итераций в секунду (открытая модель)")
+    parser.add_argument("--users", type=int, help="Число виртуальных пользователей (закрытая модель)")
+    parser.add_argument("--duration", type=float, default=10.0, help="Длительность, сек")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+
+    scenarios = [SCENARIOS[name]() for name in (args.scenario or sorted(SCENARIOS))]
+
+    def _run(base_url):
+        runner = LoadRunner(base_url, scenarios, seed=args.seed)
+        if args.users:
+            return runner.run_closed(users=args.users, duration=args.duration)
+        return runner.run_open(rate=args.rate or 10.0, duration=args.duration)
+
+    if args.base_url:
+        report = _run(args.base_url)
+    else:
+        from utils.petstore_stub import PetStoreStub
+        with PetStoreStub() as stub:
+            report = _run(stub.base_url)
+
+    print(report.format_table())
+    return 0 if report.failed_iterations == 0 else 1
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    raise SystemExit(main())
@@ -0,0 +1,61 @@
+import hashlib
+import os
+from typing import Any, Dict
+
+from data.id_allocator import IDS, IdAllocator
+from data.test_data import TestData
+
+
+def worker_tag() -> str:
+    """Метка воркера xdist для ключей ресурсов: gw3, без xdist - main"""
+    return os.getenv("PYTEST_XDIST_WORKER", "main")
+
+
+class ResourceNamespace:
+    """Собственные ключи ресурсов для одного теста на одном воркере.
+
+    Имена пользователей содержат воркер и короткий хэш теста, ID берутся из
+    аллокатора с непересекающимися диапазонами воркеров. Созданные через
+    пространство ресурсы регистрируются в реестре для удаления.
+    """
+
+    def __init__(self, test_id: str, registry=None, ids: IdAllocator = IDS):
+        self.test_id = test_id
+        self.registry = registry
+        self.ids = ids
+        digest = hashlib.sha1(test_id.encode("utf-8")).hexdigest()[:6]
+        self.tag = f"{worker_tag()}_{digest}"
+
+    def username(self, label: str = "user") -> str:
+        return f"{label}_{self.tag}_{self.ids.user_id()}"
+
+    def pet_id(self) -> int:
+        return self.ids.pet_id()
+
+    def order_id(self) -> int:
+        return self.ids.order_id()
+
+    def pet(self, **overrides) -> Dict[str, Any]:
+        """Данные питомца с уникальным ID, зарегистрированного для очистки"""
+        pet = dict(TestData.generate_pet_data(pet_id=self.pet_id()), **overrides)
+        self._track("pet", pet["id"])
+        return pet
+
+    def order(self, **overrides) -> Dict[str, Any]:
+        """Данные заказа с уникальным ID, зарегистрированного для очистки"""
+        order = dict(TestData.generate_order_data(order_id=self.order_id()), **overrides)
+        self._track("order", order["id"])
+        return order
+
+    def user(self, label: str = "user", **overrides) -> Dict[str, Any]:
+        """Данные пользователя с уникальным именем, зарегистрированного для очистки"""
+        user = dict(TestData.generate_user_data(username=self.username(label)), **overrides)
+        self._track("user", user["username"])
+        return user
+
+    def _track(self, kind: str, key: Any):
+        if self.registry is not None:
+            self.registry.track(kind, key)
+
+    def __repr__(self) -> str:
+        return f"ResourceNamespace({self.test_id!r}, tag={self.tag!r})"
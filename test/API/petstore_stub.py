@@ -0,0 +1,379 @@
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Dict, Any, Set, Tuple
+from urllib.parse import urlsplit, parse_qs
+
+logger = logging.getLogger(__name__)
+
+API_PREFIX = "/v2"
+
+
+class StubError(Exception):
+    """Ошибка, которую заглушка возвращает клиенту как HTTP ответ"""
+
+    def __init__(self, status: int, message: str = "", code: Optional[int] = None,
+                 error_type: str = "error"):
+        super().__init__(message)
+        self.status = status
+        self.body = None if not message else {
+            "code": code if code is not None else status,
+            "type": error_type,
+            "message": message
+        }
+
+
+class PetStoreStorage:
+    """In-memory хранилище PetStore с индексами по статусу и имени пользователя"""
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.pets: Dict[int, Dict[str, Any]] = {}
+        self.pets_by_status: Dict[str, Set[int]] = defaultdict(set)
+        self.orders: Dict[int, Dict[str, Any]] = {}
+        self.users: Dict[str, Dict[str, Any]] = {}
+        self._next_id = int(time.time() * 1000)
+
+    def next_id(self) -> int:
+        with self.lock:
+            self._next_id += 1
+            return self._next_id
+
+    def save_pet(self, pet: Dict[str, Any]) -> Dict[str, Any]:
+        with self.lock:
+            self.delete_pet(pet["id"])
+            self.pets[pet["id"]] = pet
+            self.pets_by_status[pet.get("status")].add(pet["id"])
+            return pet
+
+    def delete_pet(self, pet_id: int) -> Optional[Dict[str, Any]]:
+        with self.lock:
+            pet = self.pets.pop(pet_id, None)
+            if pet is not None:
+                self.pets_by_status[pet.get("status")].discard(pet_id)
+            return pet
+
+    def find_pets_by_status(self, statuses) -> list:
+        with self.lock:
+            return [self.pets[pet_id]
+                    for status in statuses
+                    for pet_id in self.pets_by_status.get(status, ())]
+
+    def inventory(self) -> Dict[str, int]:
+        with self.lock:
+            return {status: len(ids) for status, ids in self.pets_by_status.items()
+                    if status is not None and ids}
+
+    def clear(self):
+        with self.lock:
+            self.pets.clear()
+            self.pets_by_status.clear()
+            self.orders.clear()
+            self.users.clear()
+
+
+def _parse_id(raw: str) -> int:
+    try:
+        return int(raw)
+    except ValueError:
+        raise StubError(400, f"Invalid ID supplied: {raw}", code=400, error_type="unknown")
+
+
+def _require_int(value) -> int:
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise StubError(500, "something bad happened", error_type="unknown")
+    return value
+
+
+class PetStoreStub:
+    """Локальная заглушка PetStore API, работающая в отдельном потоке"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self.storage = PetStoreStorage()
+        self.routes = [
+            ("POST", r"/pet", self.add_pet),
+            ("PUT", r"/pet", self.update_pet),
+            ("GET", r"/pet/findByStatus", self.find_pets_by_status),
+            ("GET", r"/pet/(?P<pet_id>[^/]+)", self.get_pet),
+            ("POST", r"/pet/(?P<pet_id>[^/]+)", self.update_pet_with_form),
+            ("DELETE", r"/pet/(?P<pet_id>[^/]+)", self.delete_pet),
+            ("GET", r"/store/inventory", self.get_inventory),
+            ("POST", r"/store/order", self.place_order),
+            ("GET", r"/store/order/(?P<order_id>[^/]+)", self.get_order),
+            ("DELETE", r"/store/order/(?P<order_id>[^/]+)", self.delete_order),
+            ("POST", r"/user", self.create_user),
+            ("POST", r"/user/createWithArray", self.create_users),
+            ("POST", r"/user/createWithList", self.create_users),
+            ("GET", r"/user/login", self.login),
+            ("GET", r"/user/logout", self.logout),
+            ("GET", r"/user/(?P<username>[^/]+)", self.get_user),
+            ("PUT", r"/user/(?P<username>[^/]+)", self.update_user),
+            ("DELETE", r"/user/(?P<username>[^/]+)", self.delete_user),
+        ]
+        self._compiled = [(method, re.compile(pattern + "$"), handler)
+                          for method, pattern, handler in self.routes]
+        self.server = ThreadingHTTPServer((host, port), self._make_handler())
+        self.server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}{API_PREFIX}"
+
+    def start(self) -> "PetStoreStub":
+        """Запустить сервер в фоновом потоке"""
+        self._thread = threading.Thread(target=self.server.serve_forever,
+                                        name="petstore-stub", daemon=True)
+        self._thread.start()
+        logger.info(f"PetStore stub started at {self.base_url}")
+        return self
+
+    def stop(self):
+        """Остановить сервер"""
+        self.server.shutdown()
+        self.server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "PetStoreStub":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def dispatch(self, method: str, path: str, query: Dict, body: Any) -> Tuple[int, Any, Dict]:
+        """Найти обработчик по методу и пути и выполнить его"""
+        if not path.startswith(API_PREFIX):
+            raise StubError(404, "Not Found", code=404, error_type="unknown")
+        path = path[len(API_PREFIX):].rstrip("/") or "/"
+
+        path_matched = False
+        for route_method, pattern, handler in self._compiled:
+            match = pattern.match(path)
+            if match is None:
+                continue
+            path_matched = True
+            if route_method == method:
+                return handler(query=query, body=body, **match.groupdict())
+        if path_matched:
+            raise StubError(405, "Method Not Allowed", code=405, error_type="unknown")
+        raise StubError(404, "Not Found", code=404, error_type="unknown")
+
+    def _entity_id(self, entity: Dict[str, Any]) -> int:
+        # id=0 - допустимый id, новый выдается только при его отсутствии
+        if entity.get("id") is None:
+            return self.storage.next_id()
+        return _require_int(entity["id"])
+
+    # --- /pet ---
+
+    def add_pet(self, body, **_):
+        if not isinstance(body, dict):
+            raise StubError(405, "Invalid input", code=405, error_type="unknown")
+        pet = dict(body)
+        pet["id"] = self._entity_id(pet)
+        if "name" in pet and not isinstance(pet["name"], str):
+            raise StubError(500, "something bad happened", error_type="unknown")
+        pet.setdefault("photoUrls", [])
+        pet.setdefault("tags", [])
+        return 200, self.storage.save_pet(pet), {}
+
+    def update_pet(self, body, **kwargs):
+        return self.add_pet(body, **kwargs)
+
+    def find_pets_by_status(self, query, **_):
+        statuses = []
+        for value in query.get("status", []):
+            statuses.extend(value.split(","))
+        return 200, self.storage.find_pets_by_status(statuses), {}
+
+    def get_pet(self, pet_id, **_):
+        pet = self.storage.pets.get(_parse_id(pet_id))
+        if pet is None:
+            raise StubError(404, "Pet not found", code=1)
+        return 200, pet, {}
+
+    def update_pet_with_form(self, pet_id, body, **_):
+        pet_id = _parse_id(pet_id)
+        with self.storage.lock:
+            pet = self.storage.pets.get(pet_id)
+            if pet is None:
+                raise StubError(404, "not found", code=404, error_type="unknown")
+            pet = dict(pet)
+            for field in ("name", "status"):
+                if isinstance(body, dict) and field in body:
+                    pet[field] = body[field]
+            self.storage.save_pet(pet)
+        return 200, {"code": 200, "type": "unknown", "message": str(pet_id)}, {}
+
+    def delete_pet(self, pet_id, **_):
+        pet_id = _parse_id(pet_id)
+        if self.storage.delete_pet(pet_id) is None:
+            raise StubError(404)
+        return 200, {"code": 200, "type": "unknown", "message": str(pet_id)}, {}
+
+    # --- /store ---
+
+    def get_inventory(self, **_):
+        return 200, self.storage.inventory(), {}
+
+    def place_order(self, body, **_):
+        if not isinstance(body, dict):
+            raise StubError(400, "Invalid Order", code=400, error_type="unknown")
+        order = dict(body)
+        order["id"] = self._entity_id(order)
+        with self.storage.lock:
+            self.storage.orders[order["id"]] = order
+        return 200, order, {}
+
+    def get_order(self, order_id, **_):
+        order = self.storage.orders.get(_parse_id(order_id))
+        if order is None:
+            raise StubError(404, "Order not found", code=1)
+        return 200, order, {}
+
+    def delete_order(self, order_id, **_):
+        order_id = _parse_id(order_id)
+        with self.storage.lock:
+            if self.storage.orders.pop(order_id, None) is None:
+                raise StubError(404, "Order Not Found", code=404, error_type="unknown")
+        return 200, {"code": 200, "type": "unknown", "message": str(order_id)}, {}
+
+    # --- /user ---
+
+    def _save_user(self, user) -> Dict[str, Any]:
+        if not isinstance(user, dict) or not isinstance(user.get("username"), str):
+            raise StubError(500, "something bad happened", error_type="unknown")
+        user = dict(user)
+        user["id"] = self._entity_id(user)
+        with self.storage.lock:
+            self.storage.users[user["username"]] = user
+        return user
+
+    def create_user(self, body, **_):
+        user = self._save_user(body)
+        return 200, {"code": 200, "type": "unknown", "message": str(user["id"])}, {}
+
+    def create_users(self, body, **_):
+        if not isinstance(body, list):
+            raise StubError(500, "something bad happened", error_type="unknown")
+        for user in body:
+            self._save_user(user)
+        return 200, {"code": 200, "type": "unknown", "message": "ok"}, {}
+
+    def login(self, query, **_):
+        expires = datetime.now(timezone.utc) + timedelta(hours=1)
+        headers = {
+            "X-Rate-Limit": "5000",
+            "X-Expires-After": expires.strftime("%a %b %d %H:%M:%S UTC %Y"),
+        }
+        message = f"logged in user session:{int(time.time() * 1000)}"
+        return 200, {"code": 200, "type": "unknown", "message": message}, headers
+
+    def logout(self, **_):
+        return 200, {"code": 200, "type": "unknown", "message": "ok"}, {}
+
+    def get_user(self, username, **_):
+        user = self.storage.users.get(username)
+        if user is None:
+            raise StubError(404, "User not found", code=1)
+        return 200, user, {}
+
+    def update_user(self, username, body, **_):
+        if not isinstance(body, dict):
+            raise StubError(400, "Invalid user supplied", code=400, error_type="unknown")
+        user = dict(body)
+        user.setdefault("username", username)
+        with self.storage.lock:
+            if user["username"] != username:
+                self.storage.users.pop(username, None)
+            user = self._save_user(user)
+        return 200, {"code": 200, "type": "unknown", "message": str(user["id"])}, {}
+
+    def delete_user(self, username, **_):
+        with self.storage.lock:
+            if self.storage.users.pop(username, None) is None:
+                raise StubError(404)
+        return 200, {"code": 200, "type": "unknown", "message": username}, {}
+
+    def _make_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Заголовки и тело пишутся раздельно - без TCP_NODELAY ответы ждут delayed ACK
+            disable_nagle_algorithm = True
+
+            def _read_chunked(self) -> bytes:
+                parts = []
+                while True:
+                    size = int(self.rfile.readline().split(b";")[0].strip() or b"0", 16)
+                    if size == 0:
+                        # Трейлеры до пустой строки
+                        while self.rfile.readline() not in (b"\r\n", b"\n", b""):
+                            pass
+                        return b"".join(parts)
+                    parts.append(self.rfile.read(size))
+                    self.rfile.readline()
+
+            def _read_body(self):
+                if "chunked" in self.headers.get("Transfer-Encoding", "").lower():
+                    raw = self._read_chunked()
+                else:
+                    length = int(self.headers.get("Content-Length") or 0)
+                    raw = self.rfile.read(length) if length else b""
+                if not raw:
+                    return None
+                content_type = self.headers.get("Content-Type", "")
+                if content_type.startswith("application/x-www-form-urlencoded"):
+                    return {key: values[-1] for key, values in parse_qs(raw.decode()).items()}
+                try:
+                    return json.loads(raw)
+                except ValueError:
+                    raise StubError(400, "bad input", code=400, error_type="unknown")
+
+            def _send(self, status: int, payload: Any, headers: Dict[str, str]):
+                body = b"" if payload is None else json.dumps(payload).encode("utf-8")
+                if self.command == "GET" and status == 200:
+                    # Валидатор для условных GET, как у обычного HTTP сервера
+                    etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+                    headers = dict(headers, ETag=etag)
+                    if self.headers.get("If-None-Match") == etag:
+                        status, body = 304, b""
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                if body and self.command != "HEAD":
+                    self.wfile.write(body)
+
+            def _handle(self):
+                parts = urlsplit(self.path)
+                try:
+                    body = self._read_body()
+                    status, payload, headers = stub.dispatch(
+                        self.command, parts.path, parse_qs(parts.query), body)
+                except StubError as e:
+                    status, payload, headers = e.status, e.body, {}
+                except Exception:
+                    # Ошибка самой заглушки: клиент получает 500, а не оборванное соединение
+                    logger.exception(f"stub: unhandled error in {self.command} {parts.path}")
+                    status, payload, headers = 500, {"code": 500, "type": "unknown",
+                                                     "message": "something bad happened"}, {}
+                self._send(status, payload, headers)
+
+            do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+            def log_message(self, format, *args):
+                logger.debug("stub: " + format % args)
+
+        return Handler
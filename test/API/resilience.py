@@ -0,0 +1,150 @@
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Dict, FrozenSet, Iterable, Optional, Union
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+TRANSIENT_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Ожидаемые статусы: один код или набор кодов, которые не считаются ошибкой
+ExpectedStatus = Optional[Union[int, Iterable[int]]]
+
+
+def expected_set(expected_status: ExpectedStatus) -> FrozenSet[int]:
+    if expected_status is None:
+        return frozenset()
+    if isinstance(expected_status, int):
+        return frozenset({expected_status})
+    return frozenset(expected_status)
+
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """Бэкенд признан недоступным - запрос не отправлялся"""
+
+
+@dataclass
+class RetryPolicy:
+    """Повторы временных ошибок с экспоненциальной задержкой и полным джиттером.
+
+    Повторяются только идемпотентные методы. Retry-After и X-Rate-Limit-Reset
+    сервера важнее расчетной задержки, но не дольше max_retry_after.
+    """
+
+    retries: int = 2
+    backoff: float = 0.2
+    max_backoff: float = 2.0
+    max_retry_after: float = 10.0
+    statuses: FrozenSet[int] = TRANSIENT_STATUSES
+    methods: FrozenSet[str] = IDEMPOTENT_METHODS
+
+    def should_retry(self, method: str, attempt: int, status: Optional[int]) -> bool:
+        """status=None - ошибка соединения или таймаут"""
+        if attempt >= self.retries or method not in self.methods:
+            return False
+        return status is None or status in self.statuses
+
+    def delay(self, attempt: int, response: Optional[requests.Response] = None,
+              rng: random.Random = random) -> float:
+        server_delay = self._server_delay(response)
+        if server_delay is not None:
+            return min(server_delay, self.max_retry_after)
+        return rng.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+    @staticmethod
+    def _server_delay(response: Optional[requests.Response]) -> Optional[float]:
+        if response is None:
+            return None
+        value = response.headers.get("Retry-After") or response.headers.get("X-Rate-Limit-Reset")
+        if not value:
+            return None
+        try:
+            seconds = float(value)
+        except ValueError:
+            pass
+        else:
+            # X-Rate-Limit-Reset часто - момент сброса в epoch-секундах, а не задержка
+            if seconds > time.time() / 2:
+                seconds -= time.time()
+            return max(0.0, seconds)
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+
+NO_RETRY = RetryPolicy(retries=0)
+
+
+@dataclass
+class PolicySet:
+    """Политика повторов по умолчанию и переопределения для эндпоинтов.
+
+    Ключ переопределения - шаблон эндпоинта с методом ("DELETE /pet/{id}")
+    или без него ("/store/inventory").
+    """
+
+    default: RetryPolicy = field(default_factory=RetryPolicy)
+    overrides: Dict[str, RetryPolicy] = field(default_factory=dict)
+
+    def for_endpoint(self, method: str, endpoint: str) -> RetryPolicy:
+        return (self.overrides.get(f"{method} {endpoint}")
+                or self.overrides.get(endpoint)
+                or self.default)
+
+
+class CircuitBreaker:
+    """Размыкатель: после failure_threshold ошибок подряд запросы падают сразу.
+
+    Через reset_timeout пропускается один пробный запрос: успех замыкает цепь,
+    ошибка снова размыкает ее.
+    """
+
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half-open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.rejected = 0
+        self.trips = 0
+
+    def before_request(self):
+        with self._lock:
+            if self.state == self.CLOSED:
+                return
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                return
+            self.rejected += 1
+            raise CircuitOpenError(
+                f"Circuit open after {self.failures} consecutive failures, "
+                f"retry in {self.reset_timeout - (time.monotonic() - self.opened_at):.1f}s")
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    self.trips += 1
+                    logger.warning(f"Circuit opened after {self.failures} consecutive failures")
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+    def stats(self) -> str:
+        return (f"circuit breaker: state={self.state} trips={self.trips} "
+                f"rejected={self.rejected}")
@@ -0,0 +1,119 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, List, Tuple, Iterable
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TeardownReport:
+    """Итоги пакетной очистки ресурсов"""
+
+    scope: str
+    duration: float = 0.0
+    deleted: int = 0
+    already_gone: int = 0
+    retries: int = 0
+    leaked: List[Tuple[str, Any, str]] = field(default_factory=list)
+
+    def __str__(self) -> str:
+        return (f"[{self.scope}] teardown {self.duration:.2f}s: deleted={self.deleted}, "
+                f"already_gone={self.already_gone}, retries={self.retries}, "
+                f"leaked={len(self.leaked)}")
+
+
+class ResourceRegistry:
+    """Реестр созданных в тестах ресурсов с пакетным созданием и удалением"""
+
+    CREATE_ENDPOINTS = {"pet": "/pet", "order": "/store/order", "user": "/user"}
+    DELETE_ENDPOINTS = {"pet": "/pet/{}", "order": "/store/order/{}", "user": "/user/{}"}
+    KEY_FIELDS = {"pet": "id", "order": "id", "user": "username"}
+
+    def __init__(self, client, scope: str = "session", workers: int = 8):
+        self.client = client
+        self.scope = scope
+        self.workers = workers
+        self._lock = threading.Lock()
+        self._resources: Dict[Tuple[str, Any], None] = {}
+
+    def track(self, kind: str, key: Any):
+        """Зарегистрировать ресурс для удаления"""
+        if kind not in self.DELETE_ENDPOINTS:
+            raise ValueError(f"Unknown resource kind: {kind}")
+        with self._lock:
+            self._resources[(kind, key)] = None
+
+    def track_pet(self, pet_id: int):
+        self.track("pet", pet_id)
+
+    def track_order(self, order_id: int):
+        self.track("order", order_id)
+
+    def track_user(self, username: str):
+        self.track("user", username)
+
+    def __len__(self) -> int:
+        return len(self._resources)
+
+    def seed(self, kind: str, payloads: Iterable[Dict[str, Any]]) -> List[requests.Response]:
+        """Создать ресурсы пачкой в пуле потоков и зарегистрировать их"""
+        endpoint = self.CREATE_ENDPOINTS[kind]
+        key_field = self.KEY_FIELDS[kind]
+
+        def _create(payload):
+            response = self.client.post(endpoint, data=payload)
+            self.track(kind, payload[key_field])
+            return response
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            return list(pool.map(_create, payloads))
+
+    def _delete(self, kind: str, key: Any, report: TeardownReport) -> Optional[str]:
+        """Удалить ресурс; временные ошибки повторяет политика клиента.
+
+        Возвращает ошибку при утечке.
+        """
+        endpoint = self.DELETE_ENDPOINTS[kind].format(key)
+        try:
+            response = self.client.delete(endpoint, expected_status=404)
+        except requests.exceptions.RequestException as e:
+            return str(e)
+        with self._lock:
+            if response.status_code == 404:
+                report.already_gone += 1
+            else:
+                report.deleted += 1
+        return None
+
+    def flush(self) -> TeardownReport:
+        """Удалить все зарегистрированные ресурсы конкурентно"""
+        with self._lock:
+            resources = list(self._resources)
+            self._resources.clear()
+
+        report = TeardownReport(scope=self.scope)
+        started = time.perf_counter()
+        retries_before = getattr(self.client, "retries", 0)
+
+        def _worker(resource):
+            kind, key = resource
+            error = self._delete(kind, key, report)
+            if error is not None:
+                with self._lock:
+                    report.leaked.append((kind, key, error))
+
+        if resources:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                list(pool.map(_worker, resources))
+
+        report.duration = time.perf_counter() - started
+        report.retries = getattr(self.client, "retries", 0) - retries_before
+        logger.info(str(report))
+        for kind, key, error in report.leaked:
+            logger.warning(f"Leaked {kind} {key}: {error}")
+        return report
@@ -0,0 +1,68 @@
+import asyncio
+import threading
+import time
+import pytest
+import aiohttp
+import logging
+from utils.async_api_client import AsyncPetStoreAPIClient
+
+logger = logging.getLogger(__name__)
+
+
+class TestAsyncClient:
+    """Тесты асинхронного клиента и пакетных запросов"""
+
+    def test_run_batch(self, request, run_batch, namespace):
+        """Пачка запросов через фикстуру run_batch: результаты в порядке запросов"""
+        if request.config.getoption("--cassette"):
+            pytest.skip("aiohttp client is not routed through the cassette transport")
+        logger.info("Test: Batch requests")
+
+        pets = [namespace.pet() for _ in range(5)]
+        created = run_batch([("POST", "/pet", {"data": pet}) for pet in pets])
+        fetched = run_batch([("GET", f"/pet/{pet['id']}") for pet in pets])
+
+        assert [response.status_code for response in created] == [200] * 5
+        assert [response.json()["id"] for response in fetched] == [pet["id"] for pet in pets]
+        assert [response.json()["name"] for response in fetched] == [pet["name"] for pet in pets]
+
+    def test_batch_return_exceptions(self, petstore_stub):
+        """Ошибка одного запроса не отменяет остальные при return_exceptions=True"""
+        async def _batch():
+            async with AsyncPetStoreAPIClient(base_url=petstore_stub.base_url) as client:
+                return await client.batch([("GET", "/store/inventory"), ("GET", "/pet/-1")],
+                                          return_exceptions=True)
+
+        inventory, missing = asyncio.run(_batch())
+        assert inventory.status_code == 200
+        assert isinstance(missing, aiohttp.ClientResponseError) and missing.status == 404
+
+    def test_batch_respects_per_host_limit(self, petstore_stub, monkeypatch):
+        """Одновременно к хосту уходит не больше per_host_limit запросов"""
+        lock = threading.Lock()
+        in_flight = peak = 0
+        dispatch = petstore_stub.dispatch
+
+        def slow_dispatch(*args, **kwargs):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            try:
+                time.sleep(0.05)
+                return dispatch(*args, **kwargs)
+            finally:
+                with lock:
+                    in_flight -= 1
+
+        monkeypatch.setattr(petstore_stub, "dispatch", slow_dispatch)
+
+        async def _batch():
+            async with AsyncPetStoreAPIClient(base_url=petstore_stub.base_url,
+                                              per_host_limit=3) as client:
+                return await client.batch([("GET", "/store/inventory")] * 12)
+
+        responses = asyncio.run(_batch())
+
+        assert [response.status_code for response in responses] == [200] * 12
+        assert 1 < peak <= 3, f"peak concurrency {peak}"
@@ -0,0 +1,98 @@
+import json
+import pytest
+from utils.api_client import PetStoreAPIClient
+from utils.cassette import RECORD, REPLAY, Cassette, CassetteAdapter, CassetteMiss, body_hash
+from data.test_data import TestData
+
+# Порт, на котором ничего не слушает: воспроизведение не должно ходить в сеть
+OFFLINE_URL = "http://127.0.0.1:9/v2"
+
+
+@pytest.fixture
+def cassette_path(tmp_path):
+    return tmp_path / "petstore.cass"
+
+
+def _record(path, base_url, calls):
+    cassette = Cassette(path)
+    client = PetStoreAPIClient(base_url=base_url,
+                               transport=CassetteAdapter(cassette, mode=RECORD, base_url=base_url))
+    responses = [getattr(client, method)(*args, **kwargs) for method, args, kwargs in calls]
+    cassette.save()
+    return responses
+
+
+def _replay(path, strict=True):
+    cassette = Cassette(path).load()
+    transport = CassetteAdapter(cassette, mode=REPLAY, base_url=OFFLINE_URL, strict=strict)
+    return PetStoreAPIClient(base_url=OFFLINE_URL, transport=transport), cassette
+
+
+class TestCassette:
+    """Тесты записи и воспроизведения кассеты"""
+
+    def test_replay_without_network(self, petstore_stub, cassette_path):
+        """Ответы воспроизводятся в порядке записи, включая повторные GET одного URL"""
+        pet = TestData.generate_pet_data()
+        recorded = _record(cassette_path, petstore_stub.base_url, [
+            ("post", ("/pet",), {"data": pet}),
+            ("get", (f"/pet/{pet['id']}",), {}),
+            ("delete", (f"/pet/{pet['id']}",), {}),
+            ("get", (f"/pet/{pet['id']}",), {"expected_status": 404}),
+        ])
+
+        client, cassette = _replay(cassette_path)
+        replayed = [
+            client.post("/pet", data=pet),
+            client.get(f"/pet/{pet['id']}"),
+            client.delete(f"/pet/{pet['id']}"),
+            client.get(f"/pet/{pet['id']}", expected_status=404),
+        ]
+        cassette.close()
+
+        assert [r.status_code for r in replayed] == [r.status_code for r in recorded]
+        assert [r.content for r in replayed] == [r.content for r in recorded]
+        assert replayed[1].headers["ETag"] == recorded[1].headers["ETag"]
+        assert cassette.hits == 4 and cassette.misses == 0
+
+    def test_body_mismatch_fails_in_strict_mode(self, petstore_stub, cassette_path):
+        pet = TestData.generate_pet_data()
+        _record(cassette_path, petstore_stub.base_url, [("post", ("/pet",), {"data": pet})])
+        changed = dict(pet, name="Renamed")
+
+        client, cassette = _replay(cassette_path)
+        with pytest.raises(CassetteMiss):
+            client.post("/pet", data=changed)
+        cassette.close()
+
+        client, cassette = _replay(cassette_path, strict=False)
+        assert client.post("/pet", data=changed).json()["name"] == pet["name"]
+        assert cassette.fallbacks == 1
+        cassette.close()
+
+    def test_unrecorded_request_is_a_miss(self, petstore_stub, cassette_path):
+        _record(cassette_path, petstore_stub.base_url, [("get", ("/store/inventory",), {})])
+
+        client, cassette = _replay(cassette_path)
+        client.get("/store/inventory")
+        with pytest.raises(CassetteMiss):
+            client.get("/store/inventory")
+        cassette.close()
+        assert cassette.misses == 1
+
+    def test_chunked_body_recorded(self, petstore_stub, cassette_path):
+        """Потоковое тело записывается целиком и совпадает при воспроизведении"""
+        users = TestData.generate_users(3, seed=7)
+        _record(cassette_path, petstore_stub.base_url,
+                [("post", ("/user/createWithArray",), {"data": users, "chunked": True})])
+
+        client, cassette = _replay(cassette_path)
+        assert client.post("/user/createWithArray", data=users, chunked=True).status_code == 200
+        cassette.close()
+        assert cassette.hits == 1
+
+    def test_volatile_fields_ignored_in_body_hash(self):
+        order = TestData.generate_order_data(order_id=1)
+        later = dict(order, shipDate="2030-01-01T00:00:00Z")
+        assert body_hash(json.dumps(order)) == body_hash(json.dumps(later))
+        assert body_hash('{"id": 1}') != body_hash('{"id": 2}')
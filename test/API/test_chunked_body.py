@@ -0,0 +1,41 @@
+import pytest
+from utils.api_client import PetStoreAPIClient
+from utils.json_stream import JsonArrayStream
+from data.test_data import TestData
+
+
+@pytest.fixture
+def stub_client(petstore_stub):
+    return PetStoreAPIClient(base_url=petstore_stub.base_url)
+
+
+@pytest.fixture
+def users(petstore_stub):
+    """Пользователи для потоковой отправки; после теста удаляются из заглушки"""
+    users = TestData.generate_users(20, seed=3)
+    yield users
+    for user in users:
+        petstore_stub.storage.users.pop(user["username"], None)
+
+
+class TestChunkedBody:
+    """Тесты потоковой отправки тела-массива"""
+
+    def test_chunked_body_stored(self, petstore_stub, stub_client, users):
+        """Тело уходит несколькими чанками и сохраняется целиком"""
+        body = JsonArrayStream(users, chunk_size=256)
+
+        response = stub_client.make_request("POST", "/user/createWithArray", data=body)
+
+        assert response.status_code == 200
+        assert body.bytes_sent > 256
+        assert response.request.headers["Transfer-Encoding"] == "chunked"
+        for user in users:
+            assert petstore_stub.storage.users[user["username"]] == user
+
+    def test_generator_body_stored(self, petstore_stub, stub_client, users):
+        response = stub_client.post("/user/createWithList", data=(user for user in users))
+
+        assert response.status_code == 200
+        assert [petstore_stub.storage.users[user["username"]]["id"] for user in users] == \
+               [user["id"] for user in users]
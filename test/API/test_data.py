@@ -1,7 +1,88 @@
 import random
 import string
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Callable, Iterator, List, Optional, Union
+
+from data.id_allocator import IDS
+
+PET_CATEGORIES = ["dogs", "cats", "birds", "fish"]
+PET_TAGS = ["friendly", "playful", "quiet", "active"]
+PET_STATUSES = ["available", "pending", "sold"]
+PHOTO_URLS = ["http://example.com/photo1.jpg", "http://example.com/photo2.jpg"]
+ORDER_STATUSES = ["placed", "approved", "delivered"]
+PASSWORD_ALPHABET = string.ascii_letters + string.digits
+PASSWORD_LENGTH = 10
+
+
+class ColumnarBatch:
+    """Пачка сущностей по колонкам: словарь строки собирается только при обращении"""
+
+    def __init__(self, columns: Dict[str, List[Any]], build_row: Callable[..., Dict[str, Any]]):
+        self.columns = columns
+        self._build_row = build_row
+        self._names = list(columns)
+        self._length = len(next(iter(columns.values()), []))
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        return self._build_row(*(self.columns[name][index] for name in self._names))
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for values in zip(*self.columns.values()):
+            yield self._build_row(*values)
+
+    def column(self, name: str) -> List[Any]:
+        return self.columns[name]
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        return list(self)
+
+
+def _rng(seed: Optional[int]) -> random.Random:
+    """Генератор пачки: без seed - от глобального random, который фиксирует TEST_DATA_SEED"""
+    return random.Random(seed if seed is not None else random.getrandbits(64))
+
+
+def _pet_row(pet_id, category_id, category, tag_id, tag, status):
+    return {
+        "id": pet_id,
+        "category": {"id": category_id, "name": category},
+        "name": f"TestPet_{pet_id}",
+        "photoUrls": list(PHOTO_URLS),
+        "tags": [{"id": tag_id, "name": tag}],
+        "status": status
+    }
+
+
+def _order_row(order_id, pet_id, quantity, ship_date, status, complete):
+    return {
+        "id": order_id,
+        "petId": pet_id,
+        "quantity": quantity,
+        "shipDate": ship_date,
+        "status": status,
+        "complete": complete
+    }
+
+
+def _user_row(user_id, username, password, phone, user_status):
+    return {
+        "id": user_id,
+        "username": username,
+        "firstName": f"First_{username}",
+        "lastName": f"Last_{username}",
+        "email": f"{username}@example.com",
+        "password": password,
+        "phone": phone,
+        "userStatus": user_status
+    }
+
+
+def _batch(columns: Dict[str, List[Any]], build_row, columnar: bool):
+    batch = ColumnarBatch(columns, build_row)
+    return batch if columnar else batch.to_list()
 
 
 class TestData:
@@ -11,40 +92,37 @@ class TestData:
     def generate_pet_data(pet_id: int = None) -> Dict[str, Any]:
         """Сгенерировать данные питомца"""
         if pet_id is None:
-            pet_id = random.randint(1000, 9999)
+            pet_id = IDS.pet_id()
 
         return {
             "id": pet_id,
             "category": {
                 "id": random.randint(1, 10),
-                "name": random.choice(["dogs", "cats", "birds", "fish"])
+                "name": random.choice(PET_CATEGORIES)
             },
             "name": f"TestPet_{pet_id}",
-            "photoUrls": [
-                "http://example.com/photo1.jpg",
-                "http://example.com/photo2.jpg"
-            ],
+            "photoUrls": list(PHOTO_URLS),
             "tags": [
                 {
                     "id": random.randint(1, 5),
-                    "name": random.choice(["friendly", "playful", "quiet", "active"])
+                    "name": random.choice(PET_TAGS)
                 }
             ],
-            "status": random.choice(["available", "pending", "sold"])
+            "status": random.choice(PET_STATUSES)
         }
 
     @staticmethod
     def generate_order_data(order_id: int = None) -> Dict[str, Any]:
         """Сгенерировать данные заказа"""
         if order_id is None:
-            order_id = random.randint(1, 10)
+            order_id = IDS.order_id()
 
         return {
             "id": order_id,
             "petId": random.randint(1000, 9999),
             "quantity": random.randint(1, 5),
             "shipDate": datetime.now().isoformat() + "Z",
-            "status": random.choice(["placed", "approved", "delivered"]),
+            "status": random.choice(ORDER_STATUSES),
             "complete": random.choice([True, False])
         }
 
@@ -52,15 +130,64 @@ class TestData:
     def generate_user_data(username: str = None) -> Dict[str, Any]:
         """Сгенерировать данные пользователя"""
         if username is None:
-            username = f"testuser_{random.randint(1000, 9999)}"
+            username = IDS.username()
 
         return {
-            "id": random.randint(1000, 9999),
+            "id": IDS.user_id(),
             "username": username,
             "firstName": f"First_{username}",
             "lastName": f"Last_{username}",
             "email": f"{username}@example.com",
-            "password": "".join(random.choices(string.ascii_letters + string.digits, k=10)),
+            "password": "".join(random.choices(PASSWORD_ALPHABET, k=PASSWORD_LENGTH)),
             "phone": f"+1{random.randint(100, 999)}{random.randint(100, 999)}{random.randint(1000, 9999)}",
             "userStatus": random.randint(0, 1)
-        }
\ No newline at end of file
+        }
+
+    # Пакетная генерация: все случайные поля одной колонкой за вызов
+
+    @staticmethod
+    def generate_pets(n: int, seed: Optional[int] = None,
+                      columnar: bool = False) -> Union[List[Dict[str, Any]], ColumnarBatch]:
+        """Сгенерировать n питомцев"""
+        rng = _rng(seed)
+        columns = {
+            "id": IDS.take("pet", n),
+            "category_id": rng.choices(range(1, 11), k=n),
+            "category": rng.choices(PET_CATEGORIES, k=n),
+            "tag_id": rng.choices(range(1, 6), k=n),
+            "tag": rng.choices(PET_TAGS, k=n),
+            "status": rng.choices(PET_STATUSES, k=n),
+        }
+        return _batch(columns, _pet_row, columnar)
+
+    @staticmethod
+    def generate_orders(n: int, seed: Optional[int] = None,
+                        columnar: bool = False) -> Union[List[Dict[str, Any]], ColumnarBatch]:
+        """Сгенерировать n заказов"""
+        rng = _rng(seed)
+        columns = {
+            "id": IDS.take("order", n),
+            "petId": rng.choices(range(1000, 10000), k=n),
+            "quantity": rng.choices(range(1, 6), k=n),
+            "shipDate": [datetime.now().isoformat() + "Z"] * n,
+            "status": rng.choices(ORDER_STATUSES, k=n),
+            "complete": rng.choices([True, False], k=n),
+        }
+        return _batch(columns, _order_row, columnar)
+
+    @staticmethod
+    def generate_users(n: int, seed: Optional[int] = None, prefix: str = "testuser",
+                       columnar: bool = False) -> Union[List[Dict[str, Any]], ColumnarBatch]:
+        """Сгенерировать n пользователей"""
+        rng = _rng(seed)
+        ids = IDS.take("user", n)
+        chars = "".join(rng.choices(PASSWORD_ALPHABET, k=n * PASSWORD_LENGTH))
+        digits = rng.choices(range(10 ** 9, 10 ** 10), k=n)
+        columns = {
+            "id": ids,
+            "username": [f"{prefix}_{user_id}" for user_id in ids],
+            "password": [chars[i:i + PASSWORD_LENGTH] for i in range(0, len(chars), PASSWORD_LENGTH)],
+            "phone": [f"+1{number}" for number in digits],
+            "userStatus": rng.choices([0, 1], k=n),
+        }
+        return _batch(columns, _user_row, columnar)
\ No newline at end of file
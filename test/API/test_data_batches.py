@@ -0,0 +1,52 @@
+import pytest
+from data.test_data import ColumnarBatch, TestData
+
+BATCHES = [
+    (TestData.generate_pets, TestData.generate_pet_data),
+    (TestData.generate_orders, TestData.generate_order_data),
+    (TestData.generate_users, TestData.generate_user_data),
+]
+
+
+# Поля от аллокатора ID и от текущего времени, а не от seed
+NOT_SEEDED = {"id", "username", "name", "firstName", "lastName", "email", "shipDate"}
+
+
+def _without_ids(rows):
+    return [{key: value for key, value in row.items() if key not in NOT_SEEDED} for row in rows]
+
+
+@pytest.mark.parametrize("generate, generate_one", BATCHES)
+class TestDataBatches:
+    """Тесты пакетных генераторов"""
+
+    def test_same_seed_same_data(self, generate, generate_one):
+        first, second = generate(20, seed=42), generate(20, seed=42)
+        assert _without_ids(first) == _without_ids(second)
+        assert _without_ids(first) != _without_ids(generate(20, seed=43))
+
+    def test_unique_ids(self, generate, generate_one):
+        ids = [row["id"] for row in generate(50, seed=1)]
+        assert len(set(ids)) == 50
+
+    def test_row_shape_matches_single_generator(self, generate, generate_one):
+        """Строка пачки имеет те же поля и типы, что и одиночный генератор"""
+        single = generate_one()
+        for row in generate(5, seed=1):
+            assert row.keys() == single.keys()
+            assert {key: type(value) for key, value in row.items()} == \
+                   {key: type(value) for key, value in single.items()}
+
+    def test_columnar_batch(self, generate, generate_one):
+        batch = generate(10, seed=5, columnar=True)
+
+        assert isinstance(batch, ColumnarBatch)
+        assert len(batch) == 10
+        assert all(len(values) == 10 for values in batch.columns.values())
+        rows = batch.to_list()
+        assert rows == list(batch) == [batch[i] for i in range(10)]
+        assert batch.column("id") == [row["id"] for row in rows]
+
+    def test_empty_batch(self, generate, generate_one):
+        assert generate(0, seed=1) == []
+        assert len(generate(0, seed=1, columnar=True)) == 0
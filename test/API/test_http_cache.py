@@ -0,0 +1,82 @@
+import pytest
+from utils.api_client import PetStoreAPIClient
+from utils.http_cache import ResponseCache
+from data.test_data import TestData
+
+
+@pytest.fixture
+def network_calls():
+    """Запросы, реально ушедшие на сервер"""
+    return []
+
+
+@pytest.fixture
+def pet(petstore_stub):
+    """Данные питомца; после теста он удаляется из заглушки"""
+    pet = dict(TestData.generate_pet_data(), status="available")
+    yield pet
+    petstore_stub.storage.delete_pet(pet["id"])
+
+
+def _client(petstore_stub, network_calls, ttl: float) -> PetStoreAPIClient:
+    return PetStoreAPIClient(base_url=petstore_stub.base_url, cache=ResponseCache(ttl=ttl),
+                             hooks=[network_calls.append])
+
+
+class TestResponseCache:
+    """Тесты кэша ответов GET против локальной заглушки"""
+
+    def test_fresh_entry_served_without_request(self, petstore_stub, network_calls, pet):
+        client = _client(petstore_stub, network_calls, ttl=60)
+        client.post("/pet", data=pet)
+
+        first = client.get(f"/pet/{pet['id']}")
+        second = client.get(f"/pet/{pet['id']}")
+
+        assert [call.method for call in network_calls] == ["POST", "GET"]
+        assert getattr(second, "from_cache", False)
+        assert second.json() == first.json()
+        assert second.request is not None and second.request.url == first.request.url
+        assert client.cache.hits == 1 and client.cache.misses == 1
+
+    def test_stale_entry_revalidated_by_etag(self, petstore_stub, network_calls, pet):
+        """Устаревшая запись перепроверяется условным GET; сервер отвечает 304"""
+        client = _client(petstore_stub, network_calls, ttl=0)
+        client.post("/pet", data=pet)
+
+        first = client.get(f"/pet/{pet['id']}")
+        second = client.get(f"/pet/{pet['id']}")
+
+        assert first.headers["ETag"]
+        assert [call.status for call in network_calls] == [200, 200, 304]
+        assert second.status_code == 200 and second.json()["id"] == pet["id"]
+        assert second.request.headers["If-None-Match"] == first.headers["ETag"]
+        assert client.cache.stale == 1 and client.cache.revalidated == 1
+
+    def test_changed_resource_not_revalidated(self, petstore_stub, network_calls, pet):
+        """Ресурс изменили в обход клиента: ETag не совпал, приходит новое тело"""
+        client = _client(petstore_stub, network_calls, ttl=0)
+        client.post("/pet", data=pet)
+        client.get(f"/pet/{pet['id']}")
+
+        petstore_stub.storage.save_pet(dict(pet, status="sold"))
+        response = client.get(f"/pet/{pet['id']}")
+
+        assert response.json()["status"] == "sold"
+        assert client.cache.revalidated == 0
+
+    def test_write_invalidates_related_groups(self, petstore_stub, network_calls, pet):
+        """Запись в /pet сбрасывает кэш /pet и /store/inventory"""
+        client = _client(petstore_stub, network_calls, ttl=60)
+        client.post("/pet", data=pet)
+        client.get(f"/pet/{pet['id']}")
+        before = client.get("/store/inventory").json()
+
+        client.put("/pet", data=dict(pet, status="sold"))
+        updated = client.get(f"/pet/{pet['id']}")
+        after = client.get("/store/inventory").json()
+
+        assert not getattr(updated, "from_cache", False)
+        assert updated.json()["status"] == "sold"
+        assert after.get("sold", 0) == before.get("sold", 0) + 1
+        assert client.cache.invalidations == 2
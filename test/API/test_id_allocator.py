@@ -0,0 +1,43 @@
+import pytest
+from data.id_allocator import BLOCKS, ID_BASE, MAX_WORKERS, RUN_CAPACITY, IdAllocator
+
+INT64_MAX = 2 ** 63 - 1
+
+
+class TestIdAllocator:
+    """Тесты аллокатора ID тестовых данных"""
+
+    def test_workers_do_not_overlap(self):
+        allocators = [IdAllocator(worker=worker, seed=5) for worker in range(4)]
+        ids = [set(allocator.take("pet", 1000)) for allocator in allocators]
+        assert sum(len(chunk) for chunk in ids) == len(set().union(*ids)) == 4000
+        for worker, chunk in enumerate(ids):
+            assert all(value % MAX_WORKERS == (ID_BASE + worker) % MAX_WORKERS for value in chunk)
+
+    def test_concurrent_runs_on_same_worker_do_not_overlap(self):
+        """Два прогона с одним gw0 в одну миллисекунду получают разные блоки"""
+        first, second = IdAllocator(worker=0), IdAllocator(worker=0)
+        assert first.seed != second.seed
+        assert not set(first.take("pet", 5000)) & set(second.take("pet", 5000))
+
+    def test_seed_is_reproducible(self):
+        assert IdAllocator(worker=3, seed=42).take("user", 10) == \
+            IdAllocator(worker=3, seed=42).take("user", 10)
+        assert IdAllocator(worker=3, seed=42).take("user", 10) != \
+            IdAllocator(worker=3, seed=43).take("user", 10)
+
+    def test_seeded_blocks_are_disjoint(self):
+        """Соседние seed не пересекаются, пока прогон укладывается в RUN_CAPACITY"""
+        last_of_block = (IdAllocator(worker=MAX_WORKERS - 1, seed=1).pet_id()
+                         + (RUN_CAPACITY - 1) * MAX_WORKERS)
+        assert last_of_block < IdAllocator(worker=0, seed=2).pet_id()
+
+    @pytest.mark.parametrize("seed", [None, 0, BLOCKS - 1, BLOCKS + 7])
+    def test_ids_fit_int64(self, seed):
+        first = IdAllocator(worker=MAX_WORKERS - 1, seed=seed).pet_id()
+        assert ID_BASE <= first and first + (RUN_CAPACITY - 1) * MAX_WORKERS <= INT64_MAX
+
+    def test_kinds_are_independent(self):
+        allocator = IdAllocator(worker=0, seed=1)
+        assert allocator.pet_id() == allocator.order_id() == allocator.user_id()
+        assert allocator.username("x") == f"x_{allocator.pet_id()}"
@@ -0,0 +1,27 @@
+import random
+import pytest
+from utils.instrumentation import LatencyHistogram
+
+
+class TestLatencyHistogram:
+    """Тесты точности гистограммы задержек"""
+
+    @pytest.mark.parametrize("bits", [3, 5])
+    def test_relative_error_within_bound(self, bits):
+        histogram = LatencyHistogram(sub_bucket_bits=bits)
+        for value in [1, 31, 32, 33, 63, 64, 65, 1000, 123_456, 9_999_999]:
+            upper = LatencyHistogram._bucket_upper(histogram._bucket(value))
+            assert value <= upper
+            assert (upper - value) / value <= 1 / 2 ** bits
+
+    def test_percentiles(self):
+        histogram = LatencyHistogram()
+        rng = random.Random(1)
+        values = sorted(rng.uniform(0.001, 2.0) for _ in range(10_000))
+        for value in values:
+            histogram.record(value)
+
+        for pct in (50, 90, 99):
+            exact = values[int(pct / 100 * len(values)) - 1]
+            assert exact - 1e-6 <= histogram.percentile(pct) <= exact * (1 + 1 / 32) + 1e-6
+        assert histogram.percentile(100) == pytest.approx(values[-1], abs=1e-6)
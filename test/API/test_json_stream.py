@@ -0,0 +1,45 @@
+import json
+import pytest
+from utils.json_stream import JsonArrayStream, iter_json_items
+
+
+def _chunks(payload: bytes, size: int):
+    return (payload[i:i + size] for i in range(0, len(payload), size))
+
+
+ARRAYS = [
+    [1.5e3, -2, 0, 3.25, 1e-7, 12345678901234567890, True, None, False],
+    ["", "a,b]", "кириллица", "\"quoted\"", "\\u0441 escaped", "  spaced  "],
+    [{"id": 1, "tags": [1, 2.5e2]}, {"name": "Ёж", "nested": {"a": [None]}}, [], {}],
+]
+
+
+class TestJsonStream:
+    """Тесты потокового JSON-массива"""
+
+    @pytest.mark.parametrize("items", ARRAYS, ids=["numbers", "strings", "objects"])
+    def test_every_chunk_boundary(self, items):
+        """Разбор не зависит от того, где кусок разрезал элемент"""
+        payload = json.dumps(items, ensure_ascii=False, indent=1).encode("utf-8")
+        for size in range(1, len(payload) + 1):
+            assert list(iter_json_items(_chunks(payload, size))) == items, f"chunk size {size}"
+
+    def test_fields_projection(self):
+        payload = b'[{"id": 1, "name": "a", "photoUrls": ["x"]}, {"id": 2}]'
+        assert list(iter_json_items(_chunks(payload, 3), fields=["id", "name"])) == \
+            [{"id": 1, "name": "a"}, {"id": 2}]
+
+    @pytest.mark.parametrize("payload", [b"[1, 2] x", b"[1] [2]", b"[1 2]", b"[1,", b"{}", b""])
+    def test_invalid_json_rejected(self, payload):
+        for size in (1, 2, len(payload) or 1):
+            with pytest.raises(ValueError):
+                list(iter_json_items(_chunks(payload, size)))
+
+    def test_array_stream_round_trip(self):
+        """JsonArrayStream и iter_json_items дают те же записи при любом размере куска"""
+        records = [{"id": i, "value": i / 3} for i in range(50)]
+        for chunk_size in (1, 7, 64 * 1024):
+            stream = JsonArrayStream(iter(records), chunk_size=chunk_size)
+            body = b"".join(stream)
+            assert stream.bytes_sent == len(body)
+            assert list(iter_json_items(_chunks(body, 5))) == records
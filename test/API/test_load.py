@@ -0,0 +1,78 @@
+import pytest
+import logging
+import time
+
+from utils.load_runner import LoadRunner, SCENARIOS, Scenario, Step
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.mark.load
+class TestLoad:
+    """Короткие нагрузочные прогоны против локальной заглушки"""
+
+    @pytest.fixture(autouse=True)
+    def _local_only(self, request):
+        if request.config.getoption("--petstore-url"):
+            pytest.skip("Load tests run only against the local PetStore stub")
+        if request.config.getoption("--cassette"):
+            pytest.skip("Load tests measure the live stub and are not recorded to cassettes")
+
+    def test_open_model(self, petstore_base_url):
+        """Тест открытой модели нагрузки"""
+        logger.info("Test: Open model load run")
+
+        scenarios = [factory() for factory in SCENARIOS.values()]
+        report = LoadRunner(petstore_base_url, scenarios, seed=1).run_open(rate=50, duration=2)
+
+        logger.info("\n" + report.format_table())
+
+        assert report.iterations > 0
+        assert report.failed_iterations == 0
+        assert report.throughput > 0
+        for endpoint, row in report.endpoint_stats().items():
+            assert row["p50"] <= row["p95"] <= row["p99"], endpoint
+
+    def test_closed_model(self, petstore_base_url):
+        """Тест закрытой модели с виртуальными пользователями"""
+        logger.info("Test: Closed model load run")
+
+        runner = LoadRunner(petstore_base_url, [SCENARIOS["pet_lifecycle"]()])
+        report = runner.run_closed(users=4, iterations=5)
+
+        logger.info("\n" + report.format_table())
+
+        assert report.iterations == 20
+        assert report.failed_iterations == 0
+        assert len(report.latencies["POST /pet"]) == 20
+
+
+def _slow_step(seconds):
+    return Scenario(name="slow", steps=[Step("slow", lambda client, ctx: time.sleep(seconds))])
+
+
+class TestLoadRunner:
+    """Тесты самого генератора нагрузки, без запросов к API"""
+
+    def test_open_model_counts_queueing(self):
+        """Задержка считается от планового старта: очередь к занятому потоку видна в p99"""
+        runner = LoadRunner("http://127.0.0.1:9/v2", [_slow_step(0.05)])
+        report = runner.run_open(rate=100, duration=0.3, max_workers=1)
+
+        latencies = sorted(report.latencies["slow"])
+        assert report.iterations == 30
+        assert latencies[0] >= 0.05
+        assert latencies[-1] > 0.8, f"queueing delay hidden: max {latencies[-1]:.2f}s"
+
+    @pytest.mark.parametrize("model", ["open", "closed"])
+    def test_scenario_crash_is_raised(self, model):
+        """Исключение сценария не теряется в потоках пула"""
+        def _broken(client, ctx):
+            raise KeyError("missing context")
+
+        runner = LoadRunner("http://127.0.0.1:9/v2", [Scenario("broken", [Step("broken", _broken)])])
+        with pytest.raises(KeyError):
+            if model == "open":
+                runner.run_open(rate=20, duration=0.1)
+            else:
+                runner.run_closed(users=2, iterations=1)
@@ -4,6 +4,17 @@ from typing import Dict, Any
 
 logger = logging.getLogger(__name__)
 
+PET_STATUSES = ["available", "pending", "sold"]
+
+
+@pytest.fixture(scope="module")
+def pets_by_status(module_resource_registry, test_data):
+    """По питомцу на каждый статус; создаются пачкой и удаляются после модуля"""
+    pets = [dict(test_data.generate_pet_data(), status=status) for status in PET_STATUSES]
+    responses = module_resource_registry.seed("pet", pets)
+    assert [response.status_code for response in responses] == [200] * len(pets)
+    return {pet["status"]: pet for pet in pets}
+
 
 class TestPetAPI:
     """Тесты для API питомцев"""
@@ -98,31 +109,30 @@ class TestPetAPI:
         assert response.status_code == 200
 
         # Проверяем, что питомец действительно удален
-        get_response = api_client.get(f"/pet/{pet_data['id']}")
+        get_response = api_client.get(f"/pet/{pet_data['id']}", expected_status=404)
         assert get_response.status_code == 404, "Pet should not exist after deletion"
 
         logger.info("✓ Pet deleted successfully")
 
     @pytest.mark.pet
-    @pytest.mark.parametrize("status", ["available", "pending", "sold"])
-    def test_find_pets_by_status(self, api_client, status):
+    @pytest.mark.parametrize("status", PET_STATUSES)
+    def test_find_pets_by_status(self, api_client, pets_by_status, status):
         """Тест поиска питомцев по статусу"""
         logger.info(f"Test: Find pets by status '{status}'")
 
-        response = api_client.get("/pet/findByStatus", params={"status": status})
+        response = api_client.get("/pet/findByStatus", params={"status": status}, stream=True)
 
         # Проверки
         assert response.status_code == 200
 
-        pets = response.json()
-        assert isinstance(pets, list)
-
-        # Если есть питомцы, проверяем их статус
-        if pets:
-            for pet in pets:
-                assert pet["status"] == status
+        # Список разбирается по элементам: ответ общего сервера бывает в мегабайты
+        found = set()
+        for pet in api_client.iter_json_items(response, fields=("id", "status")):
+            assert pet["status"] == status
+            found.add(pet.get("id"))
 
-        logger.info(f"✓ Found {len(pets)} pets with status '{status}'")
+        assert pets_by_status[status]["id"] in found, "Seeded pet is missing from the results"
+        logger.info(f"✓ Found {len(found)} pets with status '{status}'")
 
     @pytest.mark.pet
     def test_get_nonexistent_pet(self, api_client):
@@ -130,7 +140,7 @@ class TestPetAPI:
         logger.info("Test: Get non-existent pet")
 
         nonexistent_id = 999999999
-        response = api_client.get(f"/pet/{nonexistent_id}")
+        response = api_client.get(f"/pet/{nonexistent_id}", expected_status=404)
 
         assert response.status_code == 404
 
@@ -152,7 +162,7 @@ class TestPetAPI:
             "status": "invalid_status"  # Невалидный статус
         }
 
-        response = api_client.post("/pet", data=invalid_data)
+        response = api_client.post("/pet", data=invalid_data, expected_status=(400, 405, 500))
 
         # Petstore может вернуть 400 или 500 на невалидные данные
         assert response.status_code in [400, 405, 500]
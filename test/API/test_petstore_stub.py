@@ -0,0 +1,37 @@
+import pytest
+from utils.api_client import PetStoreAPIClient
+from data.test_data import TestData
+
+
+@pytest.fixture
+def stub_client(petstore_stub):
+    return PetStoreAPIClient(base_url=petstore_stub.base_url)
+
+
+class TestPetStoreStub:
+    """Тесты локальной заглушки"""
+
+    @pytest.mark.parametrize("endpoint, generate, collection, key", [
+        ("/pet", TestData.generate_pet_data, "pets", "id"),
+        ("/store/order", TestData.generate_order_data, "orders", "id"),
+        ("/user", TestData.generate_user_data, "users", "username"),
+    ])
+    def test_zero_id_kept(self, petstore_stub, stub_client, endpoint, generate, collection, key):
+        """id=0 сохраняется как есть, а не заменяется сгенерированным"""
+        data = dict(generate(), id=0)
+
+        stub_client.post(endpoint, data=data)
+
+        stored = getattr(petstore_stub.storage, collection).pop(data[key])
+        assert stored["id"] == 0
+
+    def test_unhandled_error_returns_500(self, petstore_stub, stub_client, monkeypatch):
+        def broken(*args, **kwargs):
+            raise KeyError("boom")
+
+        monkeypatch.setattr(petstore_stub.storage, "inventory", broken)
+
+        response = stub_client.get("/store/inventory", expected_status=500)
+
+        assert response.json() == {"code": 500, "type": "unknown", "message": "something bad happened"}
+        assert stub_client.get("/pet/-1", expected_status=404).status_code == 404
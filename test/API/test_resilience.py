@@ -0,0 +1,153 @@
+import random
+import time
+from email.utils import formatdate
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+from utils.api_client import PetStoreAPIClient
+from utils.resilience import CircuitBreaker, CircuitOpenError, PolicySet, RetryPolicy
+
+
+class ScriptedAdapter(BaseAdapter):
+    """Транспорт, отдающий заранее заданные ответы и ошибки по очереди"""
+
+    def __init__(self, outcomes):
+        super().__init__()
+        self.outcomes = list(outcomes)
+        self.sent = []
+
+    def send(self, request, **kwargs):
+        self.sent.append(request)
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        status, headers = outcome if isinstance(outcome, tuple) else (outcome, {})
+        response = requests.Response()
+        response.status_code = status
+        response.headers.update(headers)
+        response._content = b"{}"
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def _client(outcomes, policy=None, breaker=None):
+    transport = ScriptedAdapter(outcomes)
+    client = PetStoreAPIClient(base_url="http://petstore.test/v2", transport=transport,
+                               policies=PolicySet(default=policy or RetryPolicy(backoff=0.01)),
+                               breaker=breaker)
+    return client, transport
+
+
+class TestRetryPolicy:
+    """Тесты повторов и задержек"""
+
+    def test_full_jitter_backoff(self):
+        """Задержка случайна в [0, min(max_backoff, backoff * 2^attempt)]"""
+        policy = RetryPolicy(backoff=0.2, max_backoff=1.0)
+        rng = random.Random(1)
+        for attempt, cap in [(0, 0.2), (1, 0.4), (2, 0.8), (5, 1.0)]:
+            delays = [policy.delay(attempt, rng=rng) for _ in range(50)]
+            assert all(0 <= delay <= cap for delay in delays)
+            assert len(set(delays)) > 1
+
+    def test_retry_after_overrides_backoff(self):
+        policy = RetryPolicy(backoff=0.01, max_retry_after=10)
+        response = requests.Response()
+        response.headers["Retry-After"] = "3"
+        assert policy.delay(0, response) == 3
+        response.headers["Retry-After"] = "120"
+        assert policy.delay(0, response) == 10
+        response.headers["Retry-After"] = formatdate(time.time() + 5, usegmt=True)
+        assert 3 < policy.delay(0, response) <= 5
+
+    @pytest.mark.parametrize("reset, expected", [
+        (lambda: "4", 4),
+        (lambda: str(int(time.time()) + 4), 4),
+        (lambda: str(int(time.time()) - 30), 0),
+    ])
+    def test_rate_limit_reset_seconds_or_epoch(self, reset, expected):
+        """X-Rate-Limit-Reset: задержка в секундах или момент сброса в epoch"""
+        policy = RetryPolicy(max_retry_after=10)
+        response = requests.Response()
+        response.headers["X-Rate-Limit-Reset"] = reset()
+        assert policy.delay(0, response) == pytest.approx(expected, abs=1.1)
+
+    def test_transient_status_retried(self):
+        client, transport = _client([(503, {"Retry-After": "0"}), 500, 200])
+
+        response = client.get("/store/inventory")
+
+        assert response.status_code == 200
+        assert len(transport.sent) == 3 and client.retries == 2
+
+    def test_post_not_retried(self):
+        """POST не идемпотентен: временная ошибка не повторяется"""
+        client, transport = _client([503, 200])
+
+        with pytest.raises(requests.exceptions.HTTPError):
+            client.post("/pet", data={"id": 1})
+        assert len(transport.sent) == 1
+
+    @pytest.mark.parametrize("chunked, sends", [(False, 2), (True, 1)])
+    def test_streamed_body_not_retried(self, chunked, sends):
+        """PUT идемпотентен, но потоковое тело нельзя отправить второй раз"""
+        client, transport = _client([503, 200])
+
+        if chunked:
+            with pytest.raises(requests.exceptions.HTTPError):
+                client.put("/pet", data=[{"id": 1}], chunked=True)
+        else:
+            assert client.put("/pet", data={"id": 1}).status_code == 200
+        assert len(transport.sent) == sends
+
+
+class TestCircuitBreaker:
+    """Тесты размыкателя"""
+
+    def test_trips_after_threshold(self):
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+        client, transport = _client([requests.exceptions.ConnectionError("down")] * 2,
+                                    policy=RetryPolicy(retries=0), breaker=breaker)
+
+        for _ in range(2):
+            with pytest.raises(requests.exceptions.ConnectionError):
+                client.get("/store/inventory")
+        with pytest.raises(CircuitOpenError):
+            client.get("/store/inventory")
+
+        assert breaker.state == CircuitBreaker.OPEN
+        assert breaker.trips == 1 and breaker.rejected == 1
+        assert len(transport.sent) == 2
+
+    def test_probe_success_closes_circuit(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+        client, _ = _client([requests.exceptions.Timeout("slow"), 200],
+                            policy=RetryPolicy(retries=0), breaker=breaker)
+        with pytest.raises(requests.exceptions.Timeout):
+            client.get("/store/inventory")
+        assert breaker.state == CircuitBreaker.OPEN
+
+        time.sleep(0.06)
+        assert client.get("/store/inventory").status_code == 200
+        assert breaker.state == CircuitBreaker.CLOSED and breaker.failures == 0
+
+    def test_probe_failure_reopens_circuit(self):
+        """Пробный запрос упал на чтении тела - цепь снова разомкнута, а не HALF_OPEN"""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+        client, _ = _client([requests.exceptions.ConnectionError("down"),
+                             requests.exceptions.ChunkedEncodingError("truncated")],
+                            policy=RetryPolicy(retries=0), breaker=breaker)
+        with pytest.raises(requests.exceptions.ConnectionError):
+            client.get("/store/inventory")
+
+        time.sleep(0.06)
+        with pytest.raises(requests.exceptions.ChunkedEncodingError):
+            client.get("/store/inventory")
+
+        assert breaker.state == CircuitBreaker.OPEN and breaker.trips == 2
+        with pytest.raises(CircuitOpenError):
+            client.get("/store/inventory")
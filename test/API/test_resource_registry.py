@@ -0,0 +1,55 @@
+import pytest
+from utils.api_client import PetStoreAPIClient
+from utils.resilience import NO_RETRY, PolicySet
+from utils.resource_registry import ResourceRegistry
+from data.test_data import TestData
+
+
+@pytest.fixture
+def stub_client(petstore_stub):
+    return PetStoreAPIClient(base_url=petstore_stub.base_url)
+
+
+class TestResourceRegistry:
+    """Тесты пакетного создания и удаления ресурсов"""
+
+    def test_seed_creates_and_tracks(self, petstore_stub, stub_client):
+        registry = ResourceRegistry(stub_client, scope="test")
+        pets = [TestData.generate_pet_data() for _ in range(5)]
+
+        responses = registry.seed("pet", pets)
+
+        assert [response.status_code for response in responses] == [200] * 5
+        assert len(registry) == 5
+        assert all(pet["id"] in petstore_stub.storage.pets for pet in pets)
+        registry.flush()
+
+    def test_flush_counts_404_as_already_deleted(self, petstore_stub, stub_client):
+        """Ресурс, удаленный самим тестом, не считается утечкой"""
+        registry = ResourceRegistry(stub_client, scope="test")
+        kept, deleted = TestData.generate_pet_data(), TestData.generate_pet_data()
+        registry.seed("pet", [kept, deleted])
+        user = TestData.generate_user_data()
+        stub_client.post("/user", data=user)
+        registry.track_user(user["username"])
+        stub_client.delete(f"/pet/{deleted['id']}")
+
+        report = registry.flush()
+
+        assert (report.deleted, report.already_gone, report.leaked) == (2, 1, [])
+        assert kept["id"] not in petstore_stub.storage.pets
+        assert user["username"] not in petstore_stub.storage.users
+        assert len(registry) == 0
+
+    def test_flush_reports_leaks(self):
+        """Сервер недоступен: ресурсы попадают в leaked, а не теряются"""
+        client = PetStoreAPIClient(base_url="http://127.0.0.1:9/v2",
+                                   policies=PolicySet(default=NO_RETRY))
+        registry = ResourceRegistry(client, scope="test")
+        registry.track_pet(1)
+        registry.track_order(2)
+
+        report = registry.flush()
+
+        assert report.deleted == report.already_gone == 0
+        assert sorted((kind, key) for kind, key, _ in report.leaked) == [("order", 2), ("pet", 1)]
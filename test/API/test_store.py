@@ -30,12 +30,12 @@ class TestStoreAPI:
         logger.info(f"✓ Order created successfully with ID: {order_data['id']}")
 
     @pytest.mark.store
-    def test_get_order_by_id(self, api_client, test_data):
+    def test_get_order_by_id(self, api_client, namespace):
         """Тест получения заказа по ID"""
         logger.info("Test: Get order by ID")
 
         # Создаем заказ для теста
-        order_data = test_data.generate_order_data(order_id=5)  # Используем ID 1-10
+        order_data = namespace.order()
         api_client.post("/store/order", data=order_data)
 
         # Получаем заказ
@@ -51,12 +51,12 @@ class TestStoreAPI:
         logger.info(f"✓ Order retrieved successfully: ID {order_data['id']}")
 
     @pytest.mark.store
-    def test_delete_order(self, api_client, test_data):
+    def test_delete_order(self, api_client, namespace):
         """Тест удаления заказа"""
         logger.info("Test: Delete order")
 
         # Создаем заказ для удаления
-        order_data = test_data.generate_order_data(order_id=3)
+        order_data = namespace.order()
         api_client.post("/store/order", data=order_data)
 
         # Удаляем заказ
@@ -66,7 +66,7 @@ class TestStoreAPI:
         assert response.status_code == 200
 
         # Проверяем, что заказ удален
-        get_response = api_client.get(f"/store/order/{order_data['id']}")
+        get_response = api_client.get(f"/store/order/{order_data['id']}", expected_status=404)
         assert get_response.status_code == 404
 
         logger.info("✓ Order deleted successfully")
@@ -99,7 +99,7 @@ class TestStoreAPI:
         """Тест получения невалидного заказа"""
         logger.info(f"Test: Get invalid order ID: {order_id}")
 
-        response = api_client.get(f"/store/order/{order_id}")
+        response = api_client.get(f"/store/order/{order_id}", expected_status=(400, 404))
 
         # Должен вернуть 400 для невалидного ID или 404 для валидного но несуществующего
         assert response.status_code in [400, 404]
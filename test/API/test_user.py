@@ -27,12 +27,12 @@ class TestUserAPI:
         logger.info(f"✓ User created: {user_data['username']}")
 
     @pytest.mark.user
-    def test_get_user_by_username(self, api_client, test_data):
+    def test_get_user_by_username(self, api_client, namespace):
         """Тест получения пользователя по имени"""
         logger.info("Test: Get user by username")
 
         # Создаем пользователя
-        user_data = test_data.generate_user_data(username="testuser123")
+        user_data = namespace.user("testuser")
         api_client.post("/user", data=user_data)
 
         # Получаем пользователя
@@ -48,12 +48,12 @@ class TestUserAPI:
         logger.info(f"✓ User retrieved: {user_data['username']}")
 
     @pytest.mark.user
-    def test_update_user(self, api_client, test_data):
+    def test_update_user(self, api_client, namespace):
         """Тест обновления пользователя"""
         logger.info("Test: Update user")
 
         # Создаем пользователя
-        user_data = test_data.generate_user_data(username="updatetest")
+        user_data = namespace.user("updatetest")
         api_client.post("/user", data=user_data)
 
         # Обновляем данные
@@ -76,12 +76,12 @@ class TestUserAPI:
         logger.info("✓ User updated successfully")
 
     @pytest.mark.user
-    def test_delete_user(self, api_client, test_data):
+    def test_delete_user(self, api_client, namespace):
         """Тест удаления пользователя"""
         logger.info("Test: Delete user")
 
         # Создаем пользователя для удаления
-        user_data = test_data.generate_user_data(username="deletetest")
+        user_data = namespace.user("deletetest")
         api_client.post("/user", data=user_data)
 
         # Удаляем пользователя
@@ -91,22 +91,21 @@ class TestUserAPI:
         assert response.status_code == 200
 
         # Проверяем, что пользователь удален
-        get_response = api_client.get(f"/user/{user_data['username']}")
+        get_response = api_client.get(f"/user/{user_data['username']}", expected_status=404)
         assert get_response.status_code == 404
 
         logger.info("✓ User deleted successfully")
 
     @pytest.mark.user
-    def test_user_login(self, api_client, test_data):
+    def test_user_login(self, api_client, namespace):
         """Тест входа пользователя"""
         logger.info("Test: User login")
 
         # Создаем пользователя с известными учетными данными
-        username = "loginuser"
         password = "testpass123"
 
-        user_data = test_data.generate_user_data(username=username)
-        user_data["password"] = password
+        user_data = namespace.user("loginuser", password=password)
+        username = user_data["username"]
 
         api_client.post("/user", data=user_data)
 
@@ -148,10 +147,7 @@ class TestUserAPI:
         """Тест создания нескольких пользователей"""
         logger.info("Test: Create users with array")
 
-        users = [
-            test_data.generate_user_data(username=f"arrayuser_{i}")
-            for i in range(3)
-        ]
+        users = test_data.generate_users(3, prefix="arrayuser")
 
         response = api_client.post("/user/createWithArray", data=users)
 
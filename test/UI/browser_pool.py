@@ -0,0 +1,139 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List
+
+from selenium.common.exceptions import WebDriverException
+from urllib3.exceptions import HTTPError
+
+logger = logging.getLogger(__name__)
+
+# Ошибки мертвого браузера: упавший chromedriver не отвечает на HTTP вовсе
+DRIVER_ERRORS = (WebDriverException, HTTPError, OSError)
+
+
+class BrowserPool:
+    """Пул прогретых браузеров, переиспользуемых между тестами"""
+
+    def __init__(self, factory: Callable, size: int = 1, max_uses: int = 20):
+        self.factory = factory
+        self.size = size
+        self.max_uses = max_uses
+        self._lock = threading.Lock()
+        self._idle: List = []
+        self._uses: Dict[int, int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.recycled = 0
+        self.crashed = 0
+        self.startups = 0
+        self.startup_time = 0.0
+
+    def _start(self):
+        started = time.perf_counter()
+        driver = self.factory()
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self.startups += 1
+            self.startup_time += elapsed
+            self._uses[id(driver)] = 0
+        logger.info(f"Браузер запущен за {elapsed:.2f} с")
+        return driver
+
+    def prewarm(self):
+        """Запустить браузеры заранее, параллельно"""
+        missing = self.size - len(self._idle)
+        if missing <= 0:
+            return
+        with ThreadPoolExecutor(max_workers=missing) as pool:
+            drivers = list(pool.map(lambda _: self._start(), range(missing)))
+        with self._lock:
+            self._idle.extend(drivers)
+
+    def acquire(self):
+        """Взять браузер из пула или запустить новый"""
+        with self._lock:
+            driver = self._idle.pop() if self._idle else None
+            if driver is not None:
+                self.hits += 1
+        if driver is None:
+            with self._lock:
+                self.misses += 1
+            driver = self._start()
+        with self._lock:
+            self._uses[id(driver)] += 1
+        return driver
+
+    def release(self, driver, broken: bool = False):
+        """Вернуть браузер в пул, сбросив состояние, или закрыть его"""
+        uses = self._uses.get(id(driver), 0)
+        if not broken and uses < self.max_uses:
+            try:
+                self.reset(driver)
+            except DRIVER_ERRORS as e:
+                logger.warning(f"Браузер не отвечает, пересоздаем: {e}")
+                broken = True
+            else:
+                with self._lock:
+                    if len(self._idle) < self.size:
+                        self._idle.append(driver)
+                        return
+
+        with self._lock:
+            if broken:
+                self.crashed += 1
+            else:
+                self.recycled += 1
+        self._quit(driver)
+
+    @staticmethod
+    def reset(driver):
+        """Очистить cookies, storage и оставить одну пустую вкладку"""
+        old_handles = driver.window_handles
+        for handle in old_handles:
+            driver.switch_to.window(handle)
+            driver.execute_script(
+                "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}")
+        driver.switch_to.new_window("tab")
+        fresh = driver.current_window_handle
+        for handle in old_handles:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(fresh)
+        try:
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        except (AttributeError, WebDriverException):
+            driver.delete_all_cookies()
+
+    def _quit(self, driver):
+        with self._lock:
+            self._uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except DRIVER_ERRORS as e:
+            logger.warning(f"Браузер не закрылся: {e}")
+
+    def close(self):
+        """Закрыть все браузеры пула"""
+        with self._lock:
+            drivers, self._idle = self._idle, []
+        for driver in drivers:
+            self._quit(driver)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    @property
+    def saved_time(self) -> float:
+        """Оценка сэкономленного времени запуска: средний старт * число переиспользований"""
+        if not self.startups:
+            return 0.0
+        return self.hits * self.startup_time / self.startups
+
+    def stats(self) -> str:
+        return (f"browser pool: acquires={self.hits + self.misses} hit_rate={self.hit_rate:.0%} "
+                f"startups={self.startups} recycled={self.recycled} crashed={self.crashed} "
+                f"startup_time={self.startup_time:.1f}s saved≈{self.saved_time:.1f}s")
@@ -0,0 +1,174 @@
+import fnmatch
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import List, Optional
+
+import psutil
+from selenium.common.exceptions import WebDriverException
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROFILE = "default"
+THROUGHPUT_PROFILE = "throughput"
+PROFILES = (DEFAULT_PROFILE, THROUGHPUT_PROFILE)
+
+# Фиксированный viewport: верстка не зависит от размера экрана машины
+WINDOW_SIZE = os.getenv("UI_WINDOW_SIZE", "1366,900")
+
+# Фоновые службы Chrome, которые тестам не нужны
+THROUGHPUT_ARGUMENTS = [
+    "--headless=new",
+    f"--window-size={WINDOW_SIZE}",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-domain-reliability",
+    "--disable-client-side-phishing-detection",
+    "--metrics-recording-only",
+    "--mute-audio",
+    "--no-first-run",
+    "--blink-settings=imagesEnabled=false",
+    "--disable-features=Translate,OptimizationHints,MediaRouter,AutofillServerCommunication",
+]
+
+# Запросы, которые отсекаются в throughput-профиле: картинки, шрифты, медиа
+BLOCKED_EXTENSIONS = [
+    "jpg", "jpeg", "png", "gif", "webp", "avif", "svg", "ico",
+    "woff", "woff2", "ttf", "otf", "eot",
+    "mp4", "webm", "m3u8", "mp3", "ogg",
+]
+
+# Network.setBlockedURLs сравнивает шаблон со всем URL: картинки CDN почти
+# всегда с query (img.jpg?w=516), поэтому на каждое расширение два шаблона
+BLOCKED_URLS = [f"*.{extension}{suffix}" for extension in BLOCKED_EXTENSIONS
+                for suffix in ("", "?*")]
+
+
+def apply_throughput_options(options):
+    """Headless, фиксированный viewport, без картинок и фоновых служб"""
+    for argument in THROUGHPUT_ARGUMENTS:
+        options.add_argument(argument)
+    options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.notifications": 2,
+    })
+    return options
+
+
+def is_blocked(url: str) -> bool:
+    """Заблокирует ли Chrome запрос: шаблоны с * по всему URL, как в CDP"""
+    return any(fnmatch.fnmatchcase(url, pattern) for pattern in BLOCKED_URLS)
+
+
+def block_resources(driver, profile: str):
+    """Включить блокировку картинок, шрифтов и медиа для текущей вкладки.
+
+    Блокировка CDP действует на вкладку, поэтому вызывается после каждого reset пула.
+    """
+    if profile != THROUGHPUT_PROFILE:
+        return
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
+    except (AttributeError, WebDriverException) as e:
+        logger.warning(f"Не удалось включить блокировку ресурсов: {e}")
+
+
+def _browser_processes(driver) -> List[psutil.Process]:
+    """chromedriver и все дочерние процессы Chrome"""
+    try:
+        root = psutil.Process(driver.service.process.pid)
+        return [root] + root.children(recursive=True)
+    except (AttributeError, psutil.Error):
+        return []
+
+
+def _sample(processes):
+    rss = cpu = 0.0
+    for process in processes:
+        try:
+            rss += process.memory_info().rss
+            times = process.cpu_times()
+            cpu += times.user + times.system
+        except psutil.Error:
+            continue
+    return rss, cpu
+
+
+@dataclass
+class ResourceUsage:
+    """Потребление браузера за один тест"""
+    test: str
+    duration: float
+    cpu_seconds: float
+    peak_rss: float
+
+    @property
+    def cpu_percent(self) -> float:
+        """Средняя загрузка в процентах одного ядра"""
+        return 100 * self.cpu_seconds / self.duration if self.duration else 0.0
+
+
+class ResourceMonitor:
+    """Замер CPU и пиковой памяти дерева процессов браузера во время теста"""
+
+    def __init__(self, driver, test: str, interval: float = 0.5):
+        self.driver = driver
+        self.test = test
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._peak_rss = 0.0
+        self._cpu_start = 0.0
+        self._started = 0.0
+
+    def _watch(self):
+        while not self._stop.wait(self.interval):
+            rss, _ = _sample(_browser_processes(self.driver))
+            self._peak_rss = max(self._peak_rss, rss)
+
+    def start(self) -> "ResourceMonitor":
+        rss, self._cpu_start = _sample(_browser_processes(self.driver))
+        self._peak_rss = rss
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(target=self._watch, name="resource-monitor", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> ResourceUsage:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        # CPU считаем по процессам, живым в конце теста: вкладки, закрытые раньше, не учтутся
+        rss, cpu = _sample(_browser_processes(self.driver))
+        self._peak_rss = max(self._peak_rss, rss)
+        return ResourceUsage(
+            test=self.test,
+            duration=time.perf_counter() - self._started,
+            cpu_seconds=max(0.0, cpu - self._cpu_start),
+            peak_rss=self._peak_rss,
+        )
+
+
+def format_usage(usages: List[ResourceUsage], profile: str) -> List[str]:
+    """Таблица потребления по тестам и оценка числа воркеров для этой машины"""
+    mb = 1024 * 1024
+    lines = [f"profile: {profile}",
+             f"{'test':<60} {'time, s':>8} {'cpu, %':>7} {'rss, MB':>8}"]
+    for usage in sorted(usages, key=lambda u: u.peak_rss, reverse=True):
+        lines.append(f"{usage.test[-60:]:<60} {usage.duration:>8.1f} "
+                     f"{usage.cpu_percent:>7.0f} {usage.peak_rss / mb:>8.0f}")
+
+    peak_rss = max(u.peak_rss for u in usages)
+    busy = sum(u.cpu_seconds for u in usages) / max(sum(u.duration for u in usages), 1e-9)
+    memory_bound = int(psutil.virtual_memory().available * 0.8 // peak_rss) if peak_rss else 0
+    cpu_bound = int((psutil.cpu_count() or 1) // max(busy, 0.1))
+    lines.append(f"peak rss={peak_rss / mb:.0f} MB, avg cpu={busy * 100:.0f}% of a core; "
+                 f"workers by memory≈{memory_bound}, by cpu≈{cpu_bound}")
+    return lines
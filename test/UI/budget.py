@@ -0,0 +1,134 @@
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+from selenium.common.exceptions import TimeoutException
+
+
+class BudgetExceeded(TimeoutException):
+    """Время теста или сценария вышло: дальнейшие ожидания не начинаются"""
+
+
+class StepUsage:
+    """Ожидания одного шага в пределах бюджета"""
+    __slots__ = ("waits", "requested", "granted", "used", "timeouts")
+
+    def __init__(self):
+        self.waits = 0
+        self.requested = 0.0
+        self.granted = 0.0
+        self.used = 0.0
+        self.timeouts = 0
+
+
+class TimeBudget:
+    """Общий дедлайн теста, из которого берут время все ожидания page objects.
+
+    Таймаут каждого ожидания урезается до остатка бюджета, поэтому один
+    пропавший элемент не съедает 10-15 с сверх лимита. flow() задает
+    вложенный дедлайн для части сценария (например, оформления заказа).
+    """
+
+    def __init__(self, name: str, seconds: Optional[float]):
+        self.name = name
+        self.seconds = seconds
+        self.started = time.perf_counter()
+        self.finished: Optional[float] = None
+        # Стек дедлайнов: тест, затем вложенные сценарии
+        self._deadlines: List[Tuple[str, float]] = []
+        if seconds:
+            self._deadlines.append((name, self.started + seconds))
+        self._flows: List[str] = []
+        self._lock = threading.Lock()
+        self.steps: Dict[str, StepUsage] = defaultdict(StepUsage)
+        self.flows: List[Tuple[str, float, float]] = []
+
+    @property
+    def limited(self) -> bool:
+        return bool(self._deadlines)
+
+    def remaining(self) -> float:
+        if not self._deadlines:
+            return float("inf")
+        return max(0.0, min(deadline for _, deadline in self._deadlines) - time.perf_counter())
+
+    def used(self) -> float:
+        return (self.finished or time.perf_counter()) - self.started
+
+    def start(self):
+        """Начать отсчет заново: подготовка теста (запуск браузера) не тратит бюджет"""
+        self.started = time.perf_counter()
+        if self.seconds:
+            self._deadlines[0] = (self.name, self.started + self.seconds)
+
+    def finish(self):
+        self.finished = time.perf_counter()
+
+    def grant(self, timeout: float) -> float:
+        """Сколько можно ждать из запрошенного timeout"""
+        return min(timeout, self.remaining())
+
+    def check(self):
+        """Бросить BudgetExceeded, если время любого из вложенных дедлайнов вышло"""
+        if self.limited and self.remaining() <= 0:
+            expired = min(self._deadlines, key=lambda item: item[1])[0]
+            raise BudgetExceeded(f"Бюджет времени '{expired}' исчерпан "
+                                 f"через {self.used():.1f} с от начала теста")
+
+    def record(self, step: Optional[str], requested: float, granted: float, used: float,
+               found: bool):
+        key = "/".join(self._flows + [step or "-"])
+        with self._lock:
+            usage = self.steps[key]
+            usage.waits += 1
+            usage.requested += requested
+            usage.granted += granted
+            usage.used += used
+            usage.timeouts += not found
+
+    @contextmanager
+    def flow(self, name: str, seconds: float):
+        """Вложенный дедлайн: не дольше seconds и не дольше остатка внешнего бюджета"""
+        started = time.perf_counter()
+        self._deadlines.append((name, started + seconds))
+        self._flows.append(name)
+        try:
+            yield self
+        finally:
+            self._flows.pop()
+            self._deadlines.pop()
+            self.flows.append((name, seconds, time.perf_counter() - started))
+
+    def report(self) -> str:
+        """Потребление бюджета по шагам: сколько просили, сколько дали, сколько ждали"""
+        limit = f"{self.seconds:g} s" if self.seconds else "без лимита"
+        lines = [f"budget {self.name}: {limit}, used {self.used():.1f} s"]
+        for name, seconds, used in self.flows:
+            mark = "exceeded" if used > seconds else "ok"
+            lines.append(f"  flow {name}: {used:.1f} / {seconds:g} s ({mark})")
+        lines.append(f"  {'step':<50} {'waits':>5} {'asked s':>8} {'given s':>8} "
+                     f"{'waited s':>8} {'timeouts':>8}")
+        for key, usage in sorted(self.steps.items(), key=lambda item: item[1].used, reverse=True):
+            lines.append(f"  {key[-50:]:<50} {usage.waits:>5} {usage.requested:>8.1f} "
+                         f"{usage.granted:>8.1f} {usage.used:>8.1f} {usage.timeouts:>8}")
+        return "\n".join(lines)
+
+
+_local = threading.local()
+
+
+def current_budget() -> TimeBudget:
+    """Бюджет текущего теста в этом потоке; без него - новый неограниченный, записи не копятся"""
+    return getattr(_local, "budget", None) or TimeBudget("unlimited", None)
+
+
+@contextmanager
+def activate(budget: TimeBudget):
+    previous = getattr(_local, "budget", None)
+    _local.budget = budget
+    try:
+        yield budget
+    finally:
+        _local.budget = previous
@@ -1,19 +1,129 @@
 import pytest
+import allure
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 import os
 from dotenv import load_dotenv
+from browser_pool import BrowserPool
+from driver_resolver import resolve_chromedriver
+from waits import WAIT_STATS
+from fixture_server import FixtureSiteServer
+from pages import BasePage
+from browser_profile import (DEFAULT_PROFILE, PROFILES, THROUGHPUT_PROFILE, ResourceMonitor,
+                             apply_throughput_options, block_resources, format_usage)
+import sharding
+from step_profiler import PROFILER, attach_profile
+from locators import REGISTRY
+from budget import TimeBudget, activate
+from traffic_cache import CACHE, MODES as TRAFFIC_MODES, TrafficCacheProxy, format_traffic
 
 # Загрузка переменных окружения
 load_dotenv()
-@pytest.fixture
-def driver():
 
+# Пулы браузеров сессии для итоговой сводки
+BROWSER_POOLS = []
+
+# Потребление CPU и памяти браузером по тестам
+RESOURCE_USAGE = []
+
+# Попадания в кэш трафика по тестам
+TRAFFIC_STATS = []
+
+# Бюджеты времени завершенных тестов
+TIME_BUDGETS = []
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--wb-offline",
+        action="store_true",
+        default=os.getenv("WB_OFFLINE") == "1",
+        help="Запускать тесты Wildberries против локальных снимков страниц"
+    )
+    parser.addoption(
+        "--browser-profile",
+        choices=PROFILES,
+        default=os.getenv("UI_BROWSER_PROFILE", DEFAULT_PROFILE),
+        help="Профиль браузера: default - обычный Chrome, "
+             "throughput - headless без картинок, шрифтов и медиа"
+    )
+    parser.addoption(
+        "--traffic-cache",
+        default=os.getenv("UI_TRAFFIC_CACHE"),
+        help="Каталог кэша трафика: Chrome ходит в сеть через локальный прокси с записью ответов"
+    )
+    parser.addoption(
+        "--traffic-mode",
+        choices=TRAFFIC_MODES,
+        default=os.getenv("UI_TRAFFIC_MODE", CACHE),
+        help="record - перезаписать ответы из сети, replay - только из кэша без сети, "
+             "cache - из кэша, промахи из сети"
+    )
+    parser.addoption(
+        "--validate-locators",
+        action="store_true",
+        default=os.getenv("UI_VALIDATE_LOCATORS") == "1",
+        help="Перед тестами проверить все локаторы страниц на локальных снимках"
+    )
+    parser.addoption(
+        "--test-budget",
+        type=float,
+        default=float(os.getenv("UI_TEST_BUDGET", "180")),
+        help="Бюджет времени теста в секундах, из которого берут время все ожидания; "
+             "0 - без лимита. Переопределяется маркером budget(seconds)"
+    )
+    sharding.add_options(parser)
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "budget(seconds): бюджет времени теста вместо --test-budget")
+    # Порядок тестов и шардинг по истории длительностей (см. sharding.py)
+    config.pluginmanager.register(sharding.DurationScheduler(config), "duration-scheduler")
+    # Профиль шагов: UI_STEP_PROFILE=0 отключает перехват команд и ожиданий
+    if os.getenv("UI_STEP_PROFILE", "1") != "0":
+        PROFILER.install()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    """Профиль шагов теста без фикстур: к отчету Allure прикладывается разбивка времени"""
+    PROFILER.begin_test(item.name)
+    yield
+    samples = PROFILER.end_test()
+    if samples:
+        attach_profile(samples)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def wb_base_url(request):
+    """Адрес Wildberries для page objects: боевой сайт или локальный сервер снимков"""
+    if not request.config.getoption("--wb-offline"):
+        yield BasePage.base_url
+        return
+
+    previous = BasePage.base_url
+    with FixtureSiteServer() as server:
+        BasePage.base_url = server.base_url
+        yield server.base_url
+    BasePage.base_url = previous
+
+
+def create_driver(profile=DEFAULT_PROFILE, proxy=None):
+    """Запустить новый Chrome с настройками для тестов"""
     options = webdriver.ChromeOptions()
 
-    ## Указывает Chrome запускаться в полноэкранном режиме.
-    options.add_argument("--start-maximized")
+    if proxy is not None:
+        ## Трафик через кэширующий прокси; его сертификаты для HTTPS браузер принимает без проверки.
+        for argument in proxy.chrome_arguments():
+            options.add_argument(argument)
+        options.accept_insecure_certs = True
+
+    if profile == THROUGHPUT_PROFILE:
+        ## Headless с фиксированным окном, без картинок и фоновых служб Chrome.
+        apply_throughput_options(options)
+    else:
+        ## Указывает Chrome запускаться в полноэкранном режиме.
+        options.add_argument("--start-maximized")
 
     ## Отключает уведомления браузера (всплывающие окна, оповещающие о новых сообщениях или обновлениях)
     options.add_argument("--disable-notifications")
@@ -27,13 +137,128 @@ def driver():
     ## Отключает расширение, помогающее в автоматизации, что делает бота менее заметным.
     options.add_experimental_option('useAutomationExtension', False)
 
-    service = Service(ChromeDriverManager().install())
+    service = Service(resolve_chromedriver())
     driver = webdriver.Chrome(service=service, options=options)
-    driver.implicitly_wait(10)
+    ## Без неявного ожидания: оно складывается с каждым явным ожиданием page objects.
+    ## Задается один раз при запуске, поэтому одинаково для всех тестов на браузере из пула.
+    driver.implicitly_wait(0)
+    return driver
+
+
+@pytest.fixture(scope="session")
+def browser_profile(request):
+    """Профиль браузера: --browser-profile или UI_BROWSER_PROFILE"""
+    return request.config.getoption("--browser-profile")
+
+
+@pytest.fixture(scope="session")
+def traffic_proxy(request):
+    """Кэширующий прокси воркера, если задан --traffic-cache; каталог общий для воркеров"""
+    store_dir = request.config.getoption("--traffic-cache")
+    if not store_dir:
+        yield None
+        return
+    with TrafficCacheProxy(request.config.rootpath / store_dir,
+                           mode=request.config.getoption("--traffic-mode")) as proxy:
+        yield proxy
+
+
+@pytest.fixture(scope="session")
+def browser_pool(browser_profile, traffic_proxy):
+    """Пул прогретых браузеров на воркер.
+
+    UI_POOL_SIZE - сколько браузеров держать запущенными,
+    UI_POOL_MAX_USES - после скольких тестов браузер пересоздается.
+    """
+    pool = BrowserPool(
+        lambda: create_driver(browser_profile, traffic_proxy),
+        size=int(os.getenv("UI_POOL_SIZE", "1")),
+        max_uses=int(os.getenv("UI_POOL_MAX_USES", "20")),
+    )
+    pool.prewarm()
+    yield pool
+
+    pool.close()
+    BROWSER_POOLS.append(pool)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def locator_health(request):
+    """Проверка локаторов на снимках страниц: сломанные видны в сводке до первого таймаута"""
+    if not request.config.getoption("--validate-locators"):
+        return None
+    pool = request.getfixturevalue("browser_pool")
+    driver = pool.acquire()
+    try:
+        with FixtureSiteServer() as server:
+            return REGISTRY.validate(driver, server.base_url)
+    finally:
+        pool.release(driver)
+
+
+@pytest.fixture(autouse=True)
+def time_budget(request):
+    """Дедлайн теста для всех ожиданий; with time_budget.flow("оформление", 30) - для части сценария"""
+    marker = request.node.get_closest_marker("budget")
+    seconds = marker.args[0] if marker else request.config.getoption("--test-budget")
+    budget = TimeBudget(request.node.nodeid, seconds or None)
+    with activate(budget):
+        yield budget
+    budget.finish()
+    TIME_BUDGETS.append(budget)
+    if budget.steps:
+        allure.attach(budget.report(), name="time budget",
+                      attachment_type=allure.attachment_type.TEXT)
+
+
+@pytest.fixture
+def driver(request, browser_pool, browser_profile, traffic_proxy, time_budget):
+    driver = browser_pool.acquire()
+    block_resources(driver, browser_profile)
+    monitor = ResourceMonitor(driver, request.node.nodeid).start()
+    if traffic_proxy is not None:
+        traffic_proxy.begin(request.node.nodeid)
+    ## Холодный запуск Chrome или пересоздание браузера пулом не идут в бюджет ожиданий
+    time_budget.start()
 
     yield driver
 
-    driver.quit()
+    RESOURCE_USAGE.append(monitor.stop())
+    if traffic_proxy is not None:
+        TRAFFIC_STATS.append(traffic_proxy.end())
+    browser_pool.release(driver)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    for pool in BROWSER_POOLS:
+        terminalreporter.section("browser pool")
+        terminalreporter.write_line(pool.stats())
+    if WAIT_STATS.calls:
+        terminalreporter.section("waits")
+        terminalreporter.write_line(WAIT_STATS.summary())
+    if PROFILER.actions:
+        terminalreporter.section("slowest page actions")
+        for line in PROFILER.summary():
+            terminalreporter.write_line(line)
+    if RESOURCE_USAGE:
+        terminalreporter.section("browser resources")
+        for line in format_usage(RESOURCE_USAGE, config.getoption("--browser-profile")):
+            terminalreporter.write_line(line)
+    locator_lines = REGISTRY.report()
+    if locator_lines:
+        terminalreporter.section("locator health")
+        for line in locator_lines:
+            terminalreporter.write_line(line)
+    spent = [budget for budget in TIME_BUDGETS if budget.limited and budget.steps]
+    if spent:
+        terminalreporter.section("time budgets")
+        spent.sort(key=lambda budget: budget.used() / budget.seconds, reverse=True)
+        for budget in spent[:5]:
+            terminalreporter.write_line(budget.report())
+    if TRAFFIC_STATS:
+        terminalreporter.section("traffic cache")
+        for line in format_traffic(TRAFFIC_STATS, config.getoption("--traffic-mode")):
+            terminalreporter.write_line(line)
 
 @pytest.fixture
 def test_data():
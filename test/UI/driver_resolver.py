@@ -0,0 +1,108 @@
+import json
+import logging
+import os
+import re
+import shutil
+import subprocess
+from pathlib import Path
+from typing import Optional
+
+from filelock import FileLock
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = Path(os.getenv("CHROMEDRIVER_CACHE_DIR", Path.home() / ".cache" / "ui-tests"))
+CACHE_FILE = CACHE_DIR / "chromedriver.json"
+LOCK_FILE = CACHE_DIR / "chromedriver.lock"
+
+CHROME_COMMANDS = [
+    ["google-chrome", "--version"],
+    ["google-chrome-stable", "--version"],
+    ["chromium", "--version"],
+    ["chromium-browser", "--version"],
+    ["/Applications/Google Chrome.app/Contents/MacOS/Google Chrome", "--version"],
+    ["reg", "query", r"HKEY_CURRENT_USER\Software\Google\Chrome\BLBeacon", "/v", "version"],
+]
+
+# Путь, найденный в этом процессе: повторные вызовы не трогают ни диск, ни сеть
+_resolved: Optional[str] = None
+
+
+def detect_chrome_version() -> Optional[str]:
+    """Мажорная версия установленного Chrome без обращения к сети"""
+    for command in CHROME_COMMANDS:
+        try:
+            output = subprocess.run(command, capture_output=True, text=True, timeout=10).stdout
+        except (OSError, subprocess.SubprocessError):
+            continue
+        match = re.search(r"(\d+)\.\d+\.\d+\.\d+", output)
+        if match:
+            return match.group(1)
+    return None
+
+
+def _load_cache() -> dict:
+    try:
+        return json.loads(CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _download(version_key: str) -> str:
+    """Скачать драйвер через webdriver-manager (нужна сеть)"""
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    logger.info(f"chromedriver для Chrome {version_key} не найден в кэше, скачиваем")
+    return ChromeDriverManager().install()
+
+
+def _fetch(version_key: str) -> str:
+    """Скачать драйвер, а без сети - взять chromedriver из PATH"""
+    try:
+        return _download(version_key)
+    except Exception as e:
+        path = shutil.which("chromedriver")
+        if path is None:
+            raise RuntimeError(
+                f"chromedriver для Chrome {version_key} нет в кэше {CACHE_FILE}, "
+                f"а скачать его не удалось: {e}. Укажите CHROMEDRIVER_PATH"
+            ) from e
+        logger.warning(f"Не удалось скачать chromedriver ({e}), используем {path}")
+        return path
+
+
+def resolve_chromedriver() -> str:
+    """Путь к chromedriver: один раз на процесс, из кэша на машине, сеть - только при промахе.
+
+    Кэш общий для воркеров xdist и защищен файловой блокировкой. Если версию
+    Chrome определить не удалось, кэш не используется: драйвер под одним ключом
+    для разных версий браузера устарел бы после обновления Chrome.
+    """
+    global _resolved
+    if _resolved and os.path.exists(_resolved):
+        return _resolved
+
+    env_path = os.getenv("CHROMEDRIVER_PATH")
+    if env_path:
+        _resolved = env_path
+        return _resolved
+
+    version_key = detect_chrome_version()
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    with FileLock(str(LOCK_FILE)):
+        if version_key is None:
+            logger.warning("Версия Chrome не определена, chromedriver не кэшируется")
+            path = _fetch("unknown")
+        else:
+            cache = _load_cache()
+            path = cache.get(version_key)
+            if not path or not os.path.exists(path):
+                path = _fetch(version_key)
+                cache[version_key] = path
+                tmp_file = CACHE_FILE.with_suffix(".tmp")
+                tmp_file.write_text(json.dumps(cache, indent=2), encoding="utf-8")
+                os.replace(tmp_file, CACHE_FILE)
+
+    logger.info(f"chromedriver: {path} (Chrome {version_key or 'unknown'})")
+    _resolved = path
+    return _resolved
\ No newline at end of file
@@ -0,0 +1,87 @@
+import logging
+import re
+import threading
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+FIXTURE_ROOT = Path(__file__).parent / "fixture_site"
+
+# Пути сайта -> снимки страниц
+ROUTES = [
+    (re.compile(r"^/$"), "index.html"),
+    (re.compile(r"^/catalog/0/search\.aspx$"), "search.html"),
+    (re.compile(r"^/catalog/\d+/detail\.aspx$"), "product.html"),
+    (re.compile(r"^/lk/basket/?$"), "cart.html"),
+    (re.compile(r"^/lk/basket/checkout/?$"), "checkout.html"),
+]
+
+
+class FixtureSiteServer:
+    """Локальный сервер со снимками страниц Wildberries"""
+
+    def __init__(self, root: Path = FIXTURE_ROOT, host: str = "127.0.0.1", port: int = 0):
+        self.root = Path(root)
+        self.server = ThreadingHTTPServer((host, port), self._make_handler())
+        self.server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FixtureSiteServer":
+        """Запустить сервер в фоновом потоке"""
+        self._thread = threading.Thread(target=self.server.serve_forever,
+                                        name="fixture-site", daemon=True)
+        self._thread.start()
+        logger.info(f"Fixture site started at {self.base_url}")
+        return self
+
+    def stop(self):
+        """Остановить сервер"""
+        self.server.shutdown()
+        self.server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "FixtureSiteServer":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _make_handler(self):
+        root = str(self.root)
+
+        class Handler(SimpleHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, directory=root, **kwargs)
+
+            def translate_path(self, path):
+                route = urlsplit(path).path
+                for pattern, page in ROUTES:
+                    if pattern.match(route):
+                        return super().translate_path("/" + page)
+                return super().translate_path(path)
+
+            def do_POST(self):
+                # Заглушка API сайта: корзина, авторизация
+                length = int(self.headers.get("Content-Length") or 0)
+                if length:
+                    self.rfile.read(length)
+                self.send_response(204)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, format, *args):
+                logger.debug("fixture site: " + format % args)
+
+        return Handler
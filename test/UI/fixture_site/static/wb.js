@@ -0,0 +1,182 @@
+// Поведение снимков страниц Wildberries: шапка, поиск, корзина в localStorage
+(function () {
+    var BASKET_KEY = "fixture-basket";
+
+    function readBasket() {
+        try {
+            return JSON.parse(window.localStorage.getItem(BASKET_KEY)) || [];
+        } catch (e) {
+            return [];
+        }
+    }
+
+    function writeBasket(items) {
+        window.localStorage.setItem(BASKET_KEY, JSON.stringify(items));
+    }
+
+    function ping(path) {
+        // Имитация запроса к API корзины, чтобы ожидания сети видели активность
+        return window.fetch(path, {method: "POST"}).catch(function () {});
+    }
+
+    function addToBasket(product) {
+        var items = readBasket();
+        var existing = items.filter(function (item) { return item.id === product.id; })[0];
+        if (existing) {
+            existing.quantity += 1;
+        } else {
+            items.push({id: product.id, name: product.name, price: product.price, quantity: 1});
+        }
+        writeBasket(items);
+        return ping("/api/basket/add");
+    }
+
+    function formatPrice(value) {
+        return value.toLocaleString("ru-RU") + " ₽";
+    }
+
+    function bindHeader() {
+        var cookie = document.querySelector(".cookies__btn");
+        if (cookie) {
+            cookie.addEventListener("click", function () {
+                document.querySelector(".cookies").remove();
+            });
+        }
+
+        var input = document.getElementById("searchInput");
+        var search = function () {
+            var query = encodeURIComponent(input.value.trim());
+            window.location.href = "/catalog/0/search.aspx?search=" + query;
+        };
+        document.getElementById("applySearchBtn").addEventListener("click", search);
+        input.addEventListener("keydown", function (event) {
+            if (event.key === "Enter") { search(); }
+        });
+        if (input.form) {
+            input.form.addEventListener("submit", function (event) {
+                event.preventDefault();
+                search();
+            });
+        }
+
+        var burger = document.querySelector(".nav-element__burger");
+        burger.addEventListener("click", function () {
+            document.querySelector(".menu.catalog").classList.toggle("hidden");
+        });
+
+        var login = document.querySelector("[data-wba-header-name='Login']");
+        login.addEventListener("click", function (event) {
+            event.preventDefault();
+            document.querySelector(".auth-popup").classList.remove("hidden");
+        });
+        document.querySelector(".popup__close").addEventListener("click", function () {
+            document.querySelector(".auth-popup").classList.add("hidden");
+        });
+        document.getElementById("requestCode").addEventListener("click", function () {
+            ping("/api/auth/code").then(function () {
+                document.querySelector(".auth-popup__code").classList.remove("hidden");
+            });
+        });
+    }
+
+    function bindSearch() {
+        var params = new URLSearchParams(window.location.search);
+        var query = (params.get("search") || "").toLowerCase();
+        var cards = document.querySelectorAll("article.product-card");
+        var visible = 0;
+        cards.forEach(function (card) {
+            var match = !query || card.getAttribute("data-tags").indexOf(query) !== -1;
+            if (match) { visible += 1; } else { card.remove(); }
+        });
+        document.querySelector(".searching-results__count").textContent = visible;
+        document.querySelectorAll(".product-card__add-basket").forEach(function (button) {
+            button.addEventListener("click", function (event) {
+                event.preventDefault();
+                var card = button.closest("article.product-card");
+                addToBasket({
+                    id: card.getAttribute("data-nm-id"),
+                    name: card.querySelector(".product-card__name").textContent.trim(),
+                    price: parseInt(card.getAttribute("data-price"), 10)
+                });
+            });
+        });
+    }
+
+    function bindProduct() {
+        document.querySelectorAll(".sizesListButton--WuH9K").forEach(function (button) {
+            button.addEventListener("click", function () {
+                document.querySelectorAll(".sizesListButton--WuH9K").forEach(function (other) {
+                    other.classList.remove("active");
+                });
+                button.classList.add("active");
+            });
+        });
+        var product = document.querySelector(".product-page");
+        document.querySelector(".order__button").addEventListener("click", function () {
+            addToBasket({
+                id: product.getAttribute("data-nm-id"),
+                name: document.querySelector(".productTitle--J2W7I").textContent.trim(),
+                price: parseInt(product.getAttribute("data-price"), 10)
+            }).then(function () {
+                document.querySelector(".order__go-to-cart").classList.remove("hidden");
+            });
+        });
+    }
+
+    function renderBasket() {
+        var items = readBasket();
+        var container = document.querySelector(".basket-page__content");
+        container.innerHTML = "";
+        if (!items.length) {
+            container.innerHTML = '<h1 class="basket-empty__title">В корзине пока пусто</h1>';
+            return;
+        }
+        var list = document.createElement("div");
+        list.className = "basketList";
+        var total = 0;
+        items.forEach(function (item, index) {
+            total += item.price * item.quantity;
+            var row = document.createElement("div");
+            row.className = "list-item j-b-basket-item";
+            row.innerHTML =
+                '<div class="good-info"><span class="good-info__good-name">' + item.name + '</span></div>' +
+                '<div class="count">' +
+                '<button class="count__minus minus' + (item.quantity > 1 ? '' : ' disabled') + '">−</button>' +
+                '<input class="count__input" value="' + item.quantity + '">' +
+                '<button class="count__plus plus">+</button></div>' +
+                '<div class="list-item__price-wallet list-item__price-wallet--wb-wallet-icon red-price">' +
+                formatPrice(item.price * item.quantity) + '</div>' +
+                '<button class="btn__del j-basket-item-del">Удалить</button>';
+            row.querySelector(".btn__del").addEventListener("click", function () {
+                items.splice(index, 1);
+                writeBasket(items);
+                ping("/api/basket/remove").then(renderBasket);
+            });
+            row.querySelector(".count__plus").addEventListener("click", function () {
+                item.quantity += 1;
+                writeBasket(items);
+                ping("/api/basket/update").then(renderBasket);
+            });
+            list.appendChild(row);
+        });
+        container.appendChild(list);
+
+        var side = document.createElement("div");
+        side.className = "basket-order";
+        side.innerHTML =
+            '<p class="b-top__total line"><span>Итого</span> <span>' + formatPrice(total) + '</span></p>' +
+            '<button class="basket-order__b-btn b-btn-do-order btn-main">Заказать</button>';
+        side.querySelector("button").addEventListener("click", function () {
+            window.location.href = "/lk/basket/checkout";
+        });
+        container.appendChild(side);
+    }
+
+    document.addEventListener("DOMContentLoaded", function () {
+        bindHeader();
+        var page = document.body.getAttribute("data-page");
+        if (page === "search") { bindSearch(); }
+        if (page === "product") { bindProduct(); }
+        if (page === "cart") { renderBasket(); }
+    });
+})();
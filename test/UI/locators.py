@@ -0,0 +1,283 @@
+import json
+import re
+import threading
+import time
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional, Tuple
+
+from selenium.common.exceptions import (InvalidSelectorException, NoSuchElementException,
+                                        StaleElementReferenceException, TimeoutException,
+                                        WebDriverException)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+
+Strategy = Tuple[str, str]
+
+# Считает совпадения одной стратегии в документе: -1 - выражение не разбирается браузером
+COUNT_SCRIPT = """
+var by = arguments[0], value = arguments[1];
+try {
+    if (by === 'xpath') {
+        return document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null).snapshotLength;
+    }
+    return document.querySelectorAll(value).length;
+} catch (e) {
+    return -1;
+}
+"""
+
+# Теги HTML, которые законно стоят после пробела в CSS (потомок), а не класс без точки
+HTML_TAGS = frozenset(
+    "a abbr article aside b body button div em footer form h1 h2 h3 h4 h5 h6 header i img "
+    "input ins label li main nav ol option p picture section select small source span strong "
+    "svg table tbody td textarea th thead tr ul video".split()
+)
+
+
+def script_query(strategy: Strategy) -> Tuple[str, str]:
+    """Стратегия Selenium -> (xpath|css, выражение) для скриптов в браузере"""
+    by, value = strategy
+    if by == By.XPATH:
+        return "xpath", value
+    if by == By.ID:
+        return "css", f"#{value}"
+    if by == By.NAME:
+        return "css", f"[name='{value}']"
+    if by == By.CLASS_NAME:
+        return "css", f".{value}"
+    if by in (By.TAG_NAME, By.CSS_SELECTOR):
+        return "css", value
+    raise ValueError(f"Скрипт не поддерживает локатор {by}")
+
+
+class Locator(tuple):
+    """Локатор Selenium (by, value) с запасными стратегиями.
+
+    Остается кортежем из двух элементов, поэтому работает везде, где
+    ожидается обычный локатор. Имя (MainPage.SEARCH_INPUT) выставляется
+    при объявлении в классе страницы, и локатор попадает в реестр.
+    optional - элемент есть только в некоторых состояниях страницы,
+    его отсутствие на снимке не ошибка.
+    """
+
+    def __new__(cls, by: str, value: str, *fallbacks: Strategy, optional: bool = False):
+        locator = super().__new__(cls, (by, value))
+        locator.fallbacks = tuple(tuple(fallback) for fallback in fallbacks)
+        locator.optional = optional
+        locator.name = f"{by}={value}"
+        locator.owner = None
+        return locator
+
+    def __getnewargs_ex__(self):
+        return (self[0], self[1]) + self.fallbacks, {"optional": self.optional}
+
+    def __set_name__(self, owner, name):
+        if self.owner is None:
+            self.owner = owner
+            self.name = f"{owner.__name__}.{name}"
+            REGISTRY.register(self)
+
+    @property
+    def strategies(self) -> List[Strategy]:
+        return [(self[0], self[1])] + list(self.fallbacks)
+
+    def __repr__(self):
+        return f"{self.name}({self[0]}={self[1]!r})"
+
+
+def lint(strategy: Strategy) -> Optional[str]:
+    """Ошибки записи, из-за которых локатор не найдет ничего и съест весь таймаут"""
+    by, value = strategy
+    if by == By.CLASS_NAME and re.search(r"\s", value.strip()):
+        return "CLASS_NAME с несколькими классами через пробел"
+    if by == By.CSS_SELECTOR:
+        # Без содержимого [атрибутов] и строк: там пробелы законны
+        bare = re.sub(r"\[[^\]]*\]|'[^']*'|\"[^\"]*\"", "", value)
+        for part in bare.split(","):
+            for token in part.split()[1:]:
+                if re.fullmatch(r"[a-z][\w-]*", token) and token not in HTML_TAGS:
+                    return f"пробел вместо точки перед классом '{token}'"
+    return None
+
+
+class StrategyStats:
+    __slots__ = ("probes", "matches", "time")
+
+    def __init__(self):
+        self.probes = 0
+        self.matches = 0
+        self.time = 0.0
+
+    @property
+    def average(self) -> float:
+        return self.time / self.probes if self.probes else 0.0
+
+
+class LocatorStats:
+    """Поиски одного локатора за сессию"""
+
+    def __init__(self):
+        self.lookups = 0
+        self.hits = 0
+        self.time = 0.0
+        self.wasted = 0.0
+        self.strategies: Dict[Strategy, StrategyStats] = defaultdict(StrategyStats)
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.lookups if self.lookups else 0.0
+
+
+class LocatorRegistry:
+    """Реестр локаторов страниц: проверка на снимках, статистика и порядок стратегий.
+
+    Первой пробуется стратегия, которая уже находила элемент и делает это
+    быстрее других; непроверенные идут следом в порядке объявления.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.locators: Dict[str, Locator] = {}
+        self.stats: Dict[str, LocatorStats] = defaultdict(LocatorStats)
+        # Результат проверки на снимках: имя -> [(стратегия, число совпадений)]
+        self.health: Dict[str, List[Tuple[Strategy, int]]] = {}
+
+    def register(self, locator: Locator):
+        self.locators[locator.name] = locator
+
+    @staticmethod
+    def name_of(locator) -> str:
+        return getattr(locator, "name", None) or f"{locator[0]}={locator[1]}"
+
+    def ordered(self, locator) -> List[Strategy]:
+        strategies = getattr(locator, "strategies", None) or [tuple(locator)]
+        if len(strategies) == 1:
+            return strategies
+        with self._lock:
+            known = self.stats[self.name_of(locator)].strategies
+            proven = [s for s in strategies if known.get(s) and known[s].matches]
+            proven.sort(key=lambda s: known[s].average)
+            return proven + [s for s in strategies if s not in proven]
+
+    def probe(self, locator, strategy: Strategy, elapsed: float, matched: bool):
+        with self._lock:
+            stats = self.stats[self.name_of(locator)].strategies[strategy]
+            stats.probes += 1
+            stats.matches += matched
+            stats.time += elapsed
+
+    def resolved(self, locator, found: bool, elapsed: float):
+        with self._lock:
+            stats = self.stats[self.name_of(locator)]
+            stats.lookups += 1
+            stats.hits += found
+            stats.time += elapsed
+            if not found:
+                stats.wasted += elapsed
+
+    # --- поиск ---
+
+    def wait_for(self, driver, locator, condition: Callable, timeout: float, poll: float = 0.1):
+        """Дождаться condition(стратегия)(driver) по любой стратегии локатора.
+
+        За один опрос стратегии проверяются по порядку, первая сработавшая
+        побеждает. По истечении timeout - TimeoutException, время учитывается
+        как потраченное впустую.
+        """
+        checks = [(strategy, condition(strategy)) for strategy in self.ordered(locator)]
+
+        def _any(driver):
+            for strategy, check in checks:
+                started = time.perf_counter()
+                try:
+                    result = check(driver)
+                except (NoSuchElementException, StaleElementReferenceException,
+                        InvalidSelectorException):
+                    result = False
+                self.probe(locator, strategy, time.perf_counter() - started, bool(result))
+                if result:
+                    return result
+            return False
+
+        started = time.perf_counter()
+        try:
+            result = WebDriverWait(driver, timeout, poll_frequency=poll).until(_any)
+        except TimeoutException:
+            self.resolved(locator, False, time.perf_counter() - started)
+            raise
+        self.resolved(locator, True, time.perf_counter() - started)
+        return result
+
+    # --- проверка на снимках ---
+
+    def validate(self, driver, base_url: str) -> Dict[str, List[Tuple[Strategy, int]]]:
+        """Проверить каждый локатор на снимке своей страницы (FIXTURE_PATH класса).
+
+        Совпадения считаются в DOM без учета видимости; сработавшие стратегии
+        сразу становятся проверенными и встают первыми.
+        """
+        by_page: Dict[Tuple[str, str], List[Locator]] = defaultdict(list)
+        for locator in self.locators.values():
+            path = getattr(locator.owner, "FIXTURE_PATH", None)
+            if path is not None:
+                storage = json.dumps(getattr(locator.owner, "FIXTURE_STORAGE", {}), sort_keys=True)
+                by_page[(path, storage)].append(locator)
+
+        for (path, storage), locators in by_page.items():
+            self._load(driver, base_url, path, json.loads(storage))
+            for locator in locators:
+                counts = []
+                for strategy in locator.strategies:
+                    by, value = script_query(strategy)
+                    started = time.perf_counter()
+                    try:
+                        count = driver.execute_script(COUNT_SCRIPT, by, value)
+                    except WebDriverException:
+                        count = -1
+                    self.probe(locator, strategy, time.perf_counter() - started, count > 0)
+                    counts.append((strategy, count))
+                self.health[locator.name] = counts
+        return self.health
+
+    @staticmethod
+    def _load(driver, base_url: str, path: str, storage: Dict[str, object]):
+        if storage:
+            # localStorage доступен только на своем origin: сначала главная, потом данные
+            driver.get(base_url + "/")
+            driver.execute_script("window.localStorage.clear();")
+            for key, value in storage.items():
+                driver.execute_script("window.localStorage.setItem(arguments[0], arguments[1]);",
+                                      key, json.dumps(value, ensure_ascii=False))
+        driver.get(base_url + path)
+
+    # --- отчет ---
+
+    def report(self, top: int = 15) -> List[str]:
+        """Локаторы, на которых теряется время: ошибки записи, нет на снимках, промахи"""
+        lines = []
+        for name, locator in sorted(self.locators.items()):
+            for strategy in locator.strategies:
+                problem = lint(strategy)
+                if problem:
+                    lines.append(f"lint   {name}: {problem} ({strategy[1]!r})")
+            counts = self.health.get(name)
+            if counts and not locator.optional and all(count <= 0 for _, count in counts):
+                state = "invalid" if all(count < 0 for _, count in counts) else "no match"
+                lines.append(f"broken {name}: {state} on fixture page "
+                             f"{getattr(locator.owner, 'FIXTURE_PATH', '')}")
+
+        with self._lock:
+            ranked = sorted(((name, stats) for name, stats in self.stats.items() if stats.lookups),
+                            key=lambda item: item[1].wasted, reverse=True)
+        if ranked:
+            lines.append(f"{'locator':<40} {'lookups':>7} {'hit, %':>7} {'avg s':>6} "
+                         f"{'wasted s':>9} {'best strategy':<30}")
+        for name, stats in ranked[:top]:
+            best = self.ordered(self.locators.get(name) or tuple(name.split("=", 1)))[0]
+            lines.append(f"{name[-40:]:<40} {stats.lookups:>7} {stats.hit_rate * 100:>7.0f} "
+                         f"{stats.time / stats.lookups:>6.2f} {stats.wasted:>9.2f} "
+                         f"{(best[0] + '=' + best[1])[:30]:<30}")
+        return lines
+
+
+REGISTRY = LocatorRegistry()
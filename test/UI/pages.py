@@ -1,24 +1,90 @@
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
+from waits import WaitEngine
+from step_profiler import PROFILER, profile_methods
+from locators import REGISTRY, Locator, script_query
+from budget import current_budget
+import os
+import re
 import time
-import random
+
+
+# Одним вызовом собирает поля всех элементов локатора (см. BasePage.extract_all).
+# Поле: sel - дочерний CSS селектор (пусто - сам элемент), attr - атрибут (пусто - видимый текст)
+EXTRACT_SCRIPT = """
+var by = arguments[0], value = arguments[1], fields = arguments[2], limit = arguments[3];
+var nodes = [];
+if (by === 'xpath') {
+    var found = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    for (var i = 0; i < found.snapshotLength; i++) { nodes.push(found.snapshotItem(i)); }
+} else {
+    nodes = Array.prototype.slice.call(document.querySelectorAll(value));
+}
+if (limit) { nodes = nodes.slice(0, limit); }
+return nodes.map(function (node) {
+    var record = {};
+    Object.keys(fields).forEach(function (name) {
+        var spec = fields[name];
+        var target = spec.sel ? node.querySelector(spec.sel) : node;
+        if (!target) { record[name] = null; }
+        else if (spec.attr) { record[name] = target.getAttribute(spec.attr); }
+        else { record[name] = (target.innerText || target.textContent || '').trim(); }
+    });
+    return record;
+});
+"""
+
+
+def parse_price(text):
+    """Первая цена из текста вида '6 490 ₽' -> 6490; None, если цифр нет"""
+    match = re.search(r"\d[\d\s]*", text or "")
+    return int(re.sub(r"\s", "", match.group())) if match else None
 
 
 class BasePage:
-    """Базовый класс для всех страниц Wildberries"""
+    """Базовый класс страниц Wildberries; страницы Ozon - от OzonPage"""
+
+    # Адрес сайта: боевой или локальный сервер снимков (см. фикстуру wb_base_url)
+    base_url = os.getenv("WB_BASE_URL", "https://www.wildberries.ru")
+
+    # Снимок страницы для проверки локаторов (см. LocatorRegistry.validate)
+    FIXTURE_PATH = "/"
+
+    # Кнопка согласия с cookie; у каждого сайта своя
+    COOKIE_ACCEPT = Locator(By.CSS_SELECTOR, "button.cookies__btn",
+                            (By.XPATH, "//button[contains(text(), 'Окей')]"))
+
+    def __init_subclass__(cls, **kwargs):
+        # Каждый метод page object - шаг профиля (см. step_profiler.py)
+        super().__init_subclass__(**kwargs)
+        profile_methods(cls)
 
     def __init__(self, driver):
         self.driver = driver
         self.wait = WebDriverWait(driver, 15)
+        self.waits = WaitEngine(driver)
+
+    def _wait(self, locator, condition, timeout):
+        """Явное ожидание из бюджета теста: таймаут урезается до остатка дедлайна"""
+        budget = current_budget()
+        granted = budget.grant(timeout)
+        started = time.perf_counter()
+        found = False
+        try:
+            result = REGISTRY.wait_for(self.driver, locator, condition, granted)
+            found = True
+            return result
+        finally:
+            budget.record(PROFILER.current_action(), timeout, granted,
+                          time.perf_counter() - started, found)
 
     def find(self, locator, timeout=10):
-        """Найти элемент с ожиданием"""
+        """Найти элемент с ожиданием; запасные стратегии локатора пробуются в том же ожидании"""
+        current_budget().check()
         try:
-            return WebDriverWait(self.driver, timeout).until(
-                EC.visibility_of_element_located(locator)
-            )
+            return self._wait(locator, EC.visibility_of_element_located, timeout)
         except TimeoutException:
             print(f"Элемент не найден: {locator}")
             raise
@@ -26,10 +92,7 @@ class BasePage:
     def find_all(self, locator, timeout=5):
         """Найти все элементы"""
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_all_elements_located(locator)
-            )
-            return self.driver.find_elements(*locator)
+            return self._wait(locator, EC.presence_of_all_elements_located, timeout)
         except TimeoutException:
             return []
 
@@ -37,7 +100,7 @@ class BasePage:
         """Кликнуть по элементу"""
         element = self.find(locator)
         element.click()
-        time.sleep(random.uniform(0.5, 1.5))  # Человеческая пауза
+        self.waits.settle(replaces=1.0)  # Вместо случайной паузы 0.5-1.5 с
 
     def type_text(self, locator, text):
         """Ввести текст"""
@@ -49,63 +112,112 @@ class BasePage:
         """Получить текст элемента"""
         return self.find(locator).text.strip()
 
+    def accept_cookies(self, timeout=3):
+        """Принять cookie, если появилось окно"""
+        try:
+            if self.is_visible(self.COOKIE_ACCEPT, timeout):
+                self.click(self.COOKIE_ACCEPT)
+                return True
+        except WebDriverException:
+            pass
+        return False
+
     def is_visible(self, locator, timeout=5):
         """Проверить видимость элемента"""
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.visibility_of_element_located(locator)
-            )
+            self._wait(locator, EC.visibility_of_element_located, timeout)
             return True
         except TimeoutException:
             return False
 
+    def extract_all(self, locator, fields=None, limit=None, timeout=5):
+        """Прочитать поля всех элементов локатора за один вызов execute_script.
+
+        fields: имя -> "" (текст элемента), "@attr" (атрибут элемента),
+        "css" (текст дочернего элемента) или "css@attr" (его атрибут).
+        Ждет появления элементов до timeout, возвращает список словарей.
+        """
+        fields = fields if fields is not None else {"text": ""}
+        specs = {}
+        for name, spec in fields.items():
+            selector, _, attr = spec.partition("@")
+            specs[name] = {"sel": selector.strip(), "attr": attr}
+
+        def _records(strategy):
+            by, value = script_query(strategy)
+            return lambda driver: driver.execute_script(EXTRACT_SCRIPT, by, value, specs, limit or 0)
+
+        try:
+            return self._wait(locator, _records, timeout)
+        except TimeoutException:
+            return []
+
     def scroll_to_element(self, element):
         """Прокрутить к элементу"""
         self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-        time.sleep(0.5)
+        self.waits.element_stable(element, replaces=0.5)
+
+
+profile_methods(BasePage)
 
 
 class MainPage(BasePage):
     """Главная страница Wildberries"""
 
     # Локаторы
-    LOGIN_BUTTON = (By.CLASS_NAME, "navbar-pc__link j-wba-header-item")  ## Войти
-    SEARCH_INPUT = (By.CSS_SELECTOR, "input#searchInput.search-catalog__input j-wba-header-item search-placeholder")  ## строка поиска
-    SEARCH_BUTTON = (By.ID, "applySearchBtn")  ## кнопка поиска
-    CART_BUTTON = (By.CSS_SELECTOR, "a.navbar-pc__link j-wba-header-item")  ## кнопка корзины
-    PROFILE_BUTTON = (By.CSS_SELECTOR, "a.navbar-pc__link j-wba-header-item")  ## кнопка профиля
-    GEO_BUTTON = (By.CSS_SELECTOR, "a.navbar-pc__link j-wba-header-item")  ## кнопка адреса
-    CATALOG_BUTTON = (By.CSS_SELECTOR, "button.nav-element__burger j-menu-burger-btn j-wba-header-item j-nav nav-element__burger--close")  ## Каталог
+    LOGIN_BUTTON = Locator(By.CSS_SELECTOR, "a[data-wba-header-name='Login']",
+                           (By.XPATH, "//a[contains(., 'Войти')]"))  ## Войти
+    SEARCH_INPUT = Locator(By.ID, "searchInput")  ## строка поиска
+    SEARCH_BUTTON = Locator(By.ID, "applySearchBtn")  ## кнопка поиска
+    CART_BUTTON = Locator(By.CSS_SELECTOR, "a[data-wba-header-name='Cart']")  ## кнопка корзины
+    PROFILE_BUTTON = Locator(By.CSS_SELECTOR, "a[data-wba-header-name='LK']", optional=True)  ## кнопка профиля
+    GEO_BUTTON = Locator(By.CSS_SELECTOR, "a[data-wba-header-name='DLV_Adress']")  ## кнопка адреса
+    CATALOG_BUTTON = Locator(By.CSS_SELECTOR, "button.nav-element__burger")  ## Каталог
+    CATALOG_MENU = Locator(By.CSS_SELECTOR, "div.menu.catalog")  ## меню каталога
+    CATALOG_CATEGORIES = Locator(By.CSS_SELECTOR, "ul.menu-catalog a")  ## категории в меню каталога
 
     def open(self):
         """Открыть главную страницу"""
-        self.driver.get("https://www.wildberries.ru")
-        time.sleep(3)
-
-        # Принять куки если есть
-        try:
-            cookie_accept = (By.XPATH, "//button[contains(text(), 'Окей') or contains(text(), 'Окей')]")
-            if self.is_visible(cookie_accept, 3):
-                self.click(cookie_accept)
-        except:
-            pass
-
+        self.driver.get(self.base_url)
+        self.waits.settle(replaces=3)
+        self.accept_cookies()
         return self
 
+    def header_elements(self, timeout=3):
+        """Видимость элементов шапки: имя -> отображается ли"""
+        return {
+            "search_input": self.is_visible(self.SEARCH_INPUT, timeout),
+            "catalog_button": self.is_visible(self.CATALOG_BUTTON, timeout),
+            "login_button": self.is_visible(self.LOGIN_BUTTON, timeout),
+            "cart_button": self.is_visible(self.CART_BUTTON, timeout),
+        }
+
+    def open_catalog(self):
+        """Открыть меню каталога и получить названия категорий"""
+        self.click(self.CATALOG_BUTTON)
+        if not self.is_visible(self.CATALOG_MENU, 3):
+            return []
+        return [record["text"] for record in self.extract_all(self.CATALOG_CATEGORIES)]
+
     def click_login(self):
         """Нажать кнопку 'Войти'"""
         self.click(self.LOGIN_BUTTON)
+        self.waits.dom_quiet(replaces=2)
         return AuthPage(self.driver)
 
     def search_product(self, query):
         """Поиск товара"""
         self.type_text(self.SEARCH_INPUT, query)
+        old_url = self.driver.current_url
         self.click(self.SEARCH_BUTTON)
+        self.waits.url_changes(old_url, replaces=2)
         return SearchPage(self.driver)
 
     def open_cart(self):
         """Открыть корзину"""
+        old_url = self.driver.current_url
         self.click(self.CART_BUTTON)
+        self.waits.url_changes(old_url, replaces=2)
         return CartPage(self.driver)
 
     def is_user_logged_in(self):
@@ -120,18 +232,21 @@ class AuthPage(BasePage):
     """Страница авторизации Wildberries"""
 
     # Локаторы
-    PHONE_INPUT = (By.NAME, "phoneNumber")  ## ввод телефона
-    GET_CODE_BUTTON = (By.ID, "requestCode")  ## кнопка запроса кода
-    CODE_INPUTS = (By.CLASS_NAME, "_charInput_1r1zc_1 charInput--irP9m _count_1r1zc_12")  ## поле ввода кода
-    LOGIN_BUTTON = (By.XPATH, "//button[contains(text(), 'Войти')]")  ## кнопка "войти"
-    CLOSE_BUTTON = (By.CLASS_NAME, "_close_1b9nk_55 popup__close close")  ## кнопка "закрыть"(крестик)
+    PHONE_INPUT = Locator(By.NAME, "phoneNumber")  ## ввод телефона
+    GET_CODE_BUTTON = Locator(By.ID, "requestCode")  ## кнопка запроса кода
+    CODE_INPUTS = Locator(By.CSS_SELECTOR, "input._charInput_1r1zc_1",
+                          (By.CSS_SELECTOR, ".auth-popup__code input"))  ## поле ввода кода
+    LOGIN_BUTTON = Locator(By.CSS_SELECTOR, ".auth-popup__code button",
+                           (By.XPATH, "//button[contains(text(), 'Войти')]"))  ## кнопка "войти"
+    CLOSE_BUTTON = Locator(By.CSS_SELECTOR, "button.popup__close",
+                           (By.CSS_SELECTOR, "button._close_1b9nk_55"))  ## кнопка "закрыть"(крестик)
 
     def login_by_phone(self, phone):
         """Авторизация по телефону (демо версия)"""
         # Ввод телефона
         self.type_text(self.PHONE_INPUT, phone)
         self.click(self.GET_CODE_BUTTON)
-        time.sleep(3)
+        self.waits.network_idle(replaces=3)
 
         # В демо-режиме просто закрываем окно авторизации
         try:
@@ -147,30 +262,55 @@ class AuthPage(BasePage):
 class SearchPage(BasePage):
     """Страница результатов поиска"""
 
+    FIXTURE_PATH = "/catalog/0/search.aspx"
+
     # Локаторы
-    PRODUCT_CARDS = (By.CSS_SELECTOR, "a.product-card__link j-card-link j-open-full-product-card") ## Карточка продукта
-    PRODUCT_NAMES = (By.CLASS_NAME, "product-card__brand-wrap") ## наименование продукта
-    PRODUCT_PRICES = (By.CSS_SELECTOR, "div.product-card__price price") ## цена продукта
-    ADD_TO_CART_BUTTONS = (By.CSS_SELECTOR, "a.product-card__add-basket j-add-to-basket orderLink--tNgvO btn-main") ## доабвить в корзину
+    PRODUCT_CARDS = Locator(By.CSS_SELECTOR, "a.product-card__link.j-card-link",
+                            (By.CSS_SELECTOR, "article.product-card a[href*='detail.aspx']")) ## Карточка продукта
+    PRODUCT_NAMES = Locator(By.CLASS_NAME, "product-card__brand-wrap") ## наименование продукта
+    PRODUCT_PRICES = Locator(By.CSS_SELECTOR, "div.product-card__price.price") ## цена продукта
+    ADD_TO_CART_BUTTONS = Locator(By.CSS_SELECTOR, "a.product-card__add-basket",
+                                  (By.CSS_SELECTOR, "a.j-add-to-basket")) ## доабвить в корзину
+    PRODUCT_CARD_ITEMS = Locator(By.CSS_SELECTOR, "article.product-card") ## карточка целиком, для пакетного чтения
+    PRODUCT_PRICE_VALUES = Locator(By.CSS_SELECTOR, ".price__lower-price") ## цена продукта, для пакетного чтения
 
 
     def get_product_count(self):
         """Получить количество товаров"""
         return len(self.find_all(self.PRODUCT_CARDS))
 
+    PRODUCT_FIELDS = {
+        "name": ".product-card__name",
+        "brand": ".product-card__brand",
+        "price": ".price__lower-price",
+        "url": ".product-card__link@href",
+        "id": "@data-nm-id",
+    }
+
+    def get_products(self, limit=None):
+        """Карточки товаров: название, бренд, цена, ссылка - одним запросом к браузеру"""
+        products = self.extract_all(self.PRODUCT_CARD_ITEMS, self.PRODUCT_FIELDS, limit=limit)
+        for product in products:
+            product["price"] = parse_price(product["price"])
+        return products
+
     def get_product_names(self):
         """Получить названия товаров"""
-        names = []
-        elements = self.find_all(self.PRODUCT_NAMES)
-        for el in elements[:5]:  # Первые 5 товаров
-            names.append(el.text)
-        return names
+        # Первые 5 товаров
+        return [record["text"] for record in self.extract_all(self.PRODUCT_NAMES, limit=5)]
+
+    def get_product_prices(self, limit=None):
+        """Получить цены товаров числами"""
+        return [parse_price(record["text"])
+                for record in self.extract_all(self.PRODUCT_PRICE_VALUES, limit=limit)]
 
     def open_first_product(self):
         """Открыть первый товар"""
         cards = self.find_all(self.PRODUCT_CARDS)
         if cards:
+            old_url = self.driver.current_url
             cards[0].click()
+            self.waits.url_changes(old_url, replaces=2)
             return ProductPage(self.driver)
         raise NoSuchElementException("No products found")
 
@@ -181,7 +321,7 @@ class SearchPage(BasePage):
             # Прокрутить к кнопке
             self.scroll_to_element(buttons[index])
             buttons[index].click()
-            time.sleep(2)
+            self.waits.network_idle(replaces=2)
             return True
         return False
 
@@ -190,13 +330,18 @@ class SearchPage(BasePage):
 class ProductPage(BasePage):
     """Страница товара"""
 
+    FIXTURE_PATH = "/catalog/183452710/detail.aspx"
+
     # Локаторы
-    PRODUCT_TITLE = (By.CSS_SELECTOR, "h3.mo-typography mo-typography_variant_title3 mo-typography_variable-weight_title3 mo-typography_color_primary productTitle--J2W7I")
-    PRODUCT_PRICE = (By.CSS_SELECTOR, "h2.mo-typography mo-typography_variant_title2 mo-typography_variable-weight_title2 mo-typography_color_accent")
-    ADD_TO_CART_BUTTON = (By.CSS_SELECTOR, "span.mo-typography mo-typography_variant_action-accent mo-typography_variable-weight_action-accent mo-typography_ws_nowrap")
-    GO_TO_CART_BUTTON = (By.XPATH, "//a[contains(text(), 'Перейти в корзину')]")
-    SIZE_BUTTONS = (By.CSS_SELECTOR, "button.sizesListButton--WuH9K")
-    COLOR_BUTTONS = (By.CSS_SELECTOR, "a.slideAnchor--CwO_y")
+    PRODUCT_TITLE = Locator(By.CSS_SELECTOR, "h3.productTitle--J2W7I",
+                            (By.CSS_SELECTOR, "h3.mo-typography_variant_title3"))
+    PRODUCT_PRICE = Locator(By.CSS_SELECTOR, "h2.mo-typography_variant_title2.mo-typography_color_accent")
+    ADD_TO_CART_BUTTON = Locator(By.CSS_SELECTOR, "button.order__button",
+                                 (By.XPATH, "//button[contains(., 'Добавить в корзину')]"))
+    GO_TO_CART_BUTTON = Locator(By.CSS_SELECTOR, "a.order__go-to-cart",
+                                (By.XPATH, "//a[contains(text(), 'Перейти в корзину')]"))
+    SIZE_BUTTONS = Locator(By.CSS_SELECTOR, "button.sizesListButton--WuH9K")
+    COLOR_BUTTONS = Locator(By.CSS_SELECTOR, "a.slideAnchor--CwO_y")
 
     def get_product_info(self):
         """Получить информацию о товаре"""
@@ -225,11 +370,12 @@ class ProductPage(BasePage):
     def add_to_cart(self):
         """Добавить товар в корзину"""
         self.click(self.ADD_TO_CART_BUTTON)
-        time.sleep(2)
+        self.waits.network_idle(replaces=2)
         return self
 
     def go_to_cart(self):
         """Перейти в корзину"""
+        old_url = self.driver.current_url
         try:
             if self.is_visible(self.GO_TO_CART_BUTTON, 3):
                 self.click(self.GO_TO_CART_BUTTON)
@@ -238,22 +384,32 @@ class ProductPage(BasePage):
             cart_button = (By.CSS_SELECTOR, "a[data-wba-header-name='Cart']")
             self.click(cart_button)
 
+        self.waits.url_changes(old_url, replaces=2)
         return CartPage(self.driver)
 
 
 class CartPage(BasePage):
     """Страница корзины"""
 
+    # Корзина снимка рисуется из localStorage: для проверки кладем в нее товар
+    FIXTURE_PATH = "/lk/basket"
+    FIXTURE_STORAGE = {"fixture-basket": [
+        {"id": "183452710", "name": "Кроссовки беговые", "price": 6490, "quantity": 2},
+    ]}
+
     # Локаторы
-    CART_ITEMS = (By.CSS_SELECTOR, "div.basketList")
-    ITEM_NAMES = (By.CSS_SELECTOR, "span.good-info__good-name")
-    ITEM_PRICES = (By.CSS_SELECTOR, "div.list-item__price-wallet list-item__price-wallet--wb-wallet-icon red-price")
-    DELETE_BUTTONS = (By.CSS_SELECTOR, "button.btn__del j-basket-item-del")
-    INCREASE_QUANTITY = (By.CSS_SELECTOR, "button.count__plus plus")
-    DECREASE_QUANTITY = (By.CSS_SELECTOR, "button.count__minus minus disabled")
-    CHECKOUT_BUTTON = (By.XPATH, "//button[contains(text(), 'Заказать')]")
-    EMPTY_CART = (By.XPATH, "//h1[contains(text(), 'В корзине пока пусто')]")
-    TOTAL_PRICE = (By.CSS_SELECTOR, "p.b-top__total line")
+    CART_ITEMS = Locator(By.CSS_SELECTOR, "div.basketList")
+    ITEM_NAMES = Locator(By.CSS_SELECTOR, "span.good-info__good-name")
+    ITEM_PRICES = Locator(By.CSS_SELECTOR, "div.list-item__price-wallet")
+    DELETE_BUTTONS = Locator(By.CSS_SELECTOR, "button.btn__del.j-basket-item-del")
+    INCREASE_QUANTITY = Locator(By.CSS_SELECTOR, "button.count__plus")
+    DECREASE_QUANTITY = Locator(By.CSS_SELECTOR, "button.count__minus:not(.disabled)")
+    CHECKOUT_BUTTON = Locator(By.CSS_SELECTOR, "button.b-btn-do-order",
+                              (By.XPATH, "//button[contains(text(), 'Заказать')]"))
+    EMPTY_CART = Locator(By.CSS_SELECTOR, "h1.basket-empty__title",
+                         (By.XPATH, "//h1[contains(text(), 'В корзине пока пусто')]"), optional=True)
+    TOTAL_PRICE = Locator(By.CSS_SELECTOR, "p.b-top__total")
+    CART_ITEM_ROWS = Locator(By.CSS_SELECTOR, ".basketList .list-item") ## строка товара, для пакетного чтения
 
     def get_items_count(self):
         """Получить количество товаров в корзине"""
@@ -261,11 +417,23 @@ class CartPage(BasePage):
 
     def get_item_names(self):
         """Получить названия товаров в корзине"""
-        names = []
-        elements = self.find_all(self.ITEM_NAMES)
-        for el in elements:
-            names.append(el.text)
-        return names
+        return [record["text"] for record in self.extract_all(self.ITEM_NAMES)]
+
+    def get_items(self):
+        """Товары корзины: название, количество и цена - одним запросом к браузеру"""
+        items = self.extract_all(self.CART_ITEM_ROWS, {
+            "name": ".good-info__good-name",
+            "quantity": ".count__input@value",
+            "price": ".list-item__price-wallet",
+        })
+        for item in items:
+            item["price"] = parse_price(item["price"])
+            item["quantity"] = int(item["quantity"]) if item["quantity"] else None
+        return items
+
+    def get_item_prices(self):
+        """Получить цены товаров в корзине числами"""
+        return [item["price"] for item in self.get_items()]
 
     def get_total_price(self):
         """Получить общую сумму"""
@@ -279,7 +447,7 @@ class CartPage(BasePage):
         buttons = self.find_all(self.DELETE_BUTTONS)
         if buttons and len(buttons) > index:
             buttons[index].click()
-            time.sleep(2)
+            self.waits.dom_quiet(replaces=2)
             return True
         return False
 
@@ -292,32 +460,37 @@ class CartPage(BasePage):
 
         if buttons and len(buttons) > index:
             buttons[index].click()
-            time.sleep(1)
+            self.waits.network_idle(replaces=1)
             return True
         return False
 
     def proceed_to_checkout(self):
         """Перейти к оформлению заказа"""
+        old_url = self.driver.current_url
         self.click(self.CHECKOUT_BUTTON)
+        self.waits.url_changes(old_url, replaces=3)
         return CheckoutPage(self.driver)
 
 
 class CheckoutPage(BasePage):
     """Страница оформления заказа"""
 
+    FIXTURE_PATH = "/lk/basket/checkout"
+
     # Локаторы
-    DELIVERY_METHODS = (By.CLASS_NAME, "basket-delivery__choose-address j-btn-choose-address") ## способ доставки
-    PICKUP_POINTS = (By.CLASS_NAME, "tabs-switch__text--HMq3V") ## пункт выдачи
-    PAYMENT_METHODS = (By.CLASS_NAME, "basket-section__header") ## способ оплаты
-    ORDER_BUTTON = (By.XPATH, "//button[contains(text(), 'Заказать')]")
-    SUCCESS_MESSAGE = (By.XPATH, "//div[contains(text(), 'Заказ успешно оформлен')]")
+    DELIVERY_METHODS = Locator(By.CSS_SELECTOR, "button.basket-delivery__choose-address") ## способ доставки
+    PICKUP_POINTS = Locator(By.CLASS_NAME, "tabs-switch__text--HMq3V") ## пункт выдачи
+    PAYMENT_METHODS = Locator(By.CLASS_NAME, "basket-section__header") ## способ оплаты
+    ORDER_BUTTON = Locator(By.CSS_SELECTOR, "button.b-btn-do-order",
+                           (By.XPATH, "//button[contains(text(), 'Заказать')]"))
+    SUCCESS_MESSAGE = Locator(By.XPATH, "//div[contains(text(), 'Заказ успешно оформлен')]", optional=True)
 
     def select_delivery_method(self, method_index=0):
         """Выбрать способ доставки"""
         methods = self.find_all(self.DELIVERY_METHODS)
         if methods and len(methods) > method_index:
             methods[method_index].click()
-            time.sleep(1)
+            self.waits.dom_quiet(replaces=1)
             return True
         return False
 
@@ -326,7 +499,7 @@ class CheckoutPage(BasePage):
         points = self.find_all(self.PICKUP_POINTS)
         if points and len(points) > point_index:
             points[point_index].click()
-            time.sleep(1)
+            self.waits.dom_quiet(replaces=1)
             return True
         return False
 
@@ -335,7 +508,7 @@ class CheckoutPage(BasePage):
         methods = self.find_all(self.PAYMENT_METHODS)
         if methods and len(methods) > method_index:
             methods[method_index].click()
-            time.sleep(1)
+            self.waits.dom_quiet(replaces=1)
             return True
         return False
 
@@ -355,3 +528,111 @@ class CheckoutPage(BasePage):
 
             return False
 
+
+class OzonPage(BasePage):
+    """Базовая страница Ozon: свой адрес, окно cookie и шапка с поиском"""
+
+    base_url = os.getenv("OZON_BASE_URL", "https://www.ozon.ru")
+
+    # Снимков Ozon нет: --validate-locators пропускает эти локаторы, проверяется только запись
+    FIXTURE_PATH = None
+
+    # Локаторы
+    COOKIE_ACCEPT = Locator(By.XPATH, "//button[contains(., 'Принять') or contains(., 'Согласен')]")
+    SEARCH_INPUT = Locator(By.CSS_SELECTOR, "input[name='text'], input[placeholder='Искать на Ozon']")  ## строка поиска
+    SEARCH_BUTTON = Locator(By.CSS_SELECTOR, "form:has(input[name='text']) button[type='submit']",
+                            (By.XPATH, "//input[@name='text']/ancestor::form//button[@type='submit']"))  ## кнопка поиска
+    CART_BUTTON = Locator(By.CSS_SELECTOR, "a[href^='/cart']")  ## кнопка корзины
+    PAGE_TITLE = Locator(By.TAG_NAME, "h1")  ## заголовок страницы
+
+    def search_product(self, query):
+        """Поиск товара"""
+        self.type_text(self.SEARCH_INPUT, query)
+        old_url = self.driver.current_url
+        self.click(self.SEARCH_BUTTON)
+        self.waits.url_changes(old_url, replaces=3)
+        return OzonSearchPage(self.driver)
+
+    def open_cart(self):
+        """Открыть корзину; если кнопки нет - по прямому адресу"""
+        old_url = self.driver.current_url
+        try:
+            self.click(self.CART_BUTTON)
+        except TimeoutException:
+            self.driver.get(f"{self.base_url}/cart")
+        self.waits.url_changes(old_url, replaces=3)
+        return OzonCartPage(self.driver)
+
+    def get_title(self):
+        """Заголовок страницы или пустая строка"""
+        records = self.extract_all(self.PAGE_TITLE, limit=1, timeout=3)
+        return records[0]["text"] if records else ""
+
+
+class OzonMainPage(OzonPage):
+    """Главная страница Ozon"""
+
+    # Локаторы: кнопки без стабильных классов ищутся по тексту одним XPath
+    CATALOG_BUTTON = Locator(By.XPATH, "//*[self::button or self::div][contains(text(), 'Каталог')]")  ## Каталог
+    LOGIN_BUTTON = Locator(By.XPATH, "//*[self::button or self::div][contains(text(), 'Войти или зарегистрироваться')]")  ## Войти
+    CATALOG_ITEMS = Locator(By.CSS_SELECTOR, "div[class*='catalog'] a, nav[class*='menu'] a, ul[class*='category'] li",
+                            (By.CSS_SELECTOR, "div[class*='category']"))  ## категории каталога
+
+    def open(self):
+        """Открыть главную страницу"""
+        self.driver.get(self.base_url)
+        self.waits.settle(replaces=3)
+        self.accept_cookies()
+        return self
+
+    def header_elements(self, timeout=3):
+        """Видимость элементов шапки: имя -> отображается ли"""
+        return {
+            "search_input": self.is_visible(self.SEARCH_INPUT, timeout),
+            "search_button": self.is_visible(self.SEARCH_BUTTON, timeout),
+            "cart_button": self.is_visible(self.CART_BUTTON, timeout),
+            "login_button": self.is_visible(self.LOGIN_BUTTON, timeout),
+        }
+
+    def open_catalog(self):
+        """Открыть каталог и получить названия категорий"""
+        self.click(self.CATALOG_BUTTON)
+        records = self.extract_all(self.CATALOG_ITEMS, limit=50)
+        return [record["text"] for record in records if record["text"]]
+
+
+class OzonSearchPage(OzonPage):
+    """Страница результатов поиска Ozon"""
+
+    # Локаторы: только внешний элемент карточки, без ее частей вроде product-card__title
+    PRODUCT_CARDS = Locator(By.CSS_SELECTOR,
+                            "div[class*='product-card']:not([class*='product-card'] *), "
+                            "article[class*='product-card']:not([class*='product-card'] *)")  ## карточка товара
+
+    PRODUCT_FIELDS = {
+        "name": "span[class*='title'], h3",
+        "url": "a@href",
+    }
+
+    def get_products(self, limit=None, timeout=15):
+        """Карточки товаров: название и ссылка - одним запросом к браузеру"""
+        return self.extract_all(self.PRODUCT_CARDS, self.PRODUCT_FIELDS, limit=limit, timeout=timeout)
+
+    def get_product_names(self, limit=3):
+        """Названия первых товаров"""
+        return [product["name"] or "" for product in self.get_products(limit=limit)]
+
+
+class OzonCartPage(OzonPage):
+    """Страница корзины Ozon"""
+
+    # Локаторы: признаки пустой и заполненной корзины одним выражением
+    CART_STATE = Locator(By.XPATH, "//*[self::div or self::button or self::span]"
+                            "[contains(text(), 'Корзина пуста') or contains(text(), 'Товаров в корзине')"
+                            " or contains(text(), 'Оформить заказ')]",
+                         (By.XPATH, "//div[contains(@class, 'cart-item')]"))  ## состояние корзины
+
+    def get_state(self, timeout=5):
+        """Текст первого признака состояния корзины или None"""
+        records = self.extract_all(self.CART_STATE, limit=1, timeout=timeout)
+        return records[0]["text"] if records else None
@@ -0,0 +1,209 @@
+import heapq
+import json
+import os
+import re
+import statistics
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import pytest
+
+# Вес нового замера в истории: сглаживает случайные выбросы
+SMOOTHING = 0.5
+
+# Длительность теста без истории, пока нет ни одного замера
+DEFAULT_DURATION = 10.0
+
+# Ключ истории в config.cache, если --durations-file не задан
+CACHE_KEY = "ui/test_durations"
+
+
+def add_options(parser):
+    group = parser.getgroup("sharding", "распределение тестов по длительности")
+    group.addoption(
+        "--shard",
+        default=os.getenv("UI_SHARD"),
+        help="Запустить только часть тестов: i/N (с 1), баланс по истории длительностей"
+    )
+    group.addoption(
+        "--durations-file",
+        default=os.getenv("UI_DURATIONS_FILE"),
+        help="Файл истории длительностей тестов (относительно rootdir); "
+             "по умолчанию история хранится в кэше pytest (.pytest_cache)"
+    )
+    group.addoption(
+        "--no-duration-order",
+        action="store_true",
+        help="Не переупорядочивать тесты по длительности"
+    )
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    match = re.fullmatch(r"\s*(\d+)\s*/\s*(\d+)\s*", value)
+    if not match or not 1 <= int(match.group(1)) <= int(match.group(2)):
+        raise pytest.UsageError(f"--shard ожидает i/N с 1 <= i <= N, получено: {value}")
+    return int(match.group(1)), int(match.group(2))
+
+
+def loadgroup(config) -> bool:
+    """--dist loadgroup; на воркере xdist dist="no", а признак остается в option.loadgroup"""
+    return getattr(config.option, "dist", None) == "loadgroup" \
+        or bool(getattr(config.option, "loadgroup", False))
+
+
+def filtered(config) -> bool:
+    """Выбор тестов сужен -k, -m, --deselect или --lf: часть собранных тестов не запустится"""
+    option = config.option
+    return bool(getattr(option, "keyword", "") or getattr(option, "markexpr", "")
+                or getattr(option, "deselect", None) or getattr(option, "lf", False))
+
+
+def lpt_bins(durations: Dict[str, float], bins: int) -> List[List[str]]:
+    """Longest processing time: самый долгий тест - в наименее загруженную корзину.
+
+    Порядок детерминирован (длительность, затем nodeid), поэтому все машины
+    и воркеры получают одно и то же разбиение.
+    """
+    heap = [(0.0, index) for index in range(bins)]
+    result: List[List[str]] = [[] for _ in range(bins)]
+    for nodeid in sorted(durations, key=lambda n: (-durations[n], n)):
+        load, index = heapq.heappop(heap)
+        result[index].append(nodeid)
+        heapq.heappush(heap, (load + durations[nodeid], index))
+    return result
+
+
+class DurationScheduler:
+    """Плагин: история длительностей, порядок LPT, шардинг и группы xdist"""
+
+    def __init__(self, config):
+        self.config = config
+        durations_file = config.getoption("--durations-file")
+        self.path = Path(config.rootpath) / durations_file if durations_file else None
+        self.history = self._load()
+        self.measured: Dict[str, float] = {}
+        self.plan: List[Tuple[int, float]] = []
+        # В xdist историю пишет только контроллер: к нему приходят отчеты всех воркеров
+        self.is_worker = hasattr(config, "workerinput")
+
+    def _load(self) -> Dict[str, float]:
+        if self.path is None:
+            cache = getattr(self.config, "cache", None)
+            return cache.get(CACHE_KEY, {}) if cache is not None else {}
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self, history: Dict[str, float]):
+        if self.path is None:
+            cache = getattr(self.config, "cache", None)
+            if cache is not None:
+                cache.set(CACHE_KEY, history)
+            return
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(history, indent=2, sort_keys=True), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+    def _in_use(self) -> bool:
+        """История нужна только для шардинга или порядка по длительности (и есть где ее хранить)"""
+        if self.path is None and getattr(self.config, "cache", None) is None:
+            return False
+        return bool(self.config.getoption("--shard")) \
+            or not self.config.getoption("--no-duration-order")
+
+    @property
+    def location(self) -> str:
+        return str(self.path) if self.path is not None else f"pytest cache ({CACHE_KEY})"
+
+    def _nodeid(self, nodeid: str) -> str:
+        """nodeid без "@группа", который дописывает воркер xdist при --dist loadgroup"""
+        if loadgroup(self.config):
+            return nodeid.rsplit("@", 1)[0]
+        return nodeid
+
+    def _estimates(self, items) -> Dict[str, float]:
+        fallback = statistics.median(self.history.values()) if self.history else DEFAULT_DURATION
+        nodeids = (self._nodeid(item.nodeid) for item in items)
+        return {nodeid: self.history.get(nodeid, fallback) for nodeid in nodeids}
+
+    @staticmethod
+    def _shard(config, estimates: Dict[str, float]):
+        """(номер шарда, nodeid шарда) или None без --shard"""
+        shard = config.getoption("--shard")
+        if not shard:
+            return None
+        index, total = parse_shard(shard)
+        return index, set(lpt_bins(estimates, total)[index - 1])
+
+    @pytest.hookimpl(tryfirst=True, specname="pytest_collection_modifyitems")
+    def pytest_collection_pin_groups(self, config, items):
+        """--dist loadgroup: закрепить тесты за воркерами по LPT-корзинам.
+
+        Маркеры ставятся до хука воркера xdist, который дописывает группу к
+        nodeid ("nodeid@lpt0"); после него маркеры уже ни на что не влияют.
+        Поэтому хук tryfirst и видит тесты до отбора -k и -m: с таким отбором
+        корзины и шард считались бы по тестам, которые не запустятся, и тесты
+        не закрепляются - xdist раздает их как при --dist load.
+        """
+        workers = int(os.getenv("PYTEST_XDIST_WORKER_COUNT", "0"))
+        if not items or workers < 2 or config.getoption("--no-duration-order") \
+                or not loadgroup(config) or filtered(config):
+            return
+        estimates = self._estimates(items)
+        shard = self._shard(config, estimates)
+        if shard:
+            estimates = {nodeid: estimates[nodeid] for nodeid in shard[1]}
+        group_of = {nodeid: index for index, nodeids in enumerate(lpt_bins(estimates, workers))
+                    for nodeid in nodeids}
+        for item in items:
+            if item.nodeid in group_of and not any(item.iter_markers("xdist_group")):
+                item.add_marker(pytest.mark.xdist_group(f"lpt{group_of[item.nodeid]}"))
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, config, items):
+        if not items:
+            return
+        estimates = self._estimates(items)
+
+        shard = self._shard(config, estimates)
+        if shard:
+            index, selected = shard
+            deselected = [item for item in items if self._nodeid(item.nodeid) not in selected]
+            items[:] = [item for item in items if self._nodeid(item.nodeid) in selected]
+            if deselected:
+                config.hook.pytest_deselected(items=deselected)
+            self.plan.append((index, sum(estimates[self._nodeid(item.nodeid)] for item in items)))
+
+        if config.getoption("--no-duration-order"):
+            return
+        plain = {item.nodeid: self._nodeid(item.nodeid) for item in items}
+        items.sort(key=lambda item: (-estimates[plain[item.nodeid]], plain[item.nodeid]))
+
+    def pytest_runtest_logreport(self, report):
+        if self.is_worker or report.skipped:
+            return
+        nodeid = self._nodeid(report.nodeid)
+        self.measured[nodeid] = self.measured.get(nodeid, 0.0) + report.duration
+
+    def pytest_sessionfinish(self, session):
+        if self.is_worker or not self.measured or not self._in_use():
+            return
+        history = self._load()
+        for nodeid, duration in self.measured.items():
+            previous = history.get(nodeid)
+            history[nodeid] = round(duration if previous is None
+                                    else previous + SMOOTHING * (duration - previous), 3)
+        self._save(history)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        measured = self.measured if self._in_use() else {}
+        if not self.plan and not measured:
+            return
+        terminalreporter.section("duration sharding")
+        for index, planned in self.plan:
+            terminalreporter.write_line(f"shard {index}: planned ≈{planned:.1f}s by history")
+        if measured:
+            terminalreporter.write_line(
+                f"measured {len(measured)} tests, {sum(measured.values()):.1f}s total; "
+                f"history: {self.location}")
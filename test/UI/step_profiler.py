@@ -0,0 +1,278 @@
+import functools
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.wait import WebDriverWait
+
+# Категории времени внутри шага. Все, что не попало в них, - "self" (Python, разбор данных)
+WAIT, COMMAND, SLEEP = "wait", "command", "sleep"
+PRIMITIVES = (WAIT, COMMAND, SLEEP)
+
+
+class _Frame:
+    __slots__ = ("name", "started", "children", "primitives", "inclusive")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.started = time.perf_counter()
+        self.children = 0.0
+        self.primitives: Dict[str, float] = defaultdict(float)
+        # Ожидания/команды/паузы вместе с вложенными шагами - для сводки по действиям
+        self.inclusive: Dict[str, float] = defaultdict(float)
+
+
+class ActionStats:
+    """Накопленное время одного метода page object за сессию"""
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.parts: Dict[str, float] = defaultdict(float)
+
+    def add(self, elapsed: float, parts: Dict[str, float]):
+        self.calls += 1
+        self.total += elapsed
+        self.max = max(self.max, elapsed)
+        for kind, value in parts.items():
+            self.parts[kind] += value
+
+
+class StepProfiler:
+    """Профиль шагов UI-теста: стек allure.step и методов page objects.
+
+    Время каждого шага делится на ожидания (WaitEngine, WebDriverWait),
+    команды WebDriver, фиксированные паузы (step_profiler.sleep) и
+    собственное время.
+    Результат теста - collapsed stacks ("тест;шаг;метод;wait 1234", мс),
+    из которых строится flame graph.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.actions: Dict[str, ActionStats] = defaultdict(ActionStats)
+        self._patched: List[Tuple[object, str, object]] = []
+
+    # --- тест и шаги ---
+
+    def begin_test(self, name: str):
+        self._local.stack = [_Frame(name)]
+        self._local.samples = defaultdict(float)
+        self._local.in_primitive = False
+
+    def end_test(self) -> Dict[Tuple[str, ...], float]:
+        stack = getattr(self._local, "stack", None)
+        if not stack:
+            return {}
+        while len(stack) > 1:
+            self.pop()
+        self._close(stack.pop(), ())
+        samples, self._local.samples = self._local.samples, None
+        return dict(samples)
+
+    @property
+    def active(self) -> bool:
+        return bool(getattr(self._local, "stack", None))
+
+    def current_action(self) -> Optional[str]:
+        """Внешнее действие page object в стеке (CartPage.get_total_price), иначе текущий шаг"""
+        stack = getattr(self._local, "stack", None) or []
+        for frame in stack[1:]:
+            if "." in frame.name:
+                return frame.name
+        return stack[-1].name if len(stack) > 1 else None
+
+    def push(self, name: str):
+        if self.active:
+            self._local.stack.append(_Frame(name))
+
+    def pop(self):
+        stack = getattr(self._local, "stack", None)
+        if not stack or len(stack) < 2:
+            return
+        frame = stack.pop()
+        elapsed = self._close(frame, tuple(f.name for f in stack))
+        parent = stack[-1]
+        parent.children += elapsed
+        for kind, value in frame.inclusive.items():
+            parent.inclusive[kind] += value
+        if "." in frame.name:
+            with self._lock:
+                self.actions[frame.name].add(elapsed, frame.inclusive)
+
+    def _close(self, frame: _Frame, parents: Tuple[str, ...]) -> float:
+        elapsed = time.perf_counter() - frame.started
+        path = parents + (frame.name,)
+        samples = self._local.samples
+        for kind, value in frame.primitives.items():
+            samples[path + (kind,)] += value
+        own = elapsed - frame.children - sum(frame.primitives.values())
+        if own > 0:
+            samples[path] += own
+        return elapsed
+
+    @contextmanager
+    def step(self, name: str):
+        self.push(name)
+        try:
+            yield
+        finally:
+            self.pop()
+
+    @contextmanager
+    def primitive(self, kind: str):
+        """Засечь ожидание/команду/паузу; вложенные (команды внутри ожидания) не считаются"""
+        if not self.active or self._local.in_primitive:
+            yield
+            return
+        self._local.in_primitive = True
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            self._local.in_primitive = False
+            frame = self._local.stack[-1]
+            frame.primitives[kind] += elapsed
+            frame.inclusive[kind] += elapsed
+
+    # --- подключение ---
+
+    def _patch(self, owner, name: str, kind: str):
+        original = getattr(owner, name)
+        profiler = self
+
+        @functools.wraps(original)
+        def timed(*args, **kwargs):
+            with profiler.primitive(kind):
+                return original(*args, **kwargs)
+
+        self._patched.append((owner, name, original))
+        setattr(owner, name, timed)
+
+    def install(self):
+        """Перехватить команды WebDriver, явные ожидания и allure.step.
+
+        time.sleep не подменяется: паузы библиотек (ретраи urllib3, потоки пула)
+        не относятся к шагам теста. Паузы page objects - через sleep() ниже.
+        """
+        if self._patched:
+            return
+        from waits import WaitEngine
+
+        self._patch(WebDriver, "execute", COMMAND)
+        self._patch(WebDriverWait, "until", WAIT)
+        self._patch(WebDriverWait, "until_not", WAIT)
+        self._patch(WaitEngine, "_until", WAIT)
+        _register_allure_listener(self)
+
+    def uninstall(self):
+        for owner, name, original in reversed(self._patched):
+            setattr(owner, name, original)
+        self._patched.clear()
+
+    # --- отчеты ---
+
+    def summary(self, top: int = 10) -> List[str]:
+        """Самые долгие действия page objects по суммарному времени"""
+        lines = [f"{'action':<40} {'calls':>5} {'total s':>8} {'max s':>6} "
+                 f"{'wait':>6} {'command':>8} {'sleep':>6}"]
+        ranked = sorted(self.actions.items(), key=lambda item: item[1].total, reverse=True)
+        for name, stats in ranked[:top]:
+            lines.append(f"{name[-40:]:<40} {stats.calls:>5} {stats.total:>8.2f} {stats.max:>6.2f} "
+                         f"{stats.parts[WAIT]:>6.2f} {stats.parts[COMMAND]:>8.2f} "
+                         f"{stats.parts[SLEEP]:>6.2f}")
+        return lines
+
+
+def collapsed_stacks(samples: Dict[Tuple[str, ...], float]) -> str:
+    """Формат collapsed stacks (flamegraph.pl, speedscope): путь через ';' и время в мс"""
+    lines = []
+    for path, seconds in sorted(samples.items()):
+        millis = round(seconds * 1000)
+        if millis:
+            names = (name.replace(";", ",").replace(" ", "_") for name in path)
+            lines.append(f"{';'.join(names)} {millis}")
+    return "\n".join(lines)
+
+
+def breakdown(samples: Dict[Tuple[str, ...], float]) -> str:
+    """Текстовое дерево шагов с долей ожиданий, команд и пауз"""
+    totals: Dict[Tuple[str, ...], Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+    for path, seconds in samples.items():
+        kind = path[-1] if path[-1] in PRIMITIVES else "self"
+        frames = path[:-1] if kind != "self" else path
+        for depth in range(1, len(frames) + 1):
+            totals[frames[:depth]][kind] += seconds
+    lines = []
+    for path in sorted(totals):
+        parts = totals[path]
+        total = sum(parts.values())
+        detail = " ".join(f"{kind}={parts[kind]:.2f}" for kind in PRIMITIVES + ("self",) if parts[kind])
+        lines.append(f"{'  ' * (len(path) - 1)}{path[-1]}: {total:.2f}s ({detail})")
+    return "\n".join(lines)
+
+
+def sleep(seconds: float):
+    """Фиксированная пауза page object или теста: в профиле шага считается как sleep"""
+    with PROFILER.primitive(SLEEP):
+        time.sleep(seconds)
+
+
+def profile_methods(cls):
+    """Обернуть методы класса page object в шаги профиля"""
+    for name, attr in list(vars(cls).items()):
+        if name.startswith("__") or not callable(attr) or getattr(attr, "__profiled__", False):
+            continue
+        setattr(cls, name, _profiled(name, attr))
+    return cls
+
+
+def _profiled(name: str, method):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not PROFILER.active:
+            return method(self, *args, **kwargs)
+        with PROFILER.step(f"{type(self).__name__}.{name}"):
+            return method(self, *args, **kwargs)
+
+    wrapper.__profiled__ = True
+    return wrapper
+
+
+def _register_allure_listener(profiler: StepProfiler):
+    """Шаги allure.step попадают в стек профиля"""
+    try:
+        from allure_commons import hookimpl, plugin_manager
+    except ImportError:
+        return
+
+    class AllureStepListener:
+        @hookimpl
+        def start_step(self, uuid, title, params):
+            profiler.push(title)
+
+        @hookimpl
+        def stop_step(self, uuid, exc_type, exc_val, exc_tb):
+            profiler.pop()
+
+    if plugin_manager.get_plugin("step-profiler") is None:
+        plugin_manager.register(AllureStepListener(), "step-profiler")
+
+
+def attach_profile(samples: Dict[Tuple[str, ...], float], name: str = "step profile"):
+    """Приложить профиль теста к отчету Allure"""
+    import allure
+
+    allure.attach(breakdown(samples), name=name,
+                  attachment_type=allure.attachment_type.TEXT)
+    allure.attach(collapsed_stacks(samples), name=f"{name} (collapsed stacks)",
+                  attachment_type=allure.attachment_type.TEXT)
+
+
+PROFILER = StepProfiler()
@@ -0,0 +1,92 @@
+import subprocess
+import sys
+import pytest
+from selenium import webdriver
+from browser_pool import BrowserPool
+
+# Заглушка chromedriver: отвечает на команды WebDriver, которые делают пул и reset()
+FAKE_DRIVER_SERVICE = """
+import json
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+
+class Handler(BaseHTTPRequestHandler):
+    def _send(self, value):
+        body = json.dumps({"value": value}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if self.path == "/session":
+            self._send({"sessionId": "fake", "capabilities": {"browserName": "chrome"}})
+        elif self.path.endswith("/window/new"):
+            self._send({"handle": "tab", "type": "tab"})
+        else:
+            self._send(None)
+
+    def do_GET(self):
+        if self.path.endswith("/window/handles"):
+            self._send(["tab"])
+        elif self.path.endswith("/window"):
+            self._send("tab")
+        else:
+            self._send(None)
+
+    def do_DELETE(self):
+        self._send(None)
+
+    def log_message(self, *args):
+        pass
+
+
+server = HTTPServer(("127.0.0.1", 0), Handler)
+print(server.server_address[1], flush=True)
+server.serve_forever()
+"""
+
+
+@pytest.fixture
+def driver_service():
+    """Процесс заглушки chromedriver и фабрика драйверов к нему"""
+    process = subprocess.Popen([sys.executable, "-c", FAKE_DRIVER_SERVICE],
+                               stdout=subprocess.PIPE, text=True)
+    port = process.stdout.readline().strip()
+
+    def factory():
+        return webdriver.Remote(command_executor=f"http://127.0.0.1:{port}",
+                                options=webdriver.ChromeOptions())
+
+    yield process, factory
+    process.kill()
+    process.wait()
+
+
+class TestBrowserPool:
+    """Тесты пула браузеров без настоящего Chrome"""
+
+    def test_release_returns_driver_to_pool(self, driver_service):
+        _, factory = driver_service
+        pool = BrowserPool(factory, size=1)
+        driver = pool.acquire()
+        pool.release(driver)
+
+        assert pool.acquire() is driver
+        assert pool.hits == 1 and pool.crashed == 0
+
+    def test_release_after_driver_crash(self, driver_service):
+        """Упавший chromedriver: release не падает, драйвер закрывается и забывается"""
+        process, factory = driver_service
+        pool = BrowserPool(factory, size=1)
+        driver = pool.acquire()
+        process.kill()
+        process.wait()
+
+        pool.release(driver)
+
+        assert pool.crashed == 1
+        assert not pool._idle
+        assert id(driver) not in pool._uses
@@ -0,0 +1,23 @@
+import pytest
+from browser_profile import is_blocked
+
+
+class TestBlockedUrls:
+    """Тесты шаблонов блокировки ресурсов throughput-профиля"""
+
+    @pytest.mark.parametrize("url", [
+        "https://basket-01.wbbasket.ru/vol1/part1/1/images/big/1.webp",
+        "https://ir.ozone.ru/s3/multimedia/wc500/img.jpg?w=516",
+        "https://cdn.example.com/fonts/inter.woff2?v=3.19",
+        "https://static.example.com/logo.svg?",
+    ])
+    def test_static_resources_blocked(self, url):
+        assert is_blocked(url)
+
+    @pytest.mark.parametrize("url", [
+        "https://www.wildberries.ru/catalog/0/search.aspx?search=jpg",
+        "https://www.ozon.ru/api/composer-api.bx/page/json/v2?url=/search",
+        "https://static.example.com/app.js?v=png",
+    ])
+    def test_pages_and_scripts_not_blocked(self, url):
+        assert not is_blocked(url)
@@ -0,0 +1,26 @@
+import time
+import pytest
+from budget import BudgetExceeded, TimeBudget
+
+
+class TestTimeBudget:
+    """Тесты дедлайна теста"""
+
+    def test_start_excludes_setup_time(self):
+        budget = TimeBudget("test", 0.2)
+        time.sleep(0.25)
+        with pytest.raises(BudgetExceeded):
+            budget.check()
+
+        budget.start()
+
+        budget.check()
+        assert 0.15 < budget.remaining() <= 0.2
+        assert budget.used() < 0.05
+
+    def test_flow_limited_by_outer_budget(self):
+        budget = TimeBudget("test", 0.1)
+        with budget.flow("checkout", 10):
+            assert budget.remaining() <= 0.1
+            assert budget.grant(5) <= 0.1
+        assert budget.flows[0][0] == "checkout"
@@ -0,0 +1,52 @@
+import json
+import pytest
+import driver_resolver
+
+
+@pytest.fixture
+def resolver(tmp_path, monkeypatch):
+    """Резолвер с кэшем во временном каталоге; скачивание подменено"""
+    driver = tmp_path / "chromedriver"
+    driver.write_text("")
+    downloads = []
+
+    def download(version_key):
+        downloads.append(version_key)
+        return str(driver)
+
+    monkeypatch.delenv("CHROMEDRIVER_PATH", raising=False)
+    monkeypatch.setattr(driver_resolver, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(driver_resolver, "CACHE_FILE", tmp_path / "chromedriver.json")
+    monkeypatch.setattr(driver_resolver, "LOCK_FILE", tmp_path / "chromedriver.lock")
+    monkeypatch.setattr(driver_resolver, "_download", download)
+    monkeypatch.setattr(driver_resolver, "_resolved", None)
+    return downloads
+
+
+def _resolve_fresh(monkeypatch):
+    """Новый процесс: путь из памяти не используется"""
+    monkeypatch.setattr(driver_resolver, "_resolved", None)
+    return driver_resolver.resolve_chromedriver()
+
+
+class TestDriverResolver:
+    """Тесты кэша пути к chromedriver"""
+
+    def test_known_version_cached(self, resolver, monkeypatch):
+        monkeypatch.setattr(driver_resolver, "detect_chrome_version", lambda: "120")
+
+        first = _resolve_fresh(monkeypatch)
+        second = _resolve_fresh(monkeypatch)
+
+        assert first == second and resolver == ["120"]
+        assert json.loads(driver_resolver.CACHE_FILE.read_text()) == {"120": first}
+
+    def test_unknown_version_not_cached(self, resolver, monkeypatch):
+        """Без версии Chrome драйвер каждый раз подбирается заново и в кэш не пишется"""
+        monkeypatch.setattr(driver_resolver, "detect_chrome_version", lambda: None)
+
+        _resolve_fresh(monkeypatch)
+        _resolve_fresh(monkeypatch)
+
+        assert resolver == ["unknown", "unknown"]
+        assert not driver_resolver.CACHE_FILE.exists()
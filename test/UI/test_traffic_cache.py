@@ -0,0 +1,147 @@
+import http.client
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+import urllib3
+from traffic_cache import CACHE, RECORD, REPLAY, TrafficCacheProxy
+
+
+class Origin:
+    """Локальный сайт: ответы по путям и счетчик запросов, дошедших до сервера"""
+
+    def __init__(self):
+        self.responses = {}
+        self.hits = []
+        self.bodies = []
+        origin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                origin.bodies.append(self.rfile.read(length))
+                self.do_GET()
+
+            def do_GET(self):
+                origin.hits.append(self.path)
+                queue = origin.responses.get(self.path.split("?")[0], [(404, {}, b"")])
+                status, headers, body = queue.pop(0) if len(queue) > 1 else queue[0]
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def origin():
+    origin = Origin()
+    yield origin
+    origin.close()
+
+
+def _proxy(tmp_path, mode=CACHE):
+    """Прокси, который кэширует и локальный Origin: по умолчанию loopback идет мимо кэша"""
+    return TrafficCacheProxy(tmp_path, mode=mode, bypass=())
+
+
+def _get(proxy, url):
+    client = urllib3.ProxyManager(f"http://{proxy.address}", retries=False)
+    response = client.request("GET", url)
+    return response.status, response.data
+
+
+class TestTrafficCache:
+    """Тесты кэширующего прокси по plain http против локального сервера"""
+
+    def test_ok_response_replayed_from_cache(self, origin, tmp_path):
+        origin.responses["/app.js"] = [(200, {"Content-Type": "text/javascript"}, b"bundle")]
+        with _proxy(tmp_path, CACHE) as proxy:
+            proxy.begin("test")
+            first = _get(proxy, f"{origin.url}/app.js?_=1")
+            second = _get(proxy, f"{origin.url}/app.js?_=2")
+            stats = proxy.end()
+
+        assert first == second == (200, b"bundle")
+        assert origin.hits == ["/app.js?_=1"]
+        assert (stats.requests, stats.hits, stats.misses) == (2, 1, 1)
+        assert stats.bytes_saved == len(b"bundle")
+
+    @pytest.mark.parametrize("status, headers", [
+        (503, {}),
+        (429, {"Retry-After": "1"}),
+        (200, {"Cache-Control": "private, no-store"}),
+    ])
+    def test_uncacheable_response_not_stored(self, origin, tmp_path, status, headers):
+        """Временная ошибка или no-store не попадают в кэш: следующий запрос идет в сеть"""
+        origin.responses["/api"] = [(status, headers, b"first"), (200, {}, b"fresh")]
+        with _proxy(tmp_path, CACHE) as proxy:
+            assert _get(proxy, f"{origin.url}/api") == (status, b"first")
+            assert _get(proxy, f"{origin.url}/api") == (200, b"fresh")
+        assert len(origin.hits) == 2
+
+    def test_redirect_stored(self, origin, tmp_path):
+        origin.responses["/old"] = [(301, {"Location": "/new"}, b"")]
+        with _proxy(tmp_path, RECORD) as proxy:
+            _get(proxy, f"{origin.url}/old")
+        with _proxy(tmp_path, REPLAY) as proxy:
+            status, _ = _get(proxy, f"{origin.url}/old")
+        assert status == 301 and origin.hits == ["/old"]
+
+    def test_replay_miss_without_network(self, origin, tmp_path):
+        with _proxy(tmp_path, REPLAY) as proxy:
+            status, _ = _get(proxy, f"{origin.url}/missing")
+        assert status == 504 and origin.hits == []
+
+    def test_meaningful_params_keep_distinct_entries(self, origin, tmp_path):
+        """t и rand - обычные параметры: разные значения не склеиваются в один ответ"""
+        origin.responses["/feed"] = [(200, {}, b"feed")]
+        with _proxy(tmp_path) as proxy:
+            _get(proxy, f"{origin.url}/feed?t=1")
+            _get(proxy, f"{origin.url}/feed?t=2")
+            _get(proxy, f"{origin.url}/feed?t=1&cb=9")
+        assert origin.hits == ["/feed?t=1", "/feed?t=2"]
+
+    def test_loopback_not_stored(self, origin, tmp_path):
+        """Локальный сайт на случайном порту проксируется, но в хранилище не попадает"""
+        origin.responses["/index.html"] = [(200, {}, b"local")]
+        with TrafficCacheProxy(tmp_path, mode=CACHE) as proxy:
+            assert _get(proxy, f"{origin.url}/index.html") == (200, b"local")
+            assert _get(proxy, f"{origin.url}/index.html") == (200, b"local")
+            arguments = proxy.chrome_arguments()
+
+        assert len(origin.hits) == 2
+        assert not (tmp_path / "entries").exists()
+        assert "--proxy-bypass-list=127.0.0.1;[::1];localhost" in arguments
+
+    def test_chunked_upload_keeps_connection_in_sync(self, origin, tmp_path):
+        """Тело с Transfer-Encoding: chunked дочитывается, следующий запрос разбирается верно"""
+        origin.responses["/upload"] = [(200, {}, b"ok")]
+        origin.responses["/next"] = [(200, {}, b"next")]
+        with _proxy(tmp_path) as proxy:
+            host, port = proxy.address.split(":")
+            connection = http.client.HTTPConnection(host, int(port))
+            connection.request("POST", f"{origin.url}/upload", body=iter([b'{"a":', b" 1}"]),
+                               encode_chunked=True)
+            first = connection.getresponse()
+            assert (first.status, first.read()) == (200, b"ok")
+            connection.request("GET", f"{origin.url}/next")
+            second = connection.getresponse()
+            assert (second.status, second.read()) == (200, b"next")
+            connection.close()
+
+        assert origin.bodies == [b'{"a": 1}']
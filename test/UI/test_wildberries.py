@@ -1,5 +1,4 @@
 import pytest
-import time
 import logging
 from pages import *
 from selenium.webdriver.common.by import By
@@ -17,14 +16,14 @@ class TestWildberries:
     """Тесты для сайта Wildberries"""
 
     @pytest.mark.smoke
-    def test_main_page_loads(self, driver):
+    def test_main_page_loads(self, driver, wb_base_url):
         """Тест: Главная страница загружается"""
         logger.info("Тест: Загрузка главной страницы")
         with allure.step("Открыть страницу логина"):
 
             main_page = MainPage(driver).open()
 
-            assert "wildberries.ru" in driver.current_url
+            assert wb_base_url in driver.current_url
             assert "Wildberries" in driver.title
             logger.info("✓ Главная страница загружена успешно")
 
@@ -35,7 +34,6 @@ class TestWildberries:
         with allure.step("Поиск товара"):
             main_page = MainPage(driver).open()
             search_page = main_page.search_product(test_data["search_query"])
-            time.sleep(2)
 
             # Проверяем результаты поиска
             product_count = search_page.get_product_count()
@@ -58,7 +56,6 @@ class TestWildberries:
 
             main_page = MainPage(driver).open()
             search_page = main_page.search_product(test_data["search_query"])
-            time.sleep(2)
 
             # Добавляем первый товар в корзину
             added = search_page.add_to_cart_from_list(0)
@@ -66,7 +63,6 @@ class TestWildberries:
 
             # Переходим в корзину
             cart_page = search_page.open_cart()
-            time.sleep(2)
 
             # Проверяем, что товар в корзине
             items_count = cart_page.get_items_count()
@@ -84,11 +80,9 @@ class TestWildberries:
 
             main_page = MainPage(driver).open()
             search_page = main_page.search_product(test_data["search_query"])
-            time.sleep(2)
 
             # Открываем страницу товара
             product_page = search_page.open_first_product()
-            time.sleep(2)
 
             # Получаем информацию о товаре
             product_info = product_page.get_product_info()
@@ -104,7 +98,6 @@ class TestWildberries:
 
             # Переходим в корзину
             cart_page = product_page.go_to_cart()
-            time.sleep(2)
 
             # Проверяем корзину
             items_count = cart_page.get_items_count()
@@ -124,22 +117,18 @@ class TestWildberries:
             # Сначала добавляем товар в корзину
             main_page = MainPage(driver).open()
             search_page = main_page.search_product(test_data["search_query"])
-            time.sleep(2)
 
             search_page.add_to_cart_from_list(0)
             cart_page = search_page.open_cart()
-            time.sleep(2)
 
             initial_count = cart_page.get_items_count()
             logger.info(f"Товаров в корзине изначально: {initial_count}")
 
             # Изменяем количество
             cart_page.change_quantity(0, increase=True)
-            time.sleep(1)
 
             # Удаляем товар
             cart_page.remove_item(0)
-            time.sleep(2)
 
             final_count = cart_page.get_items_count()
             logger.info(f"Товаров в корзине после удаления: {final_count}")
@@ -156,15 +145,12 @@ class TestWildberries:
             # Добавляем товар в корзину
             main_page = MainPage(driver).open()
             search_page = main_page.search_product(test_data["search_query"])
-            time.sleep(2)
 
             search_page.add_to_cart_from_list(0)
             cart_page = search_page.open_cart()
-            time.sleep(2)
 
             # Переходим к оформлению
             checkout_page = cart_page.proceed_to_checkout()
-            time.sleep(3)
 
             # Проверяем, что страница оформления загружена
             is_loaded = checkout_page.is_checkout_page_loaded()
@@ -186,7 +172,6 @@ class TestWildberries:
 
             # Шаг 2: Поиск товара
             search_page = main_page.search_product(test_data["search_query"])
-            time.sleep(2)
 
             product_count = search_page.get_product_count()
             if product_count == 0:
@@ -197,7 +182,6 @@ class TestWildberries:
 
             # Шаг 3: Открыть страницу товара
             product_page = search_page.open_first_product()
-            time.sleep(2)
 
             product_info = product_page.get_product_info()
             logger.info(f"Шаг 3: Открыт товар: {product_info['title'][:30]}...")
@@ -209,7 +193,6 @@ class TestWildberries:
 
             # Шаг 5: Перейти в корзину
             cart_page = product_page.go_to_cart()
-            time.sleep(2)
 
             items_count = cart_page.get_items_count()
             total_price = cart_page.get_total_price()
@@ -219,7 +202,6 @@ class TestWildberries:
 
             # Шаг 6: Перейти к оформлению
             checkout_page = cart_page.proceed_to_checkout()
-            time.sleep(3)
 
             is_loaded = checkout_page.is_checkout_page_loaded()
             assert is_loaded, "Не удалось перейти к оформлению"
@@ -228,19 +210,18 @@ class TestWildberries:
             logger.info("✓ E2E тест завершен успешно")
 
     @pytest.mark.auth
-    def test_auth_modal(self, driver, test_data):
+    def test_auth_modal(self, driver, test_data, wb_base_url):
         """Тест: Открытие модального окна авторизации"""
         logger.info("Тест: Модальное окно авторизации")
         with allure.step("Модальное окно авторизации"):
 
             main_page = MainPage(driver).open()
             auth_page = main_page.click_login()
-            time.sleep(2)
 
             # Проверяем, что появилось поле для ввода телефона
             try:
                 # В демо-режиме просто проверяем URL
-                assert "wildberries.ru" in driver.current_url
+                assert wb_base_url in driver.current_url
                 logger.info("✓ Модальное окно авторизации открыто")
             except:
                 logger.warning("Не удалось открыть модальное окно авторизации")
@@ -257,7 +238,6 @@ class TestWildberries:
 
         main_page = MainPage(driver).open()
         search_page = main_page.search_product(search_query)
-        time.sleep(2)
 
         product_count = search_page.get_product_count()
         logger.info(f"Найдено товаров: {product_count}")
@@ -275,7 +255,6 @@ class TestWildberries:
 
             main_page = MainPage(driver).open()
             cart_page = main_page.open_cart()
-            time.sleep(2)
 
             # Проверяем, что открылась страница корзины
             assert "cart" in driver.current_url or "basket" in driver.current_url
@@ -292,20 +271,23 @@ def test_quick_check():
     """Быстрая проверка работы"""
     from selenium import webdriver
     from selenium.webdriver.chrome.service import Service
-    from webdriver_manager.chrome import ChromeDriverManager
+    from driver_resolver import resolve_chromedriver
+    from waits import WaitEngine
 
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()))
+    driver = webdriver.Chrome(service=Service(resolve_chromedriver()))
     try:
+        waits = WaitEngine(driver)
         driver.get("https://www.wildberries.ru")
-        time.sleep(3)
+        waits.settle(replaces=3)
         print(f"Title: {driver.title}")
         print(f"URL: {driver.current_url}")
 
         # Быстрый поиск
         search_input = driver.find_element(By.ID, "searchInput")
         search_input.send_keys("кроссовки")
+        old_url = driver.current_url
         search_input.submit()
-        time.sleep(3)
+        waits.url_changes(old_url, replaces=3)
 
         print(f"После поиска: {driver.current_url}")
 
@@ -0,0 +1,409 @@
+import datetime
+import hashlib
+import ipaddress
+import json
+import logging
+import os
+import ssl
+import tempfile
+import threading
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import urllib3
+
+try:
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+except ImportError:  # без cryptography работает только http://
+    x509 = None
+
+logger = logging.getLogger(__name__)
+
+# record - всегда из сети с сохранением, replay - только из кэша без сети,
+# cache - из кэша, а промахи из сети с сохранением
+RECORD, REPLAY, CACHE = "record", "replay", "cache"
+MODES = (RECORD, REPLAY, CACHE)
+
+# Параметры-антикэш, которые не влияют на ответ: не участвуют в ключе.
+# Только однозначные: t, ts или rand на реальных сайтах бывают значимыми
+VOLATILE_PARAMS = frozenset({"_", "cb", "nocache"})
+
+# Хосты мимо кэша: локальные сайты слушают случайный порт, и ключ по нему
+# промахивался бы в каждом прогоне, засоряя хранилище
+BYPASS_HOSTS = ("localhost", "127.0.0.1", "::1")
+
+HOP_BY_HOP = frozenset({
+    "connection", "keep-alive", "proxy-authenticate", "proxy-authorization", "proxy-connection",
+    "te", "trailer", "transfer-encoding", "upgrade",
+})
+
+
+# Сохраняются только успешные ответы и редиректы: 503 или 429 иначе воспроизводился бы вечно
+CACHEABLE_STATUSES = frozenset(range(200, 300)) | {301, 302, 303, 307, 308}
+
+
+def cacheable(status: int, headers: List[Tuple[str, str]]) -> bool:
+    """Можно ли сохранить ответ: успешный или редирект, без Cache-Control: no-store"""
+    if status not in CACHEABLE_STATUSES:
+        return False
+    return not any(name.lower() == "cache-control" and "no-store" in value.lower()
+                   for name, value in headers)
+
+
+def request_key(method: str, url: str, body: bytes = b"",
+                volatile: Iterable[str] = VOLATILE_PARAMS) -> str:
+    """Ключ запроса: метод, URL без антикэш-параметров с отсортированным query, хэш тела"""
+    parts = urlsplit(url)
+    volatile = frozenset(volatile)
+    query = sorted((name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+                   if name not in volatile)
+    normalized = urlunsplit((parts.scheme, parts.netloc.lower(), parts.path, urlencode(query), ""))
+    digest = hashlib.sha256(body).hexdigest() if body else ""
+    return hashlib.sha256(f"{method} {normalized} {digest}".encode("utf-8")).hexdigest()
+
+
+class ContentStore:
+    """Хранилище ответов на диске с адресацией по содержимому.
+
+    objects/ - тела ответов, имя файла - sha256 тела: одинаковые бандлы и
+    картинки с разных URL хранятся один раз. entries/ - заголовки ответа на
+    ключ запроса. Запись атомарная, поэтому воркеры xdist могут делить каталог.
+    """
+
+    def __init__(self, root):
+        self.root = Path(root)
+
+    def _entry_path(self, key: str) -> Path:
+        return self.root / "entries" / key[:2] / f"{key}.json"
+
+    def _object_path(self, digest: str) -> Path:
+        return self.root / "objects" / digest[:2] / digest
+
+    @staticmethod
+    def _write(path: Path, data: bytes):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as out:
+            out.write(data)
+        os.replace(tmp_path, path)
+
+    def get(self, key: str) -> Optional[Tuple[dict, bytes]]:
+        try:
+            entry = json.loads(self._entry_path(key).read_text(encoding="utf-8"))
+            return entry, self._object_path(entry["body"]).read_bytes()
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def put(self, key: str, url: str, status: int, reason: str,
+            headers: List[Tuple[str, str]], body: bytes):
+        digest = hashlib.sha256(body).hexdigest()
+        if not self._object_path(digest).exists():
+            self._write(self._object_path(digest), body)
+        entry = {"url": url, "status": status, "reason": reason, "headers": headers,
+                 "body": digest, "size": len(body)}
+        self._write(self._entry_path(key), json.dumps(entry, ensure_ascii=False).encode("utf-8"))
+
+
+@dataclass
+class TrafficStats:
+    """Запросы браузера через прокси за один тест"""
+    test: str
+    requests: int = 0
+    hits: int = 0
+    misses: int = 0
+    errors: int = 0
+    bytes_saved: int = 0
+    bytes_fetched: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        return self.hits / self.requests if self.requests else 0.0
+
+
+class CertificateAuthority:
+    """Корневой сертификат сессии и сертификаты хостов для перехвата HTTPS.
+
+    Chrome запускается с acceptInsecureCerts, поэтому импортировать
+    ca.pem в систему не нужно.
+    """
+
+    def __init__(self, directory: Path):
+        if x509 is None:
+            raise RuntimeError("Для перехвата HTTPS нужен пакет cryptography")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._contexts: Dict[str, ssl.SSLContext] = {}
+        self.key = ec.generate_private_key(ec.SECP256R1())
+        name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "UI traffic cache CA")])
+        self.cert = (self._builder(name, self.key.public_key())
+                     .issuer_name(name)
+                     .add_extension(x509.BasicConstraints(ca=True, path_length=0), critical=True)
+                     .sign(self.key, hashes.SHA256()))
+        self.ca_path = self.directory / "ca.pem"
+        self.ca_path.write_bytes(self.cert.public_bytes(serialization.Encoding.PEM))
+
+    @staticmethod
+    def _builder(subject, public_key):
+        now = datetime.datetime.now(datetime.timezone.utc)
+        return (x509.CertificateBuilder()
+                .subject_name(subject)
+                .public_key(public_key)
+                .serial_number(x509.random_serial_number())
+                .not_valid_before(now - datetime.timedelta(days=1))
+                .not_valid_after(now + datetime.timedelta(days=30)))
+
+    def context_for(self, host: str) -> ssl.SSLContext:
+        with self._lock:
+            context = self._contexts.get(host)
+            if context is None:
+                context = self._contexts[host] = self._make_context(host)
+            return context
+
+    def _make_context(self, host: str) -> ssl.SSLContext:
+        try:
+            alt_name = x509.IPAddress(ipaddress.ip_address(host))
+        except ValueError:
+            alt_name = x509.DNSName(host)
+        key = ec.generate_private_key(ec.SECP256R1())
+        cert = (self._builder(x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, host[:64])]),
+                              key.public_key())
+                .issuer_name(self.cert.subject)
+                .add_extension(x509.SubjectAlternativeName([alt_name]), critical=False)
+                .sign(self.key, hashes.SHA256()))
+        path = self.directory / f"{hashlib.sha1(host.encode('utf-8')).hexdigest()}.pem"
+        path.write_bytes(
+            key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8,
+                              serialization.NoEncryption())
+            + cert.public_bytes(serialization.Encoding.PEM)
+            + self.cert.public_bytes(serialization.Encoding.PEM))
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(path)
+        context.set_alpn_protocols(["http/1.1"])
+        return context
+
+
+class TrafficCacheProxy:
+    """HTTP(S)-прокси для Chrome с записью и воспроизведением ответов.
+
+    HTTPS перехватывается через CONNECT: прокси сам завершает TLS сертификатом
+    хоста и видит запросы целиком. Статистика копится по текущему тесту,
+    поэтому один прокси обслуживает браузеры одного воркера последовательно.
+    volatile_params - параметры query, не входящие в ключ; bypass - хосты,
+    которые браузер не шлет через прокси, а прокси не сохраняет.
+    """
+
+    def __init__(self, store_dir, mode: str = CACHE, host: str = "127.0.0.1", port: int = 0,
+                 volatile_params: Iterable[str] = VOLATILE_PARAMS,
+                 bypass: Iterable[str] = BYPASS_HOSTS):
+        if mode not in MODES:
+            raise ValueError(f"Неизвестный режим кэша трафика: {mode}")
+        self.store = ContentStore(store_dir)
+        self.mode = mode
+        self.volatile_params = frozenset(volatile_params)
+        self.bypass = frozenset(bypass)
+        self.network = urllib3.PoolManager(
+            maxsize=16, retries=False, timeout=urllib3.Timeout(connect=10, read=30))
+        self._certs_dir = tempfile.TemporaryDirectory(prefix="traffic-cache-")
+        self._authority: Optional[CertificateAuthority] = None
+        self._lock = threading.Lock()
+        self.current = TrafficStats(test="(no test)")
+        self.server = ThreadingHTTPServer((host, port), self._make_handler())
+        self.server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"{host}:{port}"
+
+    @property
+    def authority(self) -> CertificateAuthority:
+        with self._lock:
+            if self._authority is None:
+                self._authority = CertificateAuthority(Path(self._certs_dir.name))
+            return self._authority
+
+    def start(self) -> "TrafficCacheProxy":
+        self._thread = threading.Thread(target=self.server.serve_forever,
+                                        name="traffic-cache", daemon=True)
+        self._thread.start()
+        logger.info(f"Кэш трафика ({self.mode}) слушает {self.address}, каталог {self.store.root}")
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+        self.network.clear()
+        self._certs_dir.cleanup()
+
+    def __enter__(self) -> "TrafficCacheProxy":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def chrome_arguments(self) -> List[str]:
+        """Аргументы Chrome: весь трафик, кроме хостов из bypass, идет через прокси"""
+        arguments = [f"--proxy-server=http://{self.address}"]
+        if self.bypass:
+            hosts = sorted(f"[{host}]" if ":" in host else host for host in self.bypass)
+            arguments.append("--proxy-bypass-list=" + ";".join(hosts))
+        return arguments
+
+    # --- статистика по тестам ---
+
+    def begin(self, test: str):
+        with self._lock:
+            self.current = TrafficStats(test=test)
+
+    def end(self) -> TrafficStats:
+        with self._lock:
+            stats, self.current = self.current, TrafficStats(test="(no test)")
+        return stats
+
+    def _count(self, hit: bool = False, error: bool = False, saved: int = 0, fetched: int = 0):
+        with self._lock:
+            stats = self.current
+            stats.requests += 1
+            stats.hits += hit
+            stats.misses += not hit and not error
+            stats.errors += error
+            stats.bytes_saved += saved
+            stats.bytes_fetched += fetched
+
+    # --- обработка запроса ---
+
+    def respond(self, method: str, url: str, headers: List[Tuple[str, str]],
+                body: bytes) -> Tuple[int, str, List[Tuple[str, str]], bytes]:
+        key = request_key(method, url, body, self.volatile_params)
+        # Запрос к хосту из bypass (клиент не учел список) проксируется без кэша
+        bypassed = urlsplit(url).hostname in self.bypass
+        if self.mode != RECORD and not bypassed:
+            cached = self.store.get(key)
+            if cached is not None:
+                entry, content = cached
+                self._count(hit=True, saved=len(content))
+                return entry["status"], entry["reason"], entry["headers"], content
+            if self.mode == REPLAY:
+                self._count()
+                logger.debug(f"кэш трафика: нет ответа на {method} {url}")
+                return 504, "Not In Cache", [("Content-Type", "text/plain")], b"not in cache"
+
+        forwarded = {name: value for name, value in headers
+                     if name.lower() not in HOP_BY_HOP}
+        try:
+            response = self.network.request(method, url, body=body or None, headers=forwarded,
+                                            redirect=False, preload_content=True,
+                                            decode_content=False)
+        except urllib3.exceptions.HTTPError as e:
+            self._count(error=True)
+            logger.debug(f"кэш трафика: {method} {url} - {e}")
+            return 502, "Bad Gateway", [("Content-Type", "text/plain")], str(e).encode("utf-8")
+
+        response_headers = [(name, value) for name, value in response.headers.items()
+                            if name.lower() not in HOP_BY_HOP and name.lower() != "content-length"]
+        content = response.data
+        if not bypassed and cacheable(response.status, response_headers):
+            self.store.put(key, url, response.status, response.reason or "", response_headers,
+                           content)
+        self._count(fetched=len(content))
+        return response.status, response.reason or "", response_headers, content
+
+    def _make_handler(self):
+        proxy = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+            # Схема и хост туннеля после CONNECT: запросы внутри приходят с путем без хоста
+            tunnel: Optional[str] = None
+
+            def do_CONNECT(self):
+                host = self.path.rsplit(":", 1)[0].strip("[]")
+                try:
+                    context = proxy.authority.context_for(host)
+                except RuntimeError as e:
+                    self.send_error(501, str(e))
+                    return
+                self.send_response(200, "Connection Established")
+                self.end_headers()
+                self.wfile.flush()
+                try:
+                    self.connection = context.wrap_socket(self.connection, server_side=True)
+                except (ssl.SSLError, OSError) as e:
+                    logger.debug(f"кэш трафика: TLS с браузером для {host} - {e}")
+                    self.close_connection = True
+                    return
+                self.rfile = self.connection.makefile("rb", self.rbufsize)
+                self.wfile = self.connection.makefile("wb")
+                self.tunnel = "https://" + (self.path[:-4] if self.path.endswith(":443") else self.path)
+                self.close_connection = False
+
+            def _proxy(self):
+                url = self.tunnel + self.path if self.tunnel else self.path
+                try:
+                    body = self._read_body()
+                except ValueError:
+                    # Тело не дочитано: следующий запрос в этом соединении разобрался бы неверно
+                    self.close_connection = True
+                    self.send_error(400, "Malformed chunked body")
+                    return
+                status, reason, headers, content = proxy.respond(
+                    self.command, url, list(self.headers.items()), body)
+                self.send_response(status, reason)
+                for name, value in headers:
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                if self.command != "HEAD":
+                    self.wfile.write(content)
+
+            def _read_body(self) -> bytes:
+                """Тело запроса: по Content-Length или из чанков Transfer-Encoding: chunked"""
+                if "chunked" not in self.headers.get("Transfer-Encoding", "").lower():
+                    length = int(self.headers.get("Content-Length") or 0)
+                    return self.rfile.read(length) if length else b""
+                parts = []
+                while True:
+                    size = int(self.rfile.readline().split(b";")[0].strip(), 16)
+                    if size == 0:
+                        # Трейлеры до пустой строки
+                        while self.rfile.readline() not in (b"\r\n", b"\n", b""):
+                            pass
+                        return b"".join(parts)
+                    parts.append(self.rfile.read(size))
+                    self.rfile.readline()
+
+            do_GET = do_POST = do_PUT = do_DELETE = do_PATCH = do_HEAD = do_OPTIONS = _proxy
+
+            def log_message(self, format, *args):
+                logger.debug("кэш трафика: " + format % args)
+
+        return Handler
+
+
+def format_traffic(stats: List[TrafficStats], mode: str) -> List[str]:
+    """Таблица попаданий в кэш и сэкономленного трафика по тестам"""
+    mb = 1024 * 1024
+    lines = [f"mode: {mode}",
+             f"{'test':<60} {'reqs':>5} {'hit, %':>7} {'saved, MB':>10} {'fetched, MB':>12}"]
+    for item in sorted(stats, key=lambda s: s.bytes_saved + s.bytes_fetched, reverse=True):
+        lines.append(f"{item.test[-60:]:<60} {item.requests:>5} {item.hit_ratio * 100:>7.0f} "
+                     f"{item.bytes_saved / mb:>10.2f} {item.bytes_fetched / mb:>12.2f}")
+    requests_total = sum(s.requests for s in stats)
+    hits = sum(s.hits for s in stats)
+    lines.append(f"total: {requests_total} requests, hit ratio "
+                 f"{hits / requests_total * 100 if requests_total else 0:.0f}%, "
+                 f"saved {sum(s.bytes_saved for s in stats) / mb:.2f} MB, "
+                 f"fetched {sum(s.bytes_fetched for s in stats) / mb:.2f} MB, "
+                 f"errors {sum(s.errors for s in stats)}")
+    return lines
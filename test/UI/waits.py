@@ -0,0 +1,190 @@
+import logging
+import threading
+import time
+
+from selenium.common.exceptions import WebDriverException, StaleElementReferenceException
+
+from budget import current_budget
+from step_profiler import PROFILER
+
+logger = logging.getLogger(__name__)
+
+# Скрипт-зонд: ставит MutationObserver и счетчик активных fetch/XHR один раз на документ
+# и возвращает текущее состояние страницы
+PROBE_SCRIPT = """
+if (!window.__waitProbe) {
+    var probe = window.__waitProbe = {lastMutation: performance.now(), pending: 0};
+    try {
+        new MutationObserver(function () { probe.lastMutation = performance.now(); })
+            .observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+    } catch (e) {}
+    if (window.fetch) {
+        var origFetch = window.fetch;
+        window.fetch = function () {
+            probe.pending++;
+            return origFetch.apply(this, arguments).finally(function () { probe.pending--; });
+        };
+    }
+    var origSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        probe.pending++;
+        this.addEventListener('loadend', function () { probe.pending--; }, {once: true});
+        return origSend.apply(this, arguments);
+    };
+}
+var entries = performance.getEntriesByType('resource');
+var lastResponse = 0;
+for (var i = 0; i < entries.length; i++) {
+    if (entries[i].responseEnd > lastResponse) { lastResponse = entries[i].responseEnd; }
+}
+var now = performance.now();
+return {
+    ready: document.readyState,
+    quietFor: now - window.__waitProbe.lastMutation,
+    pending: Math.max(window.__waitProbe.pending, 0),
+    resources: entries.length,
+    networkQuietFor: now - lastResponse
+};
+"""
+
+RECT_SCRIPT = """
+var r = arguments[0].getBoundingClientRect();
+return [r.x, r.y, r.width, r.height];
+"""
+
+
+class WaitStats:
+    """Сколько времени ушло на ожидания и сколько сэкономлено против фиксированных пауз"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.waited = 0.0
+        self.replaced = 0.0
+        self.timeouts = 0
+
+    def record(self, elapsed: float, replaces: float, timed_out: bool):
+        with self._lock:
+            self.calls += 1
+            self.waited += elapsed
+            self.replaced += replaces
+            if timed_out:
+                self.timeouts += 1
+
+    @property
+    def saved(self) -> float:
+        return max(0.0, self.replaced - self.waited)
+
+    def summary(self) -> str:
+        return (f"wait engine: waits={self.calls} waited={self.waited:.1f}s "
+                f"fixed sleeps={self.replaced:.1f}s saved={self.saved:.1f}s "
+                f"capped={self.timeouts}")
+
+
+WAIT_STATS = WaitStats()
+
+
+class WaitEngine:
+    """Ожидания по реальным сигналам готовности вместо time.sleep.
+
+    Параметр replaces - длительность фиксированной паузы, которую заменяет ожидание.
+    Она же служит верхней границей, так что ожидание никогда не длиннее старой паузы.
+    """
+
+    def __init__(self, driver, poll: float = 0.05, quiet_ms: int = 300):
+        self.driver = driver
+        self.poll = poll
+        self.quiet_ms = quiet_ms
+
+    def _probe(self):
+        try:
+            return self.driver.execute_script(PROBE_SCRIPT)
+        except WebDriverException:
+            # Документ в процессе навигации
+            return None
+
+    def _until(self, condition, timeout: float, replaces: float, name: str,
+               record: bool = True) -> bool:
+        budget = current_budget()
+        requested, timeout = timeout, budget.grant(timeout)
+        started = time.perf_counter()
+        deadline = started + timeout
+        done = False
+        while True:
+            try:
+                done = bool(condition())
+            except WebDriverException:
+                done = False
+            if done or time.perf_counter() >= deadline:
+                break
+            time.sleep(self.poll)
+        elapsed = time.perf_counter() - started
+        budget.record(PROFILER.current_action(), requested, timeout, elapsed, done)
+        if record:
+            WAIT_STATS.record(elapsed, replaces, timed_out=not done)
+        logger.debug(f"wait {name}: {elapsed:.2f}s (fixed sleep {replaces:.2f}s, ok={done})")
+        return done
+
+    def _page_idle(self, quiet_ms: int) -> bool:
+        state = self._probe()
+        return (state is not None
+                and state["ready"] == "complete"
+                and state["pending"] == 0
+                and state["networkQuietFor"] >= quiet_ms
+                and state["quietFor"] >= quiet_ms)
+
+    def dom_quiet(self, replaces: float, quiet_ms: int = None) -> bool:
+        """Ждать, пока DOM не перестанет меняться quiet_ms миллисекунд"""
+        quiet_ms = quiet_ms or self.quiet_ms
+
+        def _quiet():
+            state = self._probe()
+            return state is not None and state["quietFor"] >= quiet_ms
+
+        return self._until(_quiet, replaces, replaces, "dom_quiet")
+
+    def network_idle(self, replaces: float, quiet_ms: int = None) -> bool:
+        """Ждать, пока нет активных fetch/XHR и новых ресурсов quiet_ms миллисекунд"""
+        quiet_ms = quiet_ms or self.quiet_ms
+
+        def _idle():
+            state = self._probe()
+            return (state is not None and state["pending"] == 0
+                    and state["networkQuietFor"] >= quiet_ms)
+
+        return self._until(_idle, replaces, replaces, "network_idle")
+
+    def settle(self, replaces: float, quiet_ms: int = None) -> bool:
+        """Ждать загрузки документа, тишины в сети и в DOM"""
+        quiet_ms = quiet_ms or self.quiet_ms
+        return self._until(lambda: self._page_idle(quiet_ms), replaces, replaces, "settle")
+
+    def element_stable(self, element, replaces: float, stable_ms: int = 100) -> bool:
+        """Ждать, пока элемент перестанет двигаться (скролл, анимация)"""
+        last = {"rect": None, "since": time.perf_counter()}
+
+        def _stable():
+            try:
+                rect = self.driver.execute_script(RECT_SCRIPT, element)
+            except StaleElementReferenceException:
+                return True
+            now = time.perf_counter()
+            if rect != last["rect"]:
+                last["rect"], last["since"] = rect, now
+                return False
+            return (now - last["since"]) * 1000 >= stable_ms
+
+        return self._until(_stable, replaces, replaces, "element_stable")
+
+    def url_changes(self, old_url: str, replaces: float) -> bool:
+        """Ждать смены URL и затем готовности новой страницы"""
+        started = time.perf_counter()
+        changed = self._until(lambda: self.driver.current_url != old_url,
+                              replaces, replaces, "url_changes", record=False)
+        idle = False
+        remaining = replaces - (time.perf_counter() - started)
+        if changed and remaining > 0:
+            idle = self._until(lambda: self._page_idle(self.quiet_ms),
+                               remaining, remaining, "settle", record=False)
+        WAIT_STATS.record(time.perf_counter() - started, replaces, timed_out=not idle)
+        return changed